@@ -0,0 +1,50 @@
+"""Add odds api quota ledger
+
+Revision ID: b37f0c9e5a12
+Revises: 9d2e4b7a1c30
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b37f0c9e5a12"
+down_revision: Union[str, Sequence[str], None] = "9d2e4b7a1c30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "odds_api_quota_ledger",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("api_key_hash", sa.String(length=64), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("request_count", sa.Integer(), nullable=False),
+        sa.Column("credits_spent", sa.Integer(), nullable=False),
+        sa.Column("requests_used", sa.Integer(), nullable=True),
+        sa.Column("requests_remaining", sa.Integer(), nullable=True),
+        sa.Column("last_seen_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("api_key_hash", "day", name="uq_odds_api_quota_ledger_key_day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("odds_api_quota_ledger")
@@ -0,0 +1,28 @@
+"""Add source hash columns to games and team game stats
+
+Revision ID: c5d1e7a3f920
+Revises: b37f0c9e5a12
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d1e7a3f920"
+down_revision: Union[str, Sequence[str], None] = "b37f0c9e5a12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("games", sa.Column("source_hash", sa.String(length=64), nullable=True))
+    op.add_column("team_game_stats", sa.Column("source_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("team_game_stats", "source_hash")
+    op.drop_column("games", "source_hash")
@@ -0,0 +1,61 @@
+"""Add game ingest statuses
+
+Revision ID: d8a4c2e6b915
+Revises: c5d1e7a3f920
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a4c2e6b915"
+down_revision: Union[str, Sequence[str], None] = "c5d1e7a3f920"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ingest_status_enum = sa.Enum("PENDING", "OK", "FAILED", name="ingeststatusenum")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "game_ingest_statuses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("stage", sa.String(length=64), nullable=False),
+        sa.Column("status", ingest_status_enum, nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("last_attempt_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("game_id", "stage", name="uq_game_ingest_statuses_game_stage"),
+    )
+    op.create_index(
+        "ix_game_ingest_statuses_stage_status",
+        "game_ingest_statuses",
+        ["stage", "status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_game_ingest_statuses_stage_status", table_name="game_ingest_statuses")
+    op.drop_table("game_ingest_statuses")
+    ingest_status_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,106 @@
+"""Store ingested payload bodies once, keyed by content hash
+
+Revision ID: e3b9f1a7c204
+Revises: d8a4c2e6b915
+Create Date: 2026-10-17
+
+"""
+
+import hashlib
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b9f1a7c204"
+down_revision: Union[str, Sequence[str], None] = "d8a4c2e6b915"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH = 1000
+
+_JSON = sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql")
+
+
+def _content_hash(value: object) -> str:
+    # Frozen copy of odds_value.core.json_codec.content_hash.
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.create_table(
+        "payload_bodies",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("payload_json", _JSON, nullable=False),
+        sa.PrimaryKeyConstraint("content_hash", name="pk_payload_bodies"),
+    )
+    op.add_column(
+        "ingested_payloads", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+
+    bind = op.get_bind()
+    payloads = sa.table(
+        "ingested_payloads",
+        sa.column("id", sa.Integer),
+        sa.column("payload_json", _JSON),
+        sa.column("content_hash", sa.String),
+    )
+    bodies = sa.table(
+        "payload_bodies",
+        sa.column("content_hash", sa.String),
+        sa.column("payload_json", _JSON),
+    )
+    insert = postgresql.insert if bind.dialect.name == "postgresql" else sqlite.insert
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(payloads.c.id, payloads.c.payload_json)
+            .where(payloads.c.id > last_id)
+            .order_by(payloads.c.id)
+            .limit(_BATCH)
+        ).all()
+        if not rows:
+            break
+        hashes = {row.id: _content_hash(row.payload_json) for row in rows}
+        body_by_hash = {hashes[row.id]: row.payload_json for row in rows}
+        bind.execute(
+            insert(bodies)
+            .values([{"content_hash": h, "payload_json": p} for h, p in body_by_hash.items()])
+            .on_conflict_do_nothing(index_elements=["content_hash"])
+        )
+        bind.execute(
+            sa.update(payloads)
+            .where(payloads.c.id == sa.bindparam("row_id"))
+            .values(content_hash=sa.bindparam("row_hash")),
+            [{"row_id": id_, "row_hash": h} for id_, h in hashes.items()],
+        )
+        last_id = rows[-1].id
+
+    with op.batch_alter_table("ingested_payloads") as batch:
+        batch.alter_column("content_hash", existing_type=sa.String(length=64), nullable=False)
+        batch.create_foreign_key(
+            "fk_ingested_payloads_content_hash",
+            "payload_bodies",
+            ["content_hash"],
+            ["content_hash"],
+        )
+        batch.drop_column("payload_json")
+
+
+def downgrade() -> None:
+    op.add_column("ingested_payloads", sa.Column("payload_json", _JSON, nullable=True))
+    op.execute(
+        "UPDATE ingested_payloads SET payload_json = ("
+        "SELECT b.payload_json FROM payload_bodies AS b "
+        "WHERE b.content_hash = ingested_payloads.content_hash)"
+    )
+    with op.batch_alter_table("ingested_payloads") as batch:
+        batch.alter_column("payload_json", existing_type=_JSON, nullable=False)
+        batch.drop_constraint("fk_ingested_payloads_content_hash", type_="foreignkey")
+        batch.drop_column("content_hash")
+    op.drop_table("payload_bodies")
@@ -0,0 +1,39 @@
+"""Add compressed payload columns
+
+Revision ID: f6a2d8c4b317
+Revises: e3b9f1a7c204
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a2d8c4b317"
+down_revision: Union[str, Sequence[str], None] = "e3b9f1a7c204"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_JSON = sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql")
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("payload_bodies") as batch:
+        batch.add_column(sa.Column("payload_compressed", sa.LargeBinary(), nullable=True))
+        batch.alter_column("payload_json", existing_type=_JSON, nullable=True)
+    op.add_column(
+        "football_team_game_stats",
+        sa.Column("stats_compressed", sa.LargeBinary(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    # Restoring NOT NULL fails while compressed-only bodies exist, rather than dropping them.
+    with op.batch_alter_table("payload_bodies") as batch:
+        batch.alter_column("payload_json", existing_type=_JSON, nullable=False)
+        batch.drop_column("payload_compressed")
+    op.drop_column("football_team_game_stats", "stats_compressed")
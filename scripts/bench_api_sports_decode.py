@@ -0,0 +1,90 @@
+"""Time JSON parsing vs typed decoding of an API-Sports response body.
+
+    python scripts/bench_api_sports_decode.py [BODY.json] [--endpoint games|team-stats]
+
+Without a body file a synthetic 5000-item `/games` response is used. Not part of the
+package or the test suite; run it by hand when touching `api_sports/schemas.py`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from odds_value.core.json_codec import default_json_decoder, default_json_encoder, json_backend
+from odds_value.ingestion.providers.api_sports.schemas import (
+    ItemDecoder,
+    SchemaDriftRegistry,
+    games_decoder,
+    team_stats_decoder,
+)
+
+DECODERS: dict[str, ItemDecoder[Any]] = {"games": games_decoder, "team-stats": team_stats_decoder}
+
+
+def synthetic_games_body(n: int) -> bytes:
+    item: dict[str, Any] = {
+        "game": {
+            "id": 0,
+            "stage": "Regular Season",
+            "week": "Week 1",
+            "date": {"timezone": "UTC", "date": "2025-09-05", "time": "00:20", "timestamp": 1},
+            "venue": {"name": "Lincoln Financial Field", "city": "Philadelphia"},
+            "status": {"short": "FT", "long": "Finished", "timer": None},
+        },
+        "league": {"id": 1, "name": "NFL", "season": "2025", "logo": "https://x/1.png"},
+        "teams": {
+            "home": {"id": 12, "name": "Philadelphia Eagles", "logo": "https://x/12.png"},
+            "away": {"id": 10, "name": "Dallas Cowboys", "logo": "https://x/10.png"},
+        },
+        "scores": {
+            side: {"quarter_1": 7, "quarter_2": 3, "quarter_3": 7, "quarter_4": 7, "total": 24}
+            for side in ("home", "away")
+        },
+    }
+    items = [{**item, "game": {**item["game"], "id": i}} for i in range(n)]
+    return default_json_encoder()({"errors": [], "response": items}).encode()
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("body", nargs="?", type=Path, help="Saved response body (JSON).")
+    parser.add_argument("--endpoint", choices=sorted(DECODERS), default="games")
+    parser.add_argument("--items", type=int, default=5000, help="Synthetic body size.")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    body = args.body.read_bytes() if args.body else synthetic_games_body(args.items)
+    base = DECODERS[args.endpoint]
+    # A private registry keeps benchmark runs out of the drift report.
+    decoder = ItemDecoder(base.endpoint, base.adapter, registry=SchemaDriftRegistry())
+    decode_json = default_json_decoder()
+
+    payload = decode_json(body)
+    items = payload.get("response") if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        raise SystemExit("body has no 'response' array")
+
+    parse_s = best_of(args.repeat, lambda: decode_json(body))
+    decode_s = best_of(args.repeat, lambda: decoder.decode(items))
+    print(
+        f"{base.endpoint}: {len(items)} items, best of {args.repeat} ({json_backend()}): "
+        f"parse {parse_s * 1000:.1f}ms, decode {decode_s * 1000:.1f}ms "
+        f"({decode_s / parse_s:.2f}x parse)"
+    )
+
+
+if __name__ == "__main__":
+    main()
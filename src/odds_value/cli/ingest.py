@@ -1,20 +1,58 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
 import typer
+from sqlalchemy import select
 
 from odds_value.cli.common import session_scope
+from odds_value.core.config import settings
+from odds_value.core.payload_codec import register_zstd_dictionary, train_zstd_dictionary
+from odds_value.db.enums import IngestStatusEnum
+from odds_value.db.models.features.football_team_game_stats import FootballTeamGameStats
+from odds_value.db.models.ingestion.payload_body import PayloadBody
+from odds_value.db.repos.ingestion.game_ingest_status_repo import GameIngestStatusRepository
+from odds_value.db.repos.odds.odds_api_quota_repo import OddsApiQuotaLedgerRepository
+from odds_value.ingestion.backfill import (
+    BACKFILL_STAGES,
+    backfill_seasons,
+    season_backfill_tasks,
+)
+from odds_value.ingestion.payload_archive import export_ingested_payloads
+from odds_value.ingestion.providers.api_sports.ingest.american_football_live import (
+    ingest_api_sports_american_football_live,
+)
 from odds_value.ingestion.providers.api_sports.ingest.american_football_season import (
     ingest_api_sports_american_football_season,
+    ingest_api_sports_american_football_season_streaming,
 )
 from odds_value.ingestion.providers.api_sports.ingest.american_football_team_game_stats import (
+    TEAM_GAME_STATS_STAGE,
     ingest_api_sports_american_football_team_game_stats,
     ingest_api_sports_american_football_team_game_stats_for_season,
 )
+from odds_value.ingestion.providers.api_sports.schemas import default_schema_drift_registry
+from odds_value.ingestion.providers.base.metrics import default_metrics_registry
+from odds_value.ingestion.providers.odds_api.client import api_key_fingerprint
 from odds_value.ingestion.providers.odds_api.ingest.nfl_odds import (
     ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season,
 )
+from odds_value.ingestion.replay import REPLAY_ENTITY_TYPES, replay_ingested_payloads
+
 
-app = typer.Typer(help="Ingest provider data into the local DB.")
+def _echo_http_metrics(*_: object, **__: object) -> None:
+    """Print per-endpoint HTTP metrics and schema drift collected while the command ran."""
+
+    for line in default_metrics_registry.format_lines():
+        typer.echo(line)
+    for line in default_schema_drift_registry.format_lines():
+        typer.echo(line)
+
+
+app = typer.Typer(
+    help="Ingest provider data into the local DB.", result_callback=_echo_http_metrics
+)
 
 
 def _split_csv(value: str | None) -> list[str] | None:
@@ -28,6 +66,11 @@ def _split_csv(value: str | None) -> list[str] | None:
 def ingest_api_sports_season_cmd(
     league_key: str = typer.Option(..., "--league-key", help="Canonical league key (e.g. NFL)."),
     season_year: int = typer.Option(..., "--season-year", help="Season year (e.g. 2025)."),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Re-apply provider items even if unchanged since the last ingest.",
+    ),
 ) -> None:
     """Deprecated alias for `api-sports-american-football-season`."""
 
@@ -36,6 +79,7 @@ def ingest_api_sports_season_cmd(
             session,
             league_key=league_key,
             season_year=season_year,
+            force=force,
         )
 
     typer.echo(
@@ -45,6 +89,7 @@ def ingest_api_sports_season_cmd(
                 f"games_seen={result.games_seen}",
                 f"games_created={result.games_created}",
                 f"games_updated={result.games_updated}",
+                f"games_unchanged={result.games_unchanged}",
                 f"teams_created={result.teams_created}",
                 f"venues_created={result.venues_created}",
             ]
@@ -58,15 +103,36 @@ def ingest_api_sports_american_football_season_cmd(
         ..., "--league-key", help="Canonical league key (e.g. NFL or NCAAF)."
     ),
     season_year: int = typer.Option(..., "--season-year", help="Season year (e.g. 2025)."),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Re-apply provider items even if unchanged since the last ingest.",
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Parse and apply games incrementally, committing every --chunk-size games.",
+    ),
+    chunk_size: int = typer.Option(200, "--chunk-size", help="Games per commit when streaming."),
 ) -> None:
     """Fetch an API-Sports american-football season and upsert teams/venues/games."""
 
     with session_scope() as session:
-        result = ingest_api_sports_american_football_season(
-            session,
-            league_key=league_key,
-            season_year=season_year,
-        )
+        if stream:
+            result = ingest_api_sports_american_football_season_streaming(
+                session,
+                league_key=league_key,
+                season_year=season_year,
+                chunk_size=chunk_size,
+                force=force,
+            )
+        else:
+            result = ingest_api_sports_american_football_season(
+                session,
+                league_key=league_key,
+                season_year=season_year,
+                force=force,
+            )
 
     typer.echo(
         " ".join(
@@ -75,6 +141,7 @@ def ingest_api_sports_american_football_season_cmd(
                 f"games_seen={result.games_seen}",
                 f"games_created={result.games_created}",
                 f"games_updated={result.games_updated}",
+                f"games_unchanged={result.games_unchanged}",
                 f"teams_created={result.teams_created}",
                 f"venues_created={result.venues_created}",
             ]
@@ -82,6 +149,47 @@ def ingest_api_sports_american_football_season_cmd(
     )
 
 
+@app.command("api-sports-american-football-live")
+def ingest_api_sports_american_football_live_cmd(
+    league_keys: str = typer.Option(
+        "NFL", "--league-keys", help="Comma-separated canonical league keys (e.g. NFL,NCAAF)."
+    ),
+    lookback_hours: float = typer.Option(
+        6.0,
+        "--lookback-hours",
+        help="Refresh games still running or finished within this many hours.",
+    ),
+    lookahead_hours: float = typer.Option(
+        2.0, "--lookahead-hours", help="Refresh games kicking off within this many hours."
+    ),
+) -> None:
+    """Refresh only in-progress, just-finished and about-to-start games (cheap to run often)."""
+
+    for league_key in _split_csv(league_keys) or []:
+        with session_scope() as session:
+            result = ingest_api_sports_american_football_live(
+                session,
+                league_key=league_key,
+                lookback_hours=lookback_hours,
+                lookahead_hours=lookahead_hours,
+            )
+
+        typer.echo(
+            " ".join(
+                [
+                    f"Refreshed {result.league_key} live window:",
+                    f"candidates={result.candidates}",
+                    f"requests={result.requests}",
+                    f"seasons={','.join(str(s) for s in result.seasons) or '-'}",
+                    f"games_seen={result.games_seen}",
+                    f"games_created={result.games_created}",
+                    f"games_updated={result.games_updated}",
+                    f"games_unchanged={result.games_unchanged}",
+                ]
+            )
+        )
+
+
 @app.command("api-sports-american-football-team-game-stats")
 def ingest_api_sports_american_football_team_game_stats_cmd(
     provider_game_id: str = typer.Option(
@@ -107,6 +215,7 @@ def ingest_api_sports_american_football_team_game_stats_cmd(
                 f"team_game_stats_updated={result.team_game_stats_updated}",
                 f"football_stats_created={result.football_stats_created}",
                 f"football_stats_updated={result.football_stats_updated}",
+                f"items_unchanged={result.items_unchanged}",
             ]
         )
     )
@@ -158,6 +267,26 @@ def ingest_api_sports_american_football_team_game_stats_season_cmd(
         "--stop-on-failure",
         help="Stop immediately and raise the underlying exception.",
     ),
+    fetch_workers: int = typer.Option(
+        4,
+        "--fetch-workers",
+        help="Threads fetching stats ahead of the single DB writer.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip games already checkpointed OK by a previous run.",
+    ),
+    retry_failed: bool = typer.Option(
+        False,
+        "--retry-failed",
+        help="Only attempt games whose last checkpointed attempt failed.",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Re-apply provider items even if unchanged since the last ingest.",
+    ),
 ) -> None:
     """Fetch API-Sports team statistics for all games in a season and upsert."""
 
@@ -174,6 +303,10 @@ def ingest_api_sports_american_football_team_game_stats_season_cmd(
             show_failures=show_failures,
             failures_limit=failures_limit,
             stop_on_failure=stop_on_failure,
+            force=force,
+            fetch_workers=fetch_workers,
+            resume=resume,
+            retry_failed=retry_failed,
         )
 
     typer.echo(
@@ -183,6 +316,7 @@ def ingest_api_sports_american_football_team_game_stats_season_cmd(
                 f"games_seen={result.games_seen}",
                 f"games_processed={result.games_processed}",
                 f"games_skipped_existing={result.games_skipped_existing}",
+                f"games_skipped_checkpointed={result.games_skipped_checkpointed}",
                 f"games_failed={result.games_failed}",
                 f"failed_ids_sample={len(result.failed_game_ids_sample)}",
                 f"items_seen={result.items_seen}",
@@ -190,6 +324,7 @@ def ingest_api_sports_american_football_team_game_stats_season_cmd(
                 f"team_game_stats_updated={result.team_game_stats_updated}",
                 f"football_stats_created={result.football_stats_created}",
                 f"football_stats_updated={result.football_stats_updated}",
+                f"items_unchanged={result.items_unchanged}",
             ]
         )
     )
@@ -201,6 +336,206 @@ def ingest_api_sports_american_football_team_game_stats_season_cmd(
             typer.echo(f"  {count}x {reason}")
 
 
+@app.command("api-sports-american-football-team-game-stats-failures")
+def team_game_stats_failures_cmd(
+    limit: int = typer.Option(50, "--limit", help="Max failed games to list."),
+) -> None:
+    """List games whose last team-stats attempt failed (retry with --retry-failed)."""
+
+    with session_scope() as session:
+        rows = GameIngestStatusRepository(session).with_status(
+            stage=TEAM_GAME_STATS_STAGE, status=IngestStatusEnum.FAILED, limit=limit
+        )
+        for row, provider_game_id in rows:
+            typer.echo(
+                " ".join(
+                    [
+                        f"provider_game_id={provider_game_id}",
+                        f"attempts={row.attempts}",
+                        f"last_attempt_at={row.last_attempt_at}",
+                        f"| {row.last_error}",
+                    ]
+                )
+            )
+    if not rows:
+        typer.echo("No failed games.")
+
+
+@app.command("backfill")
+def backfill_cmd(
+    league_keys: str = typer.Option(
+        "NFL", "--league-keys", help="Comma-separated canonical league keys (e.g. NFL,NCAAF)."
+    ),
+    from_season: int = typer.Option(..., "--from-season", help="First season year (inclusive)."),
+    to_season: int = typer.Option(..., "--to-season", help="Last season year (inclusive)."),
+    workers: int = typer.Option(
+        4,
+        "--workers",
+        help="Worker processes; seasons run in parallel, stages within a season in order.",
+    ),
+    stages: str = typer.Option(
+        ",".join(BACKFILL_STAGES),
+        "--stages",
+        help=f"Comma-separated subset of {','.join(BACKFILL_STAGES)}.",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Re-apply provider items even if unchanged since the last ingest.",
+    ),
+) -> None:
+    """Ingest games + team stats and build features for a range of seasons in parallel."""
+
+    tasks = season_backfill_tasks(
+        _split_csv(league_keys) or [],
+        from_season,
+        to_season,
+        stages=_split_csv(stages) or [],
+        force=force,
+    )
+    result = backfill_seasons(tasks, workers=workers)
+
+    for season in result.seasons:
+        parts = [f"{season.league_key} {season.season_year}:", f"elapsed={season.elapsed_s:.1f}s"]
+        if season.games is not None:
+            parts.append(f"games_created={season.games.games_created}")
+            parts.append(f"games_updated={season.games.games_updated}")
+        if season.team_stats is not None:
+            parts.append(f"team_game_stats_created={season.team_stats.team_game_stats_created}")
+            parts.append(f"games_failed={season.team_stats.games_failed}")
+        if season.features is not None:
+            parts.append(f"states_created={season.features.states_created}")
+        if season.error is not None:
+            parts.append(f"FAILED stage={season.failed_stage} | {season.error}")
+        typer.echo(" ".join(parts))
+
+    typer.echo(
+        " ".join(
+            [
+                f"Backfilled {len(result.seasons)} season(s) in {result.elapsed_s:.1f}s:",
+                f"games_created={result.games_created}",
+                f"team_game_stats_created={result.team_game_stats_created}",
+                f"states_created={result.states_created}",
+                f"seasons_failed={len(result.failed)}",
+            ]
+        )
+    )
+    if result.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command("payload-zstd-dictionary")
+def payload_zstd_dictionary_cmd(
+    out: str = typer.Option(..., "--out", help="Where to write the trained dictionary."),
+    samples: int = typer.Option(
+        5000, "--samples", help="Max stored payloads (bodies + team stats) to train on."
+    ),
+    size: int = typer.Option(112_640, "--size", help="Dictionary size in bytes."),
+) -> None:
+    """Train a zstd dictionary on stored provider payloads (for PAYLOAD_ZSTD_DICT_PATH)."""
+
+    with session_scope() as session:
+        bodies = session.execute(
+            select(PayloadBody.payload_json, PayloadBody.payload_compressed).limit(samples // 2)
+        ).all()
+        stats = session.execute(
+            select(FootballTeamGameStats.stats_json, FootballTeamGameStats.stats_compressed)
+            .where(
+                (FootballTeamGameStats.stats_json.is_not(None))
+                | (FootballTeamGameStats.stats_compressed.is_not(None))
+            )
+            .limit(samples - len(bodies))
+        ).all()
+    values = [plain if plain is not None else packed for plain, packed in [*bodies, *stats]]
+    if not values:
+        raise typer.BadParameter("No stored payloads to train on")
+
+    data = train_zstd_dictionary(values, size=size)
+    Path(out).write_bytes(data)
+    dict_id = register_zstd_dictionary(data)
+    typer.echo(
+        f"Wrote {out} ({size} bytes, id {dict_id}) trained on {len(values)} payloads; "
+        f"registered in {settings.payload_zstd_dict_dir}."
+    )
+
+
+@app.command("replay")
+def replay_cmd(
+    entity_types: str = typer.Option(
+        ",".join(REPLAY_ENTITY_TYPES),
+        "--entity-types",
+        help=f"Comma-separated subset of {','.join(REPLAY_ENTITY_TYPES)}.",
+    ),
+    since: str | None = typer.Option(
+        None, "--since", help="Only payloads fetched at/after this ISO timestamp."
+    ),
+    until: str | None = typer.Option(
+        None, "--until", help="Only payloads fetched before this ISO timestamp."
+    ),
+    as_of_hours: int = typer.Option(
+        6, "--as-of-hours", help="Kickoff offset the archived odds batches were fetched with."
+    ),
+    chunk_size: int = typer.Option(500, "--chunk-size", help="Games applied per batch."),
+    archive_dir: str | None = typer.Option(
+        None,
+        "--archive-dir",
+        help="Also replay payloads exported by archive-payloads from this directory.",
+    ),
+) -> None:
+    """Rebuild games, team stats and odds from archived payloads, without provider calls."""
+
+    with session_scope() as session:
+        result = replay_ingested_payloads(
+            session,
+            entity_types=_split_csv(entity_types) or [],
+            since=None if since is None else datetime.fromisoformat(since),
+            until=None if until is None else datetime.fromisoformat(until),
+            as_of_hours=as_of_hours,
+            chunk_size=chunk_size,
+            archive_root=None if archive_dir is None else Path(archive_dir),
+        )
+
+    typer.echo(
+        " ".join(
+            [
+                f"Replayed {result.payloads_read} payload(s) in {result.elapsed_s:.1f}s:",
+                f"games_created={result.games_created}",
+                f"games_updated={result.games_updated}",
+                f"team_stats_games={result.team_stats_games}",
+                f"team_game_stats_written={result.team_game_stats_written}",
+                f"odds_snapshots_created={result.odds_snapshots_created}",
+            ]
+        )
+    )
+    for reason, n in sorted(result.failures.items()):
+        typer.echo(f"skipped {n}: {reason}")
+
+
+@app.command("archive-payloads")
+def archive_payloads_cmd(
+    retention_days: int = typer.Option(
+        settings.payload_retention_days,
+        "--retention-days",
+        help="Keep payloads fetched within this many days in the DB.",
+    ),
+    archive_dir: str = typer.Option(
+        settings.payload_archive_dir, "--archive-dir", help="Root of the partitioned archive."
+    ),
+) -> None:
+    """Move old raw payloads out of the DB into gzip JSONL files (provider/entity_type/date)."""
+
+    now = datetime.now(tz=UTC)
+    with session_scope() as session:
+        result = export_ingested_payloads(
+            session, root=Path(archive_dir), older_than=now - timedelta(days=retention_days)
+        )
+
+    typer.echo(
+        f"Archived {result.payloads_archived} payload(s) into {result.partitions} partition(s) "
+        f"under {archive_dir}; bodies_deleted={result.bodies_deleted}"
+    )
+
+
 @app.command("odds-api-nfl-odds-season")
 def ingest_odds_api_nfl_odds_season_cmd(
     season_year: int = typer.Option(..., "--season-year", help="Season year (e.g. 2021)."),
@@ -237,6 +572,23 @@ def ingest_odds_api_nfl_odds_season_cmd(
         "--commit-every",
         help="Commit after this many games (0 disables intermediate commits).",
     ),
+    max_credits: int | None = typer.Option(
+        None,
+        "--max-credits",
+        help="Stop before spending more than this many Odds API credits "
+        "(default: ODDS_API_CREDIT_BUDGET).",
+    ),
+    min_remaining: int | None = typer.Option(
+        None,
+        "--min-remaining",
+        help="Stop before account credits drop below this reserve "
+        "(default: ODDS_API_MIN_REMAINING).",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Only report the batches and estimated credits; make no requests.",
+    ),
 ) -> None:
     """Fetch historical NFL odds from The Odds API and upsert decision-time snapshots."""
 
@@ -254,8 +606,25 @@ def ingest_odds_api_nfl_odds_season_cmd(
             markets=markets,
             bookmakers=bookmakers,
             commit_every=commit_every,
+            max_credits=max_credits,
+            min_remaining=min_remaining,
+            dry_run=dry_run,
         )
 
+    if result.dry_run:
+        typer.echo(
+            " ".join(
+                [
+                    f"Dry run odds {result.league_key} {result.season_year}:",
+                    f"games_seen={result.games_seen}",
+                    f"batches_planned={result.batches_planned}",
+                    f"credits_estimated={result.credits_estimated}",
+                    f"requests_remaining={result.requests_remaining}",
+                ]
+            )
+        )
+        return
+
     typer.echo(
         " ".join(
             [
@@ -266,6 +635,35 @@ def ingest_odds_api_nfl_odds_season_cmd(
                 f"books_created={result.books_created}",
                 f"snapshots_created={result.snapshots_created}",
                 f"payloads_created={result.payloads_created}",
+                f"batches_fetched={result.batches_fetched}",
+                f"credits_spent={result.credits_spent}",
+                f"requests_remaining={result.requests_remaining}",
             ]
         )
     )
+    if result.stopped_on_budget:
+        typer.echo("Stopped early: Odds API credit budget reached.")
+
+
+@app.command("odds-api-quota")
+def odds_api_quota_cmd() -> None:
+    """Show Odds API credit usage recorded in the quota ledger for the configured key."""
+
+    api_key_hash = api_key_fingerprint(settings.require_odds_api_key())
+    with session_scope() as session:
+        latest = OddsApiQuotaLedgerRepository(session).latest(api_key_hash)
+        if latest is None:
+            typer.echo("No Odds API usage recorded yet.")
+            return
+        typer.echo(
+            " ".join(
+                [
+                    f"Odds API quota {api_key_hash}:",
+                    f"day={latest.day.isoformat()}",
+                    f"requests_today={latest.request_count}",
+                    f"credits_today={latest.credits_spent}",
+                    f"requests_used={latest.requests_used}",
+                    f"requests_remaining={latest.requests_remaining}",
+                ]
+            )
+        )
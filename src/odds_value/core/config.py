@@ -21,8 +21,43 @@ class Settings(BaseSettings):
     # odds-api
     odds_api_key: str | None = Field(default=None, repr=False)
     odds_api_base_url: str = "https://api.the-odds-api.com/v4"
+    # Credit guardrails: max credits per ingest run (None = unlimited) and a reserve
+    # of account credits that ingestion never dips into.
+    odds_api_credit_budget: int | None = None
+    odds_api_min_remaining: int = 0
+
+    # Provider HTTP connection pools (http2 requires the optional `h2` package).
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry_s: float = 30.0
+    http2: bool = False
+    http_compression: bool = True
+
+    # Shared rate limiting across processes: "memory" (per-process), "sqlite" or "database".
+    rate_limit_backend: str = "memory"
+    rate_limit_sqlite_path: str = "./.odds_value_rate_limits.sqlite"
 
     store_ingested_payloads: bool = True
+    # Raw payload storage: "none" (JSON/JSONB), "zlib" or "zstd" (optional `zstandard`),
+    # with an optional zstd dictionary trained on provider payloads.
+    payload_compression: str = "none"
+    payload_zstd_dict_path: str | None = None
+    # Every dictionary used for compression, by id, so older rows stay decodable.
+    payload_zstd_dict_dir: str = "./.odds_value_zstd_dicts"
+    # Raw payloads older than the retention window move to gzip JSONL partition files.
+    payload_retention_days: int = 180
+    payload_archive_dir: str = "./.odds_value_payload_archive"
+
+    # Optional on-disk cache for immutable provider GET responses (disabled when unset).
+    http_cache_dir: str | None = None
+    http_cache_max_bytes: int = 1024 * 1024 * 1024
+
+    # Record/replay provider traffic for offline benchmarking: "record", "replay" or unset.
+    http_cassette_mode: str | None = None
+    http_cassette_dir: str = "./.odds_value_cassettes"
+    http_cassette_latency_s: float = 0.0
+    http_cassette_latency_scale: float = 0.0
+    http_cassette_rate_limit_probability: float = 0.0
 
     # -----------------------------
     # Required-key helpers
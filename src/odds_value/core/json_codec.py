@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import io
+import json
+from collections.abc import Callable, Iterator
+from functools import cache
+from types import ModuleType
+
+# Decoders take raw bytes and raise ValueError on malformed input.
+JsonDecoder = Callable[[bytes], object]
+JsonEncoder = Callable[[object], str]
+
+
+def _optional_module(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def stdlib_json_decoder(data: bytes) -> object:
+    return json.loads(data)
+
+
+def stdlib_json_encoder(value: object) -> str:
+    return json.dumps(value)
+
+
+def _orjson_codec(orjson: ModuleType) -> tuple[JsonDecoder, JsonEncoder]:
+    # orjson.JSONDecodeError already subclasses ValueError.
+    def encode(value: object) -> str:
+        return str(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"))
+
+    return orjson.loads, encode
+
+
+def _msgspec_codec(msgspec: ModuleType) -> tuple[JsonDecoder, JsonEncoder]:
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def decode(data: bytes) -> object:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def encode(value: object) -> str:
+        return str(encoder.encode(value).decode("utf-8"))
+
+    return decode, encode
+
+
+@cache
+def _codec() -> tuple[str, JsonDecoder, JsonEncoder]:
+    orjson = _optional_module("orjson")
+    if orjson is not None:
+        return ("orjson", *_orjson_codec(orjson))
+    msgspec = _optional_module("msgspec")
+    if msgspec is not None:
+        return ("msgspec", *_msgspec_codec(msgspec))
+    return "json", stdlib_json_decoder, stdlib_json_encoder
+
+
+def json_backend() -> str:
+    """Name of the JSON library in use: orjson, msgspec or json (stdlib)."""
+
+    return _codec()[0]
+
+
+def default_json_decoder() -> JsonDecoder:
+    """Fastest available decoder (orjson > msgspec > stdlib)."""
+
+    return _codec()[1]
+
+
+def content_hash(value: object) -> str:
+    """Stable sha256 of a JSON value (sorted keys, compact separators).
+
+    Always uses the stdlib encoder so hashes do not change with the installed backend.
+    """
+
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def iter_json_array(
+    data: bytes, key: str, *, decoder: JsonDecoder | None = None
+) -> Iterator[object]:
+    """Yield the elements of the top-level array `data[key]`.
+
+    With the optional `ijson` package the body is parsed incrementally, so only one
+    element is materialized at a time; otherwise the whole document is decoded first.
+    Raises ValueError when `data[key]` is missing or not an array.
+    """
+
+    ijson = _optional_module("ijson")
+    if ijson is not None:
+        empty = True
+        for item in ijson.items(io.BytesIO(data), f"{key}.item", use_float=True):
+            empty = False
+            yield item
+        # An empty result is either `[]` or a missing/non-array key; only the former is ok.
+        if empty and not _has_array(ijson, data, key):
+            raise ValueError(f"Expected {key!r} array")
+        return
+
+    payload = (decoder or default_json_decoder())(data)
+    value = payload.get(key) if isinstance(payload, dict) else None
+    if not isinstance(value, list):
+        raise ValueError(f"Expected {key!r} array, got: {type(value)}")
+    yield from value
+
+
+def _has_array(ijson: ModuleType, data: bytes, key: str) -> bool:
+    return any(
+        prefix == key and event == "start_array"
+        for prefix, event, _ in ijson.parse(io.BytesIO(data))
+    )
+
+
+def default_json_encoder() -> JsonEncoder:
+    """Fastest available encoder returning `str`, suitable as SQLAlchemy's json_serializer."""
+
+    return _codec()[2]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import importlib
+import os
+import zlib
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from odds_value.core.config import settings
+from odds_value.core.json_codec import default_json_decoder, default_json_encoder
+
+# Values of `settings.payload_compression`.
+PAYLOAD_CODECS: tuple[str, ...] = ("none", "zlib", "zstd")
+
+# First byte of every compressed blob names the codec, so rows written under different
+# settings stay readable side by side. Dictionary-compressed zstd blobs follow the tag with
+# the 4-byte big-endian dictionary id, so retraining never strands older rows.
+_ZLIB_TAG = b"\x01"
+_ZSTD_TAG = b"\x02"
+_ZSTD_DICT_TAG = b"\x03"
+
+_ZLIB_LEVEL = 6
+_ZSTD_LEVEL = 9
+
+# Registered dictionaries: <payload_zstd_dict_dir>/<dict id>.zdict
+_ZSTD_DICT_SUFFIX = ".zdict"
+
+
+def _zstandard() -> Any:
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError as exc:
+        raise RuntimeError(
+            "zstd payload compression requires the optional `zstandard` package "
+            "(pip install 'odds-value[compression]')"
+        ) from exc
+
+
+def register_zstd_dictionary(data: bytes) -> int:
+    """Keep a dictionary under `settings.payload_zstd_dict_dir` by id; returns the id.
+
+    Every dictionary that ever compressed a payload must stay registered to decode it.
+    """
+
+    dict_id = int(_zstandard().ZstdCompressionDict(data).dict_id())
+    directory = Path(settings.payload_zstd_dict_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{dict_id}{_ZSTD_DICT_SUFFIX}"
+    if not path.exists():
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    return dict_id
+
+
+@cache
+def _load_active_zstd_dictionary(path: str, directory: str) -> Any:
+    # `directory` only keys the cache: the dictionary is registered once per location.
+    data = Path(path).read_bytes()
+    register_zstd_dictionary(data)
+    return _zstandard().ZstdCompressionDict(data)
+
+
+def _active_zstd_dictionary() -> Any:
+    if settings.payload_zstd_dict_path is None:
+        return None
+    return _load_active_zstd_dictionary(
+        settings.payload_zstd_dict_path, settings.payload_zstd_dict_dir
+    )
+
+
+@cache
+def _load_zstd_dictionary(directory: str, dict_id: int) -> Any:
+    path = Path(directory) / f"{dict_id}{_ZSTD_DICT_SUFFIX}"
+    try:
+        return _zstandard().ZstdCompressionDict(path.read_bytes())
+    except FileNotFoundError as exc:
+        raise ValueError(f"zstd dictionary {dict_id} is not registered in {directory}") from exc
+
+
+def _zstd_dictionary_by_id(dict_id: int) -> Any:
+    active = _active_zstd_dictionary()
+    if active is not None and active.dict_id() == dict_id:
+        return active
+    return _load_zstd_dictionary(settings.payload_zstd_dict_dir, dict_id)
+
+
+def _zstd_decompress(body: bytes, dict_id: int) -> bytes:
+    # (De)compressor objects are not thread-safe, so a fresh one is made per call.
+    zstd = _zstandard()
+    kwargs: dict[str, Any] = {}
+    if dict_id:
+        kwargs["dict_data"] = _zstd_dictionary_by_id(dict_id)
+    return bytes(zstd.ZstdDecompressor(**kwargs).decompress(body))
+
+
+def payload_compression_enabled() -> bool:
+    return settings.payload_compression != "none"
+
+
+def encode_payload(value: object, *, codec: str | None = None) -> bytes:
+    """Compress a JSON value into a tagged blob (`codec` defaults to the configured one).
+
+    zstd uses the dictionary at `settings.payload_zstd_dict_path` when set (and registers it
+    by id so the blob stays decodable after retraining).
+    """
+
+    codec = codec or settings.payload_compression
+    raw = default_json_encoder()(value).encode("utf-8")
+    if codec == "zlib":
+        return _ZLIB_TAG + zlib.compress(raw, _ZLIB_LEVEL)
+    if codec == "zstd":
+        zstd = _zstandard()
+        dictionary = _active_zstd_dictionary()
+        if dictionary is None:
+            return _ZSTD_TAG + bytes(zstd.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw))
+        compressor = zstd.ZstdCompressor(level=_ZSTD_LEVEL, dict_data=dictionary)
+        header = _ZSTD_DICT_TAG + int(dictionary.dict_id()).to_bytes(4, "big")
+        return header + bytes(compressor.compress(raw))
+    raise ValueError(f"Unknown payload codec {codec!r} (expected one of {PAYLOAD_CODECS[1:]})")
+
+
+def decode_payload(blob: bytes) -> Any:
+    tag, body = blob[:1], blob[1:]
+    if tag == _ZLIB_TAG:
+        raw = zlib.decompress(body)
+    elif tag == _ZSTD_DICT_TAG:
+        raw = _zstd_decompress(body[4:], int.from_bytes(body[:4], "big"))
+    elif tag == _ZSTD_TAG:
+        # Older blobs may use a dictionary without naming it; the frame header records it.
+        raw = _zstd_decompress(body, int(_zstandard().get_frame_parameters(body).dict_id))
+    else:
+        raise ValueError(f"Unknown payload blob tag {tag!r}")
+    return default_json_decoder()(raw)
+
+
+def train_zstd_dictionary(samples: Iterable[object], *, size: int = 112_640) -> bytes:
+    """Train a zstd dictionary on sample payloads (JSON values); returns its bytes.
+
+    Small, repetitive provider payloads (one game, one team-stats item) compress several
+    times better with a shared dictionary than on their own.
+    """
+
+    encode = default_json_encoder()
+    data = [encode(s).encode("utf-8") for s in samples]
+    return bytes(_zstandard().train_dictionary(size, data).as_bytes())
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import date, datetime, time
+from itertools import islice
+from typing import Any, cast
+
+from sqlalchemy import (
+    Connection,
+    LargeBinary,
+    PrimaryKeyConstraint,
+    Select,
+    Table,
+    UniqueConstraint,
+    column,
+    func,
+    insert,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import Session
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from odds_value.db.base import Base
+
+# Rows per COPY / executemany round trip.
+BULK_BATCH_SIZE = 10_000
+
+
+def constraint_columns(table_: Table, name: str) -> list[str]:
+    for c in table_.constraints:
+        if isinstance(c, UniqueConstraint | PrimaryKeyConstraint) and c.name == name:
+            return [col.name for col in c.columns]
+    raise ValueError(f"{table_.name} has no unique constraint {name!r}")
+
+
+def _batches(rows: Iterable[Mapping[str, Any]], size: int) -> Iterator[list[Mapping[str, Any]]]:
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _copy_text(value: object) -> str:
+    """One field in Postgres COPY text format."""
+
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, bytes | bytearray | memoryview):
+        return r"\\x" + bytes(value).hex()
+    s = value.isoformat() if isinstance(value, datetime | date | time) else str(value)
+    return s.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy_converter(type_: TypeEngine[Any], dialect: Dialect) -> Callable[[Any], str]:
+    # Apply the column type's own bind processing (enums -> names, JSON -> text, ...) so
+    # COPY stores exactly what an ORM insert would.
+    decorate: Callable[[Any], Any] | None = None
+    if isinstance(type_, TypeDecorator):
+        decorator = type_
+        type_ = type_.impl_instance
+
+        def decorate(value: Any) -> Any:
+            return decorator.process_bind_param(value, dialect)
+
+    impl = type_.dialect_impl(dialect)
+    process = None if isinstance(impl, LargeBinary) else impl.bind_processor(dialect)
+
+    def convert(value: Any) -> str:
+        if decorate is not None:
+            value = decorate(value)
+        if process is not None and value is not None:
+            value = process(value)
+        return _copy_text(value)
+
+    return convert
+
+
+def _copy_rows(
+    conn: Connection,
+    target: str,
+    cols: Sequence[str],
+    rows: Sequence[Mapping[str, Any]],
+    table_: Table,
+) -> None:
+    converters = [_copy_converter(table_.c[c].type, conn.dialect) for c in cols]
+    buf = io.StringIO()
+    for r in rows:
+        buf.write("\t".join(conv(r.get(c)) for conv, c in zip(converters, cols, strict=True)))
+        buf.write("\n")
+    buf.seek(0)
+
+    quote = conn.dialect.identifier_preparer.quote
+    sql = f"COPY {quote(target)} ({', '.join(quote(c) for c in cols)}) FROM STDIN"
+    dbapi_conn = conn.connection.dbapi_connection
+    assert dbapi_conn is not None
+    cursor = dbapi_conn.cursor()
+    try:
+        cursor.copy_expert(sql, buf)
+    finally:
+        cursor.close()
+
+
+def _merge_stmt(
+    table_: Table,
+    source: Any,
+    cols: Sequence[str],
+    key_cols: Sequence[str],
+    update_cols: Sequence[str],
+    *,
+    coalesce_nulls: bool,
+    dialect: str,
+) -> Any:
+    ins = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = ins(table_) if source is None else ins(table_).from_select(list(cols), source)
+    if not update_cols:
+        return stmt.on_conflict_do_nothing(index_elements=list(key_cols))
+    set_: dict[str, Any] = {
+        c: func.coalesce(stmt.excluded[c], table_.c[c]) if coalesce_nulls else stmt.excluded[c]
+        for c in update_cols
+    }
+    if "updated_at" in table_.c and "updated_at" not in set_:
+        set_["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(index_elements=list(key_cols), set_=set_)
+
+
+def bulk_load(
+    session: Session,
+    model: type[Base] | Table,
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    constraint: str | None = None,
+    update_cols: Sequence[str] | None = None,
+    coalesce_nulls: bool = True,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> int:
+    """Stream plain-dict rows into a table without building ORM objects.
+
+    On Postgres rows go through `COPY ... FROM STDIN`; with `constraint` they are copied
+    into a temp staging table and merged with `INSERT ... SELECT ... ON CONFLICT`. Other
+    dialects fall back to an `executemany` INSERT (with the same ON CONFLICT clause on
+    SQLite). Upserts follow `BaseRepository.upsert_many`: `update_cols` defaults to every
+    supplied non-key column (empty = insert new keys only), rows repeating a key collapse
+    (last wins) and, unless `coalesce_nulls=False`, a NULL never overwrites a stored value.
+
+    Every row must carry the same keys. Pending ORM changes are flushed first. Returns the
+    number of rows inserted or updated.
+    """
+
+    table_ = model if isinstance(model, Table) else cast(Table, model.__table__)
+    key_cols = constraint_columns(table_, constraint) if constraint is not None else []
+    session.flush()
+    conn = session.connection()
+    dialect = conn.dialect.name
+
+    written = 0
+    for batch in _batches(rows, batch_size):
+        if key_cols:
+            batch = list({tuple(r[c] for c in key_cols): r for r in batch}.values())
+        cols = list(batch[0])
+        cols_update = (
+            [c for c in cols if c not in key_cols] if update_cols is None else list(update_cols)
+        )
+
+        if dialect == "postgresql" and not key_cols:
+            _copy_rows(conn, table_.name, cols, batch, table_)
+            written += len(batch)
+        elif dialect == "postgresql":
+            stage = f"_bulk_stage_{table_.name}"
+            quote = conn.dialect.identifier_preparer.quote
+            conn.execute(
+                text(
+                    f"CREATE TEMP TABLE {quote(stage)} "
+                    f"(LIKE {quote(table_.name)} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            )
+            _copy_rows(conn, stage, cols, batch, table_)
+            staged: Select[Any] = select(*table(stage, *(column(c) for c in cols)).c)
+            res = conn.execute(
+                _merge_stmt(
+                    table_,
+                    staged,
+                    cols,
+                    key_cols,
+                    cols_update,
+                    coalesce_nulls=coalesce_nulls,
+                    dialect=dialect,
+                )
+            )
+            # Dropped only on success so the next batch can recreate it; after a failure
+            # the transaction is aborted and ON COMMIT DROP / rollback removes it.
+            conn.execute(text(f"DROP TABLE {quote(stage)}"))
+            written += max(res.rowcount, 0)
+        elif key_cols:
+            if dialect != "sqlite":
+                raise NotImplementedError(f"bulk_load upserts are not supported on {dialect!r}")
+            res = conn.execute(
+                _merge_stmt(
+                    table_,
+                    None,
+                    cols,
+                    key_cols,
+                    cols_update,
+                    coalesce_nulls=coalesce_nulls,
+                    dialect=dialect,
+                ),
+                batch,
+            )
+            written += max(res.rowcount, 0)
+        else:
+            conn.execute(insert(table_), batch)
+            written += len(batch)
+    return written
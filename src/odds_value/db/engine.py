@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from odds_value.core.json_codec import default_json_decoder, default_json_encoder
+
 
 @dataclass(frozen=True)
 class DatabaseConfig:
@@ -13,7 +15,13 @@ class DatabaseConfig:
 
 
 def create_db_engine(cfg: DatabaseConfig) -> Engine:
-    return create_engine(cfg.database_url, echo=cfg.echo, pool_pre_ping=True)
+    return create_engine(
+        cfg.database_url,
+        echo=cfg.echo,
+        pool_pre_ping=True,
+        json_serializer=default_json_encoder(),
+        json_deserializer=default_json_decoder(),
+    )
 
 
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
@@ -26,6 +26,12 @@ class GameStatusEnum(StrEnum):
     UNKNOWN = "UNKNOWN"
 
 
+class IngestStatusEnum(StrEnum):
+    PENDING = "PENDING"
+    OK = "OK"
+    FAILED = "FAILED"
+
+
 class RoofTypeEnum(StrEnum):
     DOME = "DOME"
     RETRACTABLE = "RETRACTABLE"
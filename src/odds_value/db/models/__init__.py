@@ -11,8 +11,12 @@ from odds_value.db.models.features.baseball_team_game_stats import BaseballTeamG
 from odds_value.db.models.features.football_team_game_state import FootballTeamGameState
 from odds_value.db.models.features.football_team_game_stats import FootballTeamGameStats
 from odds_value.db.models.features.team_game_stats import TeamGameStats
+from odds_value.db.models.ingestion.game_ingest_status import GameIngestStatus
 from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
+from odds_value.db.models.ingestion.payload_body import PayloadBody
+from odds_value.db.models.ingestion.rate_limit_bucket import RateLimitBucket
 from odds_value.db.models.odds.book import Book
+from odds_value.db.models.odds.odds_api_quota import OddsApiQuotaLedger
 from odds_value.db.models.odds.odds_snapshot import OddsSnapshot
 
 __all__ = [
@@ -21,12 +25,16 @@ __all__ = [
     "FootballTeamGameState",
     "FootballTeamGameStats",
     "Game",
+    "GameIngestStatus",
     "IngestedPayload",
     "League",
+    "OddsApiQuotaLedger",
     "OddsSnapshot",
+    "PayloadBody",
     "ProviderLeague",
     "ProviderSport",
     "ProviderTeam",
+    "RateLimitBucket",
     "Season",
     "Team",
     "TeamAlias",
@@ -53,6 +53,8 @@ class Game(Base, TimestampMixin):
     away_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     source_last_seen_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    # Hash of the provider item last applied; unchanged items are skipped on re-ingest.
+    source_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     league: Mapped[League] = relationship(back_populates="games")
     season: Mapped[Season | None] = relationship(back_populates="games")
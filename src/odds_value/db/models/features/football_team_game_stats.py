@@ -6,8 +6,10 @@ from sqlalchemy import JSON, ForeignKey, Integer
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from odds_value.core.payload_codec import payload_compression_enabled
 from odds_value.db.base import Base
 from odds_value.db.models.features.team_game_stats import TeamGameStats
+from odds_value.db.types import CompressedJSON
 
 
 class FootballTeamGameStats(Base):
@@ -23,11 +25,26 @@ class FootballTeamGameStats(Base):
     yards_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
     turnovers: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    # Raw payload
+    # Raw payload, as JSON or (with `settings.payload_compression`) a compressed blob.
+    # Read and write it through `stats`.
     stats_json: Mapped[dict[str, Any] | None] = mapped_column(
         JSON().with_variant(JSONB, "postgresql"),
         nullable=True,
     )
+    stats_compressed: Mapped[dict[str, Any] | None] = mapped_column(CompressedJSON, nullable=True)
 
     # Relationships
     base: Mapped[TeamGameStats] = relationship(back_populates="football")
+
+    @property
+    def stats(self) -> dict[str, Any] | None:
+        if self.stats_compressed is not None:
+            return self.stats_compressed
+        return self.stats_json
+
+    @stats.setter
+    def stats(self, value: dict[str, Any] | None) -> None:
+        if payload_compression_enabled():
+            self.stats_compressed, self.stats_json = value, None
+        else:
+            self.stats_json, self.stats_compressed = value, None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Index, Integer, UniqueConstraint
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from odds_value.db.base import Base, TimestampMixin
@@ -25,6 +25,9 @@ class TeamGameStats(Base, TimestampMixin):
 
     score: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Hash of the provider stats item (plus game score) last applied.
+    source_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
     game: Mapped[Game] = relationship(back_populates="team_stats")
     team: Mapped[Team] = relationship(back_populates="team_game_stats")
 
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from odds_value.db.base import Base, TimestampMixin
+from odds_value.db.enums import IngestStatusEnum
+
+
+class GameIngestStatus(Base, TimestampMixin):
+    """Durable per-game checkpoint for a multi-game ingest stage (e.g. team stats).
+
+    Written in the same transaction as the ingested rows, so an OK status is only ever
+    visible together with its data.
+    """
+
+    __tablename__ = "game_ingest_statuses"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    game_id: Mapped[int] = mapped_column(ForeignKey("games.id", ondelete="CASCADE"), nullable=False)
+    stage: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    status: Mapped[IngestStatusEnum] = mapped_column(
+        nullable=False, default=IngestStatusEnum.PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[str | None] = mapped_column(String, nullable=True)
+    last_attempt_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("game_id", "stage", name="uq_game_ingest_statuses_game_stage"),
+        Index("ix_game_ingest_statuses_stage_status", "stage", "status"),
+    )
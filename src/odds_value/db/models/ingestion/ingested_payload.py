@@ -3,11 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, Index, String
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from odds_value.db.base import Base
+from odds_value.db.models.ingestion.payload_body import PayloadBody
 
 
 class IngestedPayload(Base):
@@ -24,11 +24,17 @@ class IngestedPayload(Base):
     )  # provider ids or composite keys
 
     fetched_at: Mapped[datetime] = mapped_column(nullable=False)
-    payload_json: Mapped[dict[str, Any]] = mapped_column(
-        JSON().with_variant(JSONB, "postgresql"),
+    content_hash: Mapped[str] = mapped_column(
+        ForeignKey("payload_bodies.content_hash", name="fk_ingested_payloads_content_hash"),
         nullable=False,
     )
 
+    body: Mapped[PayloadBody] = relationship()
+
+    @property
+    def payload_json(self) -> Any:
+        return self.body.payload
+
     __table_args__ = (
         Index("ix_ingested_payloads_lookup", "provider", "entity_type", "entity_key", "fetched_at"),
     )
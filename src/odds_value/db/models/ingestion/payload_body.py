@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import JSON, PrimaryKeyConstraint, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from odds_value.core.payload_codec import payload_compression_enabled
+from odds_value.db.base import Base
+from odds_value.db.types import CompressedJSON
+
+
+class PayloadBody(Base):
+    """Raw provider payload stored once, keyed by its content hash.
+
+    `IngestedPayload` rows reference bodies, so identical payloads fetched on every rerun
+    cost one lookup row each instead of a full copy. The body is kept either as JSON or,
+    with `settings.payload_compression`, as a compressed blob; `payload` reads whichever.
+    """
+
+    __tablename__ = "payload_bodies"
+
+    # sha256 of the canonical JSON (`odds_value.core.json_codec.content_hash`).
+    content_hash: Mapped[str] = mapped_column(String(64))
+    payload_json: Mapped[Any | None] = mapped_column(
+        JSON().with_variant(JSONB, "postgresql"),
+        nullable=True,
+    )
+    payload_compressed: Mapped[Any | None] = mapped_column(CompressedJSON, nullable=True)
+
+    __table_args__ = (PrimaryKeyConstraint("content_hash", name="pk_payload_bodies"),)
+
+    @property
+    def payload(self) -> Any:
+        if self.payload_compressed is not None:
+            return self.payload_compressed
+        return self.payload_json
+
+
+def payload_body_columns(payload: object) -> dict[str, object]:
+    """Column values for storing `payload` under the configured compression setting."""
+
+    if payload_compression_enabled():
+        return {"payload_compressed": payload}
+    return {"payload_json": payload}
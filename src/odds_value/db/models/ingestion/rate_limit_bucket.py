@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from sqlalchemy import Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from odds_value.db.base import Base
+
+
+class RateLimitBucket(Base):
+    """Shared token-bucket state for provider rate limiting across processes.
+
+    Timestamps are wall-clock epoch seconds so every worker sees the same clock.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    key: Mapped[str] = mapped_column(String(128), primary_key=True)
+
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[float] = mapped_column(Float, nullable=False)
+    blocked_until: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from odds_value.db.base import Base, TimestampMixin
+
+
+class OddsApiQuotaLedger(Base, TimestampMixin):
+    """Daily Odds API credit usage per API key, from `x-requests-*` response headers."""
+
+    __tablename__ = "odds_api_quota_ledger"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    # sha256 prefix of the API key; the key itself is never stored.
+    api_key_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+
+    request_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    credits_spent: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Latest values reported by the provider (account-wide, not per day).
+    requests_used: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    requests_remaining: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_seen_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("api_key_hash", "day", name="uq_odds_api_quota_ledger_key_day"),
+    )
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Any, Generic, TypeVar
+import builtins
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Generic, TypeVar, cast
 
-from sqlalchemy import select
+from sqlalchemy import Table, func, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.elements import ColumnElement
 
 from odds_value.db.base import Base
+from odds_value.db.bulk import BULK_BATCH_SIZE, bulk_load, constraint_columns
 
 ModelT = TypeVar("ModelT", bound=Base)
 
+# Rows per INSERT statement; keeps bound parameters well under SQLite/Postgres limits.
+UPSERT_BATCH_SIZE = 500
+
 
 class BaseRepository(Generic[ModelT]):  # noqa: UP046
     def __init__(self, session: Session, model: type[ModelT]) -> None:
@@ -52,6 +58,80 @@ class BaseRepository(Generic[ModelT]):  # noqa: UP046
             self.session.flush()
         return obj
 
+    def upsert_many(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        constraint: str,
+        update_cols: Sequence[str] | None = None,
+        returning: Sequence[str] = (),
+        batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> builtins.list[dict[str, Any]]:
+        """Set-based `INSERT ... ON CONFLICT DO UPDATE` keyed on a named unique/primary key.
+
+        Works on Postgres and SQLite. Like `patch()`, a NULL incoming value keeps the stored
+        one. `update_cols` defaults to every supplied non-key column; empty without
+        `returning` means `ON CONFLICT DO NOTHING` (insert-if-missing). Rows repeating a key
+        are collapsed (last wins). Instances already loaded in the session are not refreshed.
+        """
+
+        if not rows:
+            return []
+
+        table = cast(Table, self.model.__table__)
+        key_cols = constraint_columns(table, constraint)
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in {"postgresql", "sqlite"}:
+            raise NotImplementedError(f"upsert_many is not supported on {dialect!r}")
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+        deduped = list({tuple(r[c] for c in key_cols): dict(r) for r in rows}.values())
+        if update_cols is None:
+            update_cols = [c for c in deduped[0] if c not in key_cols]
+
+        out: builtins.list[dict[str, Any]] = []
+        for i in range(0, len(deduped), batch_size):
+            stmt = insert(table).values(deduped[i : i + batch_size])
+            set_: dict[str, Any] = {
+                c: func.coalesce(stmt.excluded[c], table.c[c]) for c in update_cols
+            }
+            if not set_ and not returning:
+                self.session.execute(stmt.on_conflict_do_nothing(index_elements=key_cols))
+                continue
+            if not set_:
+                # No-op update so RETURNING still yields conflicting rows.
+                set_[key_cols[0]] = stmt.excluded[key_cols[0]]
+            if "updated_at" in table.c and "updated_at" not in set_:
+                set_["updated_at"] = func.now()
+            upsert = stmt.on_conflict_do_update(index_elements=key_cols, set_=set_)
+            if returning:
+                result = self.session.execute(upsert.returning(*(table.c[c] for c in returning)))
+                out.extend(dict(row._mapping) for row in result)
+            else:
+                self.session.execute(upsert)
+        return out
+
+    def bulk_load(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        constraint: str | None = None,
+        update_cols: Sequence[str] | None = None,
+        coalesce_nulls: bool = True,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> int:
+        """High-volume insert/upsert of plain rows (COPY on Postgres); see `db.bulk.bulk_load`."""
+
+        return bulk_load(
+            self.session,
+            self.model,
+            rows,
+            constraint=constraint,
+            update_cols=update_cols,
+            coalesce_nulls=coalesce_nulls,
+            batch_size=batch_size,
+        )
+
     def commit(self) -> None:
         self.session.commit()
 
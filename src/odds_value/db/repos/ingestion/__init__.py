@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from odds_value.db.repos.ingestion.game_ingest_status_repo import GameIngestStatusRepository
+from odds_value.db.repos.ingestion.ingested_payload_repo import IngestedPayloadRepository
+
+__all__ = [
+    "GameIngestStatusRepository",
+    "IngestedPayloadRepository",
+]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from odds_value.db.enums import IngestStatusEnum
+from odds_value.db.models.core.game import Game
+from odds_value.db.models.ingestion.game_ingest_status import GameIngestStatus
+from odds_value.db.repos.base import BaseRepository
+
+# Keep IN (...) lists well under driver parameter limits.
+_ID_CHUNK = 500
+
+
+class GameIngestStatusRepository(BaseRepository[GameIngestStatus]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session, GameIngestStatus)
+
+    def by_game_id(self, game_ids: Iterable[int], *, stage: str) -> dict[int, GameIngestStatus]:
+        ids = sorted(set(game_ids))
+        out: dict[int, GameIngestStatus] = {}
+        for i in range(0, len(ids), _ID_CHUNK):
+            stmt = select(GameIngestStatus).where(
+                GameIngestStatus.stage == stage,
+                GameIngestStatus.game_id.in_(ids[i : i + _ID_CHUNK]),
+            )
+            out.update((row.game_id, row) for row in self.session.execute(stmt).scalars())
+        return out
+
+    def ensure_pending(
+        self, statuses: dict[int, GameIngestStatus], game_ids: Iterable[int], *, stage: str
+    ) -> None:
+        """Add PENDING rows for games without a status yet (updates `statuses` in place)."""
+
+        for game_id in game_ids:
+            if game_id not in statuses:
+                statuses[game_id] = self.add(
+                    GameIngestStatus(
+                        game_id=game_id,
+                        stage=stage,
+                        status=IngestStatusEnum.PENDING,
+                        attempts=0,
+                    ),
+                    flush=False,
+                )
+
+    def record_attempt(
+        self,
+        statuses: dict[int, GameIngestStatus],
+        game_id: int,
+        *,
+        stage: str,
+        at: datetime,
+        error: str | None = None,
+    ) -> GameIngestStatus:
+        """Record one attempt: OK when `error` is None, else FAILED with the reason."""
+
+        self.ensure_pending(statuses, [game_id], stage=stage)
+        row = statuses[game_id]
+        row.attempts += 1
+        row.last_attempt_at = at
+        row.last_error = error
+        if error is None:
+            row.status = IngestStatusEnum.OK
+            row.completed_at = at
+        else:
+            row.status = IngestStatusEnum.FAILED
+        return row
+
+    def mark_ok(self, statuses: dict[int, GameIngestStatus], game_id: int, *, stage: str) -> None:
+        """Mark a game complete without counting an attempt (e.g. data already present)."""
+
+        self.ensure_pending(statuses, [game_id], stage=stage)
+        row = statuses[game_id]
+        if row.status != IngestStatusEnum.OK:
+            row.status = IngestStatusEnum.OK
+            row.last_error = None
+
+    def with_status(
+        self, *, stage: str, status: IngestStatusEnum, limit: int = 100
+    ) -> list[tuple[GameIngestStatus, str]]:
+        """Most recently attempted rows with `status`, paired with the provider game id."""
+
+        stmt = (
+            select(GameIngestStatus, Game.provider_game_id)
+            .join(Game, Game.id == GameIngestStatus.game_id)
+            .where(GameIngestStatus.stage == stage, GameIngestStatus.status == status)
+            .order_by(GameIngestStatus.last_attempt_at.desc())
+            .limit(limit)
+        )
+        return [(row, provider_game_id) for row, provider_game_id in self.session.execute(stmt)]
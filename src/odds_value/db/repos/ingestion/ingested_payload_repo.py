@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from odds_value.core.json_codec import content_hash
+from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
+from odds_value.db.models.ingestion.payload_body import PayloadBody, payload_body_columns
+from odds_value.db.repos.base import BaseRepository
+
+# Keep IN (...) lists well under driver parameter limits.
+_HASH_CHUNK = 500
+
+
+class IngestedPayloadRepository(BaseRepository[IngestedPayload]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session, IngestedPayload)
+
+    def existing_hashes(self, hashes: Iterable[str]) -> set[str]:
+        unique = sorted(set(hashes))
+        out: set[str] = set()
+        for i in range(0, len(unique), _HASH_CHUNK):
+            out.update(
+                self.session.execute(
+                    select(PayloadBody.content_hash).where(
+                        PayloadBody.content_hash.in_(unique[i : i + _HASH_CHUNK])
+                    )
+                ).scalars()
+            )
+        return out
+
+    def record_many(
+        self,
+        payloads: Mapping[str, object],
+        *,
+        provider: str,
+        entity_type: str,
+        fetched_at: datetime,
+    ) -> int:
+        """Add one lookup row per `entity_key -> payload`, storing each distinct body once.
+
+        Bodies already stored (checked in batches by content hash) are only referenced.
+        Returns the number of new bodies written.
+        """
+
+        if not payloads:
+            return 0
+
+        hash_by_key = {key: content_hash(payload) for key, payload in payloads.items()}
+        known = self.existing_hashes(hash_by_key.values())
+        new_bodies = {
+            h: {"content_hash": h, **payload_body_columns(payloads[key])}
+            for key, h in hash_by_key.items()
+            if h not in known
+        }
+        if new_bodies:
+            # ON CONFLICT keeps concurrent writers of the same body from colliding.
+            BaseRepository(self.session, PayloadBody).upsert_many(
+                list(new_bodies.values()), constraint="pk_payload_bodies", update_cols=()
+            )
+
+        self.bulk_load(
+            {
+                "provider": provider,
+                "entity_type": entity_type,
+                "entity_key": key,
+                "fetched_at": fetched_at,
+                "content_hash": h,
+            }
+            for key, h in hash_by_key.items()
+        )
+        return len(new_bodies)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from odds_value.db.repos.odds.book_repo import BookRepository
+from odds_value.db.repos.odds.odds_api_quota_repo import OddsApiQuotaLedgerRepository
 from odds_value.db.repos.odds.odds_snapshot_repo import OddsSnapshotRepository
 
 __all__ = [
     "BookRepository",
+    "OddsApiQuotaLedgerRepository",
     "OddsSnapshotRepository",
 ]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from odds_value.db.models.odds.odds_api_quota import OddsApiQuotaLedger
+from odds_value.db.repos.base import BaseRepository
+
+
+class OddsApiQuotaLedgerRepository(BaseRepository[OddsApiQuotaLedger]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session, OddsApiQuotaLedger)
+
+    def record(
+        self,
+        *,
+        api_key_hash: str,
+        seen_at: datetime,
+        cost: int,
+        requests_used: int | None,
+        requests_remaining: int | None,
+    ) -> OddsApiQuotaLedger:
+        day = seen_at.date()
+        row = self.first_where(
+            OddsApiQuotaLedger.api_key_hash == api_key_hash,
+            OddsApiQuotaLedger.day == day,
+        )
+        if row is None:
+            row = self.add(
+                OddsApiQuotaLedger(
+                    api_key_hash=api_key_hash,
+                    day=day,
+                    request_count=0,
+                    credits_spent=0,
+                ),
+                flush=True,
+            )
+        row.request_count += 1
+        row.credits_spent += cost
+        return self.patch(
+            row,
+            {
+                "requests_used": requests_used,
+                "requests_remaining": requests_remaining,
+                "last_seen_at": seen_at,
+            },
+            flush=True,
+        )
+
+    def latest(self, api_key_hash: str) -> OddsApiQuotaLedger | None:
+        stmt = (
+            select(OddsApiQuotaLedger)
+            .where(OddsApiQuotaLedger.api_key_hash == api_key_hash)
+            .order_by(OddsApiQuotaLedger.day.desc())
+            .limit(1)
+        )
+        return self.session.execute(stmt).scalars().first()
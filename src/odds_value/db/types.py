@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+from odds_value.core.payload_codec import decode_payload, encode_payload
+
+
+class CompressedJSON(TypeDecorator[Any]):
+    """JSON value stored as a compressed blob (bytea); see `odds_value.core.payload_codec`."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> bytes | None:
+        return None if value is None else encode_payload(value)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> Any:
+        return None if value is None else decode_payload(bytes(value))
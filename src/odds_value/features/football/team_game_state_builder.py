@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
+from odds_value.db.bulk import bulk_load
 from odds_value.db.enums import GameStatusEnum
 from odds_value.db.models.core.game import Game
 from odds_value.db.models.core.league import League
@@ -59,6 +60,18 @@ def _days_between(earlier: datetime, later: datetime) -> int:
     return int(delta.total_seconds() // 86400)
 
 
+def _flush_states(session: Session, rows: list[dict[str, object]]) -> None:
+    # Recomputed features replace stored ones outright, NULLs (e.g. rest_days) included.
+    bulk_load(
+        session,
+        FootballTeamGameState,
+        rows,
+        constraint="uq_football_team_game_state_team_game",
+        coalesce_nulls=False,
+    )
+    rows.clear()
+
+
 def build_football_team_game_state_for_season(
     session: Session,
     *,
@@ -101,13 +114,14 @@ def build_football_team_game_state_for_season(
         )
         session.commit()
 
-    existing_stmt = select(FootballTeamGameState).where(
+    existing_stmt = select(FootballTeamGameState.team_id, FootballTeamGameState.game_id).where(
         FootballTeamGameState.season_id == season.id
     )
-    existing = list(session.execute(existing_stmt).scalars().all())
-    existing_by_team_game: dict[tuple[int, int], FootballTeamGameState] = {
-        (r.team_id, r.game_id): r for r in existing
+    existing_team_games: set[tuple[int, int]] = {
+        (team_id, game_id) for team_id, game_id in session.execute(existing_stmt)
     }
+    # State rows are buffered and bulk-upserted at each commit instead of one ORM object each.
+    pending_states: list[dict[str, object]] = []
 
     # Preload observed per-team stats in this season (optional; some games may be missing).
     tgs_stmt = (
@@ -224,16 +238,12 @@ def build_football_team_game_state_for_season(
                 "def_takeaways_season": def_takeaways_season,
             }
 
-            existing_row = existing_by_team_game.get((team_id, game.id))
-            if existing_row is None:
-                row = FootballTeamGameState(**state_values)
-                session.add(row)
-                existing_by_team_game[(team_id, game.id)] = row
-                states_created += 1
-            else:
-                for key, value in state_values.items():
-                    setattr(existing_row, key, value)
+            pending_states.append(state_values)
+            if (team_id, game.id) in existing_team_games:
                 states_updated += 1
+            else:
+                existing_team_games.add((team_id, game.id))
+                states_created += 1
 
         # After computing pregame state, add this game's final observed stats to history.
         if (
@@ -272,8 +282,10 @@ def build_football_team_game_state_for_season(
             history_by_team.setdefault(game.away_team_id, []).append(away_obs)
 
         if commit_every > 0 and idx % commit_every == 0:
+            _flush_states(session, pending_states)
             session.commit()
 
+    _flush_states(session, pending_states)
     session.commit()
 
     return BuildFootballTeamGameStateResult(
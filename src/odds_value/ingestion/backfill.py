@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import cache
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from odds_value.core.config import settings
+from odds_value.db import DatabaseConfig, create_db_engine, create_session_factory
+from odds_value.features.football.team_game_state_builder import (
+    BuildFootballTeamGameStateResult,
+    build_football_team_game_state_for_season,
+)
+from odds_value.ingestion.providers.api_sports.ingest.american_football_season import (
+    IngestAmericanFootballSeasonResult,
+    ingest_api_sports_american_football_season_streaming,
+)
+from odds_value.ingestion.providers.api_sports.ingest.american_football_team_game_stats import (
+    IngestAmericanFootballTeamGameStatsSeasonResult,
+    ingest_api_sports_american_football_team_game_stats_for_season,
+)
+
+# Stages run in this order for each season; features depend on games + team stats.
+BACKFILL_STAGES: tuple[str, ...] = ("games", "team-stats", "features")
+
+
+@dataclass(frozen=True)
+class SeasonBackfillTask:
+    league_key: str
+    season_year: int
+    stages: tuple[str, ...] = BACKFILL_STAGES
+    force: bool = False
+
+
+@dataclass(frozen=True)
+class SeasonBackfillResult:
+    league_key: str
+    season_year: int
+    elapsed_s: float
+    games: IngestAmericanFootballSeasonResult | None = None
+    team_stats: IngestAmericanFootballTeamGameStatsSeasonResult | None = None
+    features: BuildFootballTeamGameStateResult | None = None
+    failed_stage: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BackfillResult:
+    seasons: list[SeasonBackfillResult]
+    elapsed_s: float
+
+    @property
+    def failed(self) -> list[SeasonBackfillResult]:
+        return [s for s in self.seasons if not s.ok]
+
+    @property
+    def games_created(self) -> int:
+        return sum(s.games.games_created for s in self.seasons if s.games is not None)
+
+    @property
+    def team_game_stats_created(self) -> int:
+        return sum(
+            s.team_stats.team_game_stats_created for s in self.seasons if s.team_stats is not None
+        )
+
+    @property
+    def states_created(self) -> int:
+        return sum(s.features.states_created for s in self.seasons if s.features is not None)
+
+
+def season_backfill_tasks(
+    league_keys: Sequence[str],
+    from_season: int,
+    to_season: int,
+    *,
+    stages: Sequence[str] = BACKFILL_STAGES,
+    force: bool = False,
+) -> list[SeasonBackfillTask]:
+    unknown = set(stages) - set(BACKFILL_STAGES)
+    if unknown:
+        raise ValueError(f"Unknown backfill stages {sorted(unknown)} (expected {BACKFILL_STAGES})")
+    ordered = tuple(s for s in BACKFILL_STAGES if s in stages)
+    return [
+        SeasonBackfillTask(league_key=league_key, season_year=year, stages=ordered, force=force)
+        for league_key in league_keys
+        for year in range(from_season, to_season + 1)
+    ]
+
+
+@cache
+def _session_factory(database_url: str) -> sessionmaker[Session]:
+    # One engine per worker process, reused across the seasons it is handed.
+    return create_session_factory(
+        create_db_engine(DatabaseConfig(database_url=database_url, echo=settings.db_echo))
+    )
+
+
+def backfill_season(task: SeasonBackfillTask, *, database_url: str) -> SeasonBackfillResult:
+    """Run the task's stages for one season in a fresh session, committing after each stage.
+
+    A failing stage stops the remaining stages for that season; the error is recorded
+    rather than raised so sibling seasons keep going.
+    """
+
+    started = time.monotonic()
+    games: IngestAmericanFootballSeasonResult | None = None
+    team_stats: IngestAmericanFootballTeamGameStatsSeasonResult | None = None
+    features: BuildFootballTeamGameStateResult | None = None
+    failed_stage: str | None = None
+    error: str | None = None
+
+    session = _session_factory(database_url)()
+    try:
+        for stage in task.stages:
+            failed_stage = stage
+            if stage == "games":
+                games = ingest_api_sports_american_football_season_streaming(
+                    session,
+                    league_key=task.league_key,
+                    season_year=task.season_year,
+                    force=task.force,
+                )
+            elif stage == "team-stats":
+                team_stats = ingest_api_sports_american_football_team_game_stats_for_season(
+                    session,
+                    league_key=task.league_key,
+                    season_year=task.season_year,
+                    force=task.force,
+                )
+            elif stage == "features":
+                features = build_football_team_game_state_for_season(
+                    session,
+                    league_key=task.league_key,
+                    season_year=task.season_year,
+                )
+            session.commit()
+        failed_stage = None
+    except Exception as exc:
+        session.rollback()
+        error = f"{exc.__class__.__name__}: {str(exc).strip() or exc.__class__.__name__}"
+    finally:
+        session.close()
+
+    return SeasonBackfillResult(
+        league_key=task.league_key,
+        season_year=task.season_year,
+        elapsed_s=time.monotonic() - started,
+        games=games,
+        team_stats=team_stats,
+        features=features,
+        failed_stage=failed_stage,
+        error=error,
+    )
+
+
+def _init_worker(rate_limit_backend: str) -> None:
+    settings.rate_limit_backend = rate_limit_backend
+
+
+def backfill_seasons(
+    tasks: Sequence[SeasonBackfillTask],
+    *,
+    workers: int = 1,
+    database_url: str | None = None,
+) -> BackfillResult:
+    """Backfill many seasons, fanning seasons out over a process pool.
+
+    Each worker process opens its own engine/session. The in-memory rate limiter is
+    per-process, so with more than one worker the limiter is switched to the shared
+    SQLite backend (unless a shared backend is already configured) and every worker
+    draws from one provider budget.
+    """
+
+    started = time.monotonic()
+    database_url = database_url or settings.database_url
+
+    results: list[SeasonBackfillResult] = []
+    if workers <= 1 or len(tasks) <= 1:
+        results = [backfill_season(task, database_url=database_url) for task in tasks]
+    else:
+        rate_limit_backend = settings.rate_limit_backend
+        if rate_limit_backend.lower() == "memory":
+            rate_limit_backend = "sqlite"
+        # spawn: never inherit open DB connections or HTTP pools from the parent.
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(rate_limit_backend,),
+        ) as pool:
+            futures = [
+                pool.submit(backfill_season, task, database_url=database_url) for task in tasks
+            ]
+            results = [f.result() for f in as_completed(futures)]
+
+    results.sort(key=lambda r: (r.league_key, r.season_year))
+    return BackfillResult(seasons=results, elapsed_s=time.monotonic() - started)
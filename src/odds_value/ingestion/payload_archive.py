@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import gzip
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.orm import Session
+
+from odds_value.core.json_codec import default_json_decoder, default_json_encoder
+from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
+from odds_value.db.models.ingestion.payload_body import PayloadBody
+
+# Partition files: <root>/provider=<p>/entity_type=<e>/date=<YYYY-MM-DD>/part-<run>.jsonl.gz
+ARCHIVE_SUFFIX = ".jsonl.gz"
+
+# Keep IN (...) lists well under driver parameter limits.
+_DELETE_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class ArchivedPayload:
+    provider: str
+    entity_type: str
+    entity_key: str
+    fetched_at: datetime
+    content_hash: str
+    payload: Any
+
+
+@dataclass
+class ArchiveExportResult:
+    partitions: int = 0
+    payloads_archived: int = 0
+    bodies_deleted: int = 0
+    files: list[Path] = field(default_factory=list)
+
+
+def _partition_dir(root: Path, provider: str, entity_type: str, day: date) -> Path:
+    return root / f"provider={provider}" / f"entity_type={entity_type}" / f"date={day.isoformat()}"
+
+
+def _naive_utc(dt: datetime) -> datetime:
+    # fetched_at is stored as naive UTC.
+    return dt if dt.tzinfo is None else dt.astimezone(UTC).replace(tzinfo=None)
+
+
+def _as_date(value: object) -> date:
+    # func.date() yields a date on Postgres and an ISO string on SQLite.
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+
+def _archive_partitions(session: Session, *, before: datetime) -> list[tuple[str, str, date]]:
+    day = func.date(IngestedPayload.fetched_at)
+    rows = session.execute(
+        select(IngestedPayload.provider, IngestedPayload.entity_type, day)
+        .distinct()
+        .where(IngestedPayload.fetched_at < before)
+        .order_by(IngestedPayload.provider, IngestedPayload.entity_type, day)
+    ).all()
+    return [(provider, entity_type, _as_date(d)) for provider, entity_type, d in rows]
+
+
+def _write_partition(path: Path, lines: Iterator[str]) -> int:
+    # Written under a temp name and renamed once complete, so readers never see partial files.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    written = 0
+    with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+        for line in lines:
+            fh.write(line)
+            fh.write("\n")
+            written += 1
+    os.replace(tmp, path)
+    return written
+
+
+def _delete_archived(session: Session, ids: list[int], hashes: set[str]) -> int:
+    for i in range(0, len(ids), _DELETE_CHUNK):
+        session.execute(
+            delete(IngestedPayload).where(IngestedPayload.id.in_(ids[i : i + _DELETE_CHUNK]))
+        )
+
+    # Bodies are shared across rows; only drop the ones nothing references any more.
+    referenced = exists().where(IngestedPayload.content_hash == PayloadBody.content_hash)
+    unique = sorted(hashes)
+    deleted = 0
+    for i in range(0, len(unique), _DELETE_CHUNK):
+        res = session.execute(
+            delete(PayloadBody).where(
+                PayloadBody.content_hash.in_(unique[i : i + _DELETE_CHUNK]), ~referenced
+            )
+        )
+        deleted += int(getattr(res, "rowcount", 0) or 0)
+    return deleted
+
+
+def export_ingested_payloads(
+    session: Session,
+    *,
+    root: Path,
+    older_than: datetime,
+    now: datetime | None = None,
+) -> ArchiveExportResult:
+    """Move `IngestedPayload` rows fetched before `older_than` into gzip JSONL partition files.
+
+    One file per provider/entity_type/UTC day and run. Each partition is written and
+    renamed into place before its rows (and any bodies left unreferenced) are deleted and
+    committed, so an interrupted run loses nothing; at worst a rerun writes a second part
+    file holding rows that were already archived.
+    """
+
+    older_than = _naive_utc(older_than)
+    run = (now or datetime.now()).strftime("%Y%m%dT%H%M%S")
+    encode = default_json_encoder()
+    result = ArchiveExportResult()
+
+    for provider, entity_type, day in _archive_partitions(session, before=older_than):
+        start = datetime.combine(day, time())
+        end = min(start + timedelta(days=1), older_than)
+        rows = session.execute(
+            select(IngestedPayload, PayloadBody.payload_json, PayloadBody.payload_compressed)
+            .join(PayloadBody, PayloadBody.content_hash == IngestedPayload.content_hash)
+            .where(
+                IngestedPayload.provider == provider,
+                IngestedPayload.entity_type == entity_type,
+                IngestedPayload.fetched_at >= start,
+                IngestedPayload.fetched_at < end,
+            )
+            .order_by(IngestedPayload.fetched_at, IngestedPayload.id)
+        ).all()
+        if not rows:
+            continue
+
+        path = _partition_dir(root, provider, entity_type, day) / f"part-{run}{ARCHIVE_SUFFIX}"
+        written = _write_partition(
+            path,
+            (
+                encode(
+                    {
+                        "entity_key": row.entity_key,
+                        "fetched_at": row.fetched_at.isoformat(),
+                        "content_hash": row.content_hash,
+                        "payload": plain if plain is not None else packed,
+                    }
+                )
+                for row, plain, packed in rows
+            ),
+        )
+        result.bodies_deleted += _delete_archived(
+            session,
+            [row.id for row, _, _ in rows],
+            {row.content_hash for row, _, _ in rows},
+        )
+        session.commit()
+
+        result.partitions += 1
+        result.payloads_archived += written
+        result.files.append(path)
+
+    return result
+
+
+def _partition_value(path: Path, key: str) -> str:
+    prefix = f"{key}="
+    if not path.name.startswith(prefix):
+        raise ValueError(f"Not a {key} partition directory: {path}")
+    return path.name[len(prefix) :]
+
+
+def iter_archived_payloads(
+    root: Path,
+    *,
+    provider: str | None = None,
+    entity_type: str | None = None,
+    since: date | None = None,
+    until: date | None = None,
+) -> Iterator[ArchivedPayload]:
+    """Read archived payloads back, in partition date order (`since`/`until` inclusive)."""
+
+    decode = default_json_decoder()
+    provider_glob = f"provider={provider}" if provider else "provider=*"
+    entity_glob = f"entity_type={entity_type}" if entity_type else "entity_type=*"
+
+    for entity_dir in sorted(root.glob(f"{provider_glob}/{entity_glob}")):
+        p = _partition_value(entity_dir.parent, "provider")
+        e = _partition_value(entity_dir, "entity_type")
+        for day_dir in sorted(entity_dir.glob("date=*")):
+            day = date.fromisoformat(_partition_value(day_dir, "date"))
+            if (since is not None and day < since) or (until is not None and day > until):
+                continue
+            for path in sorted(day_dir.glob(f"part-*{ARCHIVE_SUFFIX}")):
+                with gzip.open(path, "rb") as fh:
+                    for line in fh:
+                        record = decode(line)
+                        assert isinstance(record, dict)
+                        yield ArchivedPayload(
+                            provider=p,
+                            entity_type=e,
+                            entity_key=record["entity_key"],
+                            fetched_at=datetime.fromisoformat(record["fetched_at"]),
+                            content_hash=record["content_hash"],
+                            payload=record["payload"],
+                        )
@@ -1,23 +1,56 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from datetime import UTC, date, timedelta
 from typing import Any
 
 from odds_value.db.enums import ProviderEnum
+from odds_value.ingestion.dates import parse_api_sports_game_datetime
 from odds_value.ingestion.providers.api_sports.client import ApiSportsClient
+from odds_value.ingestion.providers.api_sports.normalize import normalize_american_football_games
 from odds_value.ingestion.providers.base.adapter import ProviderAdapter
 from odds_value.ingestion.providers.base.errors import ProviderCapabilityError
 from odds_value.ingestion.providers.base.types import EntityBundle, IngestQuery
 
 
+def _parse_date(value: str | None, *, name: str) -> date | None:
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError as exc:
+        raise ProviderCapabilityError(f"query.{name} must be YYYY-MM-DD, got {value!r}") from exc
+
+
+def _item_day(item: dict[str, Any]) -> date | None:
+    game_obj = item.get("game")
+    if not isinstance(game_obj, dict):
+        return None
+    try:
+        start_time = parse_api_sports_game_datetime(
+            game_obj.get("date"), provider_game_id=str(game_obj.get("id"))
+        )
+    except ValueError:
+        return None
+    return start_time.astimezone(UTC).date()
+
+
 @dataclass(frozen=True)
 class ApiSportsFootballAdapter(ProviderAdapter):
     """
     API-Sports "american-football" adapter (NFL/NCAAF/etc).
+
+    Supported queries:
+      - provider_game_id: one `/games?id=` request
+      - season_year (optionally narrowed by date_from/date_to): one season request
+      - date_from/date_to without a season: one `/games?league=&date=` request per day
     """
 
     client: ApiSportsClient
     league_key: str
+    # API-Sports league id; required for season and date-range queries.
+    provider_league_id: str | None = None
     provider_key: str = ProviderEnum.API_SPORTS.value
 
     def fetch_entities(self, query: IngestQuery) -> EntityBundle:
@@ -26,21 +59,49 @@ class ApiSportsFootballAdapter(ProviderAdapter):
                 f"Adapter is for league_key={self.league_key}, got {query.league_key}"
             )
 
-        game_id = getattr(query, "provider_game_id", None)
-        if game_id is None:
-            raise ProviderCapabilityError(
-                "ApiSportsFootballAdapter requires query.provider_game_id for now "
-                "(we'll add date-range ingestion next)."
+        return normalize_american_football_games(
+            self._fetch_items(query), league_key=self.league_key
+        )
+
+    def _fetch_items(self, query: IngestQuery) -> Iterator[dict[str, Any]]:
+        if query.provider_game_id is not None:
+            yield from self.client.get_response_items(
+                "/games", params={"id": str(query.provider_game_id)}
             )
+            return
 
-        items = self.client.get_response_items("/games", params={"id": str(game_id)})
+        date_from = _parse_date(query.date_from, name="date_from")
+        date_to = _parse_date(query.date_to, name="date_to")
+        if query.season_year is None and date_from is None:
+            raise ProviderCapabilityError(
+                "ApiSportsFootballAdapter requires provider_game_id, season_year or date_from"
+            )
+        if self.provider_league_id is None:
+            raise ProviderCapabilityError(
+                f"No API-Sports league id configured for league_key={self.league_key}"
+            )
 
-        return EntityBundle(
-            leagues=[],
-            seasons=[],
-            teams=[],
-            games=[self._raw_game_to_payload(i) for i in items],
-        )
+        if query.season_year is not None:
+            # One request covers the whole season; narrow to the date range in memory.
+            for item in self.client.iter_response_items(
+                "/games",
+                params={"league": self.provider_league_id, "season": str(query.season_year)},
+            ):
+                if date_from is None and date_to is None:
+                    yield item
+                    continue
+                day = _item_day(item)
+                if day is None:
+                    continue
+                if (date_from is None or day >= date_from) and (date_to is None or day <= date_to):
+                    yield item
+            return
 
-    def _raw_game_to_payload(self, item: dict[str, Any]) -> dict[str, Any]:
-        return {"provider": self.provider_key, "league_key": self.league_key, "raw": item}
+        assert date_from is not None
+        day = date_from
+        last = date_to or date_from
+        while day <= last:
+            yield from self.client.iter_response_items(
+                "/games", params={"league": self.provider_league_id, "date": day.isoformat()}
+            )
+            day += timedelta(days=1)
@@ -1,12 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import threading
 import time
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
-from odds_value.ingestion.providers.base.client import BaseHttpClient
-from odds_value.ingestion.providers.base.errors import ProviderRateLimited, ProviderResponseError
+from odds_value.core.config import settings
+from odds_value.core.json_codec import default_json_decoder, iter_json_array
+from odds_value.ingestion.providers.base.cache import CACHE_STATUS_HEADER, CacheRule
+from odds_value.ingestion.providers.base.client import AsyncBaseHttpClient, BaseHttpClient
+from odds_value.ingestion.providers.base.errors import ProviderResponseError
+from odds_value.ingestion.providers.base.rate_limit import (
+    RateLimitBackend,
+    rate_limit_backend_from_settings,
+)
+
+
+def _cacheable_body(content: bytes) -> bool:
+    """Only bodies with data and no `errors` may be cached.
+
+    API-Sports reports quota/rate-limit errors with HTTP 200, and returns `response: []`
+    for stats that are not published yet; caching either would pin it forever.
+    """
+
+    try:
+        payload = default_json_decoder()(content)
+    except ValueError:
+        return False
+    return (
+        isinstance(payload, dict)
+        and not payload.get("errors")
+        and isinstance(payload.get("response"), list)
+        and bool(payload["response"])
+    )
+
+
+# Team stats are only fetched for FINAL games and never change afterwards.
+API_SPORTS_CACHE_RULES: tuple[CacheRule, ...] = (
+    CacheRule("/games/statistics", ttl_s=None, cacheable=_cacheable_body),
+)
 
 
 def _parse_int(value: str | None) -> int | None:
@@ -18,6 +53,20 @@ def _parse_int(value: str | None) -> int | None:
         return None
 
 
+def _check_errors(data: dict[str, Any]) -> dict[str, Any]:
+    errors = data.get("errors") or []
+    if errors:
+        raise ProviderResponseError(f"api-sports returned errors: {errors}")
+    return data
+
+
+def _response_items(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    items = payload.get("response")
+    if not isinstance(items, list):
+        raise TypeError(f"Expected 'response' list, got: {type(items)}")
+    return [i for i in items if isinstance(i, dict)]
+
+
 @dataclass
 class ApiSportsRateLimiter:
     """Proactive throttling based on API-Sports rate limit headers.
@@ -32,19 +81,19 @@ class ApiSportsRateLimiter:
 
     _sleep: Any = field(default=time.sleep, repr=False)
     _monotonic: Any = field(default=time.monotonic, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def pacing_delay_s(self) -> float:
+        """Seconds to wait before the next request to respect `min_interval_s`."""
+
+        if self.min_interval_s <= 0.0 or self.last_request_monotonic is None:
+            return 0.0
+        elapsed = float(self._monotonic()) - self.last_request_monotonic
+        return max(0.0, self.min_interval_s - elapsed)
+
+    def observe_headers(self, headers: Mapping[str, str]) -> float:
+        """Update pacing from response headers and return the cooldown to apply."""
 
-    def before_request(self) -> None:
-        if self.min_interval_s <= 0.0:
-            return
-        now = float(self._monotonic())
-        if self.last_request_monotonic is None:
-            return
-        elapsed = now - self.last_request_monotonic
-        remaining = self.min_interval_s - elapsed
-        if remaining > 0:
-            self._sleep(remaining)
-
-    def after_response(self, headers: Mapping[str, str]) -> None:
         # Update pacing based on plan limit.
         limit = _parse_int(headers.get("X-RateLimit-Limit"))
         remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
@@ -57,52 +106,224 @@ class ApiSportsRateLimiter:
         if remaining is not None and remaining <= self.minute_limit_low_watermark:
             # With no explicit reset header, the safest practical cooldown is a
             # full minute when we are at/near zero.
-            cooldown = 60.0 if remaining <= 1 else 10.0
-            self._sleep(cooldown)
+            return 60.0 if remaining <= 1 else 10.0
+        return 0.0
 
+    def mark_request(self) -> None:
         self.last_request_monotonic = float(self._monotonic())
 
+    def before_request(self) -> float:
+        """Sleep until the next request may be sent; returns the seconds slept.
+
+        Thread-safe: the send time is marked under a lock, so concurrent fetch workers
+        sharing a limiter stay `min_interval_s` apart.
+        """
+
+        with self._lock:
+            delay = self.pacing_delay_s()
+            if delay > 0:
+                self._sleep(delay)
+            self.mark_request()
+        return max(0.0, delay)
+
+    def after_response(self, headers: Mapping[str, str]) -> float:
+        """Apply rate-limit headers; sleeps out any cooldown and returns the seconds slept.
+
+        Holds the same lock as `before_request`: pacing state is shared by fetch workers,
+        and the cooldown also holds back their next requests.
+        """
+
+        with self._lock:
+            cooldown = self.observe_headers(headers)
+            if cooldown > 0:
+                self._sleep(cooldown)
+            self.mark_request()
+        return max(0.0, cooldown)
+
+
+@dataclass
+class SharedApiSportsRateLimiter(ApiSportsRateLimiter):
+    """Token-bucket limiter whose budget lives in a `RateLimitBackend`.
+
+    Every process using the same `bucket_key` draws from one bucket refilled at the plan
+    rate, and `X-RateLimit-Remaining` seen by any of them caps the shared balance.
+    Until the plan limit is known from headers it paces like the in-process limiter.
+    """
+
+    backend: RateLimitBackend | None = None
+    bucket_key: str = "api_sports"
+    burst: float = 5.0
+
+    def pacing_delay_s(self) -> float:
+        """Reserve a slot in the shared bucket and return the wait before using it."""
+
+        if self.backend is None or self.min_interval_s <= 0.0:
+            return super().pacing_delay_s()
+        return self.backend.reserve(
+            self.bucket_key, rate_per_s=1.0 / self.min_interval_s, burst=self.burst
+        )
+
+    def observe_headers(self, headers: Mapping[str, str]) -> float:
+        if self.backend is None:
+            return super().observe_headers(headers)
+
+        limit = _parse_int(headers.get("X-RateLimit-Limit"))
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+
+        if limit and limit > 0:
+            self.min_interval_s = max(self.min_interval_s, 60.0 / float(limit))
+
+        if remaining is not None:
+            # The cooldown is recorded in the shared bucket, so every process waits
+            # on its next reservation instead of sleeping here.
+            self.backend.observe(
+                self.bucket_key,
+                remaining=remaining,
+                low_watermark=self.minute_limit_low_watermark,
+                burst=self.burst,
+                cooldown_s=60.0 if remaining <= 1 else 10.0,
+            )
+        return 0.0
+
+
+def api_sports_rate_limiter_from_settings() -> ApiSportsRateLimiter:
+    """In-process limiter by default; shared when `RATE_LIMIT_BACKEND` is configured."""
+
+    backend = rate_limit_backend_from_settings()
+    if backend is None:
+        return ApiSportsRateLimiter()
+
+    key_hash = hashlib.sha256((settings.api_sports_key or "").encode("utf-8")).hexdigest()
+    return SharedApiSportsRateLimiter(backend=backend, bucket_key=f"api_sports:{key_hash[:16]}")
+
 
 @dataclass
 class ApiSportsClient:
     http: BaseHttpClient
     api_key: str
-    rate_limiter: ApiSportsRateLimiter = field(default_factory=ApiSportsRateLimiter)
+    rate_limiter: ApiSportsRateLimiter = field(
+        default_factory=api_sports_rate_limiter_from_settings
+    )
 
     def _headers(self) -> dict[str, str]:
         return {"x-apisports-key": self.api_key}
 
+    def _served_without_request(self, path: str, params: Mapping[str, Any] | None) -> bool:
+        return self.http.is_cached(path, params) or self.http.is_in_flight(
+            path, params, self._headers()
+        )
+
+    def _before_request(self, path: str, params: Mapping[str, Any] | None) -> None:
+        # Proactively pace requests based on most recently observed limit; cache
+        # hits and calls joining an identical in-flight request don't touch the
+        # provider, so they skip pacing entirely.
+        if not self._served_without_request(path, params):
+            slept = self.rate_limiter.before_request()
+            self.http.record_sleep(path, slept, reason="rate_limit")
+
+    def _after_response(self, path: str, headers: Mapping[str, str]) -> None:
+        if CACHE_STATUS_HEADER not in headers:
+            slept = self.rate_limiter.after_response(headers)
+            self.http.record_sleep(path, slept, reason="rate_limit")
+
     def get(self, path: str, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
-        # Proactively pace requests based on most recently observed limit.
-        self.rate_limiter.before_request()
-
-        # Basic retry on minute-bucket throttling.
-        attempts = 0
-        while True:
-            attempts += 1
-            try:
-                data, headers = self.http.get_json_with_headers(
-                    path, params=params, headers=self._headers()
-                )
-                self.rate_limiter.after_response(headers)
-                break
-            except ProviderRateLimited:
-                # No reset header is guaranteed; sleep a full bucket and retry.
-                if attempts >= 5:
-                    raise
-                time.sleep(60.0)
-
-        errors = data.get("errors") or []
-        if errors:
-            raise ProviderResponseError(f"api-sports returned errors: {errors}")
-
-        return data
+        self._before_request(path, params)
+        # 429s are retried by the HTTP client's RetryPolicy (Retry-After or a full bucket).
+        data, headers = self.http.get_json_with_headers(
+            path, params=params, headers=self._headers()
+        )
+        self._after_response(path, headers)
+        return _check_errors(data)
 
     def get_response_items(
         self, path: str, params: Mapping[str, Any] | None = None
     ) -> list[dict[str, Any]]:
-        payload = self.get(path, params=params)
-        items = payload.get("response")
-        if not isinstance(items, list):
-            raise TypeError(f"Expected 'response' list, got: {type(items)}")
-        return [i for i in items if isinstance(i, dict)]
+        return _response_items(self.get(path, params=params))
+
+    def iter_response_items(
+        self, path: str, params: Mapping[str, Any] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Like `get_response_items`, but yields items as the body is parsed.
+
+        With the optional `ijson` package only one item is decoded at a time.
+        """
+
+        self._before_request(path, params)
+        raw, headers = self.http.get_bytes_with_headers(
+            path, params=params, headers=self._headers()
+        )
+        self._after_response(path, headers)
+
+        empty = True
+        try:
+            for item in iter_json_array(raw, "response", decoder=self.http.json_decoder):
+                empty = False
+                if isinstance(item, dict):
+                    yield item
+        except ValueError as e:
+            payload = self.http.decode_json(raw)
+            if isinstance(payload, dict):
+                _check_errors(payload)
+            raise TypeError(f"Expected 'response' list: {e}") from e
+        if empty:
+            # Provider errors come with an empty `response`; those bodies are tiny.
+            payload = self.http.decode_json(raw)
+            if isinstance(payload, dict):
+                _check_errors(payload)
+
+
+@dataclass
+class AsyncApiSportsClient:
+    """Async API-Sports client with a bounded number of in-flight requests.
+
+    Pacing state is shared with the sync client via `ApiSportsRateLimiter`, but sleeps
+    are awaited so other requests keep making progress.
+    """
+
+    http: AsyncBaseHttpClient
+    api_key: str
+    rate_limiter: ApiSportsRateLimiter = field(
+        default_factory=api_sports_rate_limiter_from_settings
+    )
+    max_in_flight: int = 4
+
+    def __post_init__(self) -> None:
+        if self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._pacing_lock = asyncio.Lock()
+
+    def _headers(self) -> dict[str, str]:
+        return {"x-apisports-key": self.api_key}
+
+    def _served_without_request(self, path: str, params: Mapping[str, Any] | None) -> bool:
+        return self.http.is_cached(path, params) or self.http.is_in_flight(
+            path, params, self._headers()
+        )
+
+    async def _before_request(self, path: str) -> None:
+        # Serialize pacing so concurrent tasks reserve distinct request slots.
+        async with self._pacing_lock:
+            delay = self.rate_limiter.pacing_delay_s()
+            if delay > 0:
+                await self.http.sleep_for(path, delay, reason="rate_limit")
+            self.rate_limiter.mark_request()
+
+    async def get(self, path: str, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        async with self._semaphore:
+            if not self._served_without_request(path, params):
+                await self._before_request(path)
+            data, headers = await self.http.get_json_with_headers(
+                path, params=params, headers=self._headers()
+            )
+            if CACHE_STATUS_HEADER not in headers:
+                cooldown = self.rate_limiter.observe_headers(headers)
+                if cooldown > 0:
+                    await self.http.sleep_for(path, cooldown, reason="rate_limit")
+
+        return _check_errors(data)
+
+    async def get_response_items(
+        self, path: str, params: Mapping[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        return _response_items(await self.get(path, params=params))
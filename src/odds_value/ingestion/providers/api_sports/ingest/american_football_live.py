@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from odds_value.core.config import settings
+from odds_value.db.enums import GameStatusEnum, ProviderEnum
+from odds_value.db.models.core.game import Game
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.season import Season
+from odds_value.db.repos.core.league_repo import LeagueRepository
+from odds_value.ingestion.providers.api_sports.client import ApiSportsClient
+from odds_value.ingestion.providers.api_sports.ingest.american_football_season import (
+    ApiItem,
+    ingest_api_sports_american_football_season,
+)
+from odds_value.ingestion.providers.api_sports.ingest.lookups import (
+    get_api_sports_base_url,
+    get_api_sports_provider_league_id,
+)
+from odds_value.ingestion.providers.base.client_registry import shared_http_client
+
+# Upper bound on how long a game runs; a game that kicked off this long before the window
+# may still be finishing inside it.
+GAME_DURATION = timedelta(hours=4)
+
+# Statuses that never change again without a new schedule; never refreshed.
+_SETTLED_STATUSES = (GameStatusEnum.FINAL, GameStatusEnum.CANCELED)
+
+
+@dataclass(frozen=True)
+class LiveGame:
+    provider_game_id: str
+    season_year: int
+    start_time: datetime
+    status: GameStatusEnum
+
+
+@dataclass(frozen=True)
+class IngestAmericanFootballLiveResult:
+    league_key: str
+    candidates: int
+    requests: int
+    seasons: tuple[int, ...]
+    games_seen: int = 0
+    games_created: int = 0
+    games_updated: int = 0
+    games_unchanged: int = 0
+
+
+def select_live_games(
+    session: Session,
+    *,
+    league_key: str,
+    now: datetime,
+    lookback_hours: float = 6.0,
+    lookahead_hours: float = 2.0,
+) -> list[LiveGame]:
+    """API-Sports games of a league that may have changed around `now`.
+
+    - in progress (whatever their start time, so stuck games are picked up)
+    - not yet settled and kicking off within `lookahead_hours`, or kicked off recently
+      enough to still be running within the last `lookback_hours`
+    - final, with the final result first seen within the last `lookback_hours`
+      (`source_last_seen_at` only moves when the provider item changes), to pick up
+      late score corrections
+    """
+
+    league = LeagueRepository(session).one_where(League.league_key == league_key)
+    lookback = timedelta(hours=lookback_hours)
+
+    rows = session.execute(
+        select(Game.provider_game_id, Season.year, Game.start_time, Game.status)
+        .join(Season, Season.id == Game.season_id)
+        .where(
+            Game.league_id == league.id,
+            Game.provider == ProviderEnum.API_SPORTS,
+            or_(
+                Game.status == GameStatusEnum.IN_PROGRESS,
+                and_(
+                    Game.status.not_in(_SETTLED_STATUSES),
+                    Game.start_time >= now - lookback - GAME_DURATION,
+                    Game.start_time <= now + timedelta(hours=lookahead_hours),
+                ),
+                and_(
+                    Game.status == GameStatusEnum.FINAL,
+                    Game.source_last_seen_at >= now - lookback,
+                ),
+            ),
+        )
+        .order_by(Game.start_time, Game.id)
+    ).all()
+
+    return [
+        LiveGame(provider_game_id=pgid, season_year=year, start_time=start, status=status)
+        for pgid, year, start, status in rows
+    ]
+
+
+def _game_date(start_time: datetime) -> date:
+    # SQLite hands back naive datetimes; stored values are UTC either way.
+    if start_time.tzinfo is not None:
+        start_time = start_time.astimezone(UTC)
+    return start_time.date()
+
+
+def ingest_api_sports_american_football_live(
+    session: Session,
+    *,
+    league_key: str,
+    now: datetime | None = None,
+    lookback_hours: float = 6.0,
+    lookahead_hours: float = 2.0,
+    per_game_max: int = 2,
+) -> IngestAmericanFootballLiveResult:
+    """Refresh only the games of a league inside the live window (see `select_live_games`).
+
+    Candidates are grouped by season and UTC game date. A date with at most `per_game_max`
+    candidates is fetched with one `/games?id=` request per game; busier dates use a single
+    `/games?league=&season=&date=` request. Seasons without candidates cost no requests.
+    Fetched items go through the regular season upsert, so unchanged games are skipped by
+    content hash.
+    """
+
+    now = now or datetime.now(tz=UTC)
+    candidates = select_live_games(
+        session,
+        league_key=league_key,
+        now=now,
+        lookback_hours=lookback_hours,
+        lookahead_hours=lookahead_hours,
+    )
+    if not candidates:
+        return IngestAmericanFootballLiveResult(
+            league_key=league_key, candidates=0, requests=0, seasons=()
+        )
+
+    by_season_date: dict[tuple[int, date], list[LiveGame]] = defaultdict(list)
+    for game in candidates:
+        by_season_date[(game.season_year, _game_date(game.start_time))].append(game)
+
+    base_url = get_api_sports_base_url(session)
+    provider_league_id = get_api_sports_provider_league_id(session, league_key=league_key)
+    api_key = settings.require_api_sports_key()
+
+    items_by_season: dict[int, list[ApiItem]] = defaultdict(list)
+    requests = 0
+    http = shared_http_client(base_url)
+    client = ApiSportsClient(http=http, api_key=api_key)
+    try:
+        for (season_year, game_date), games in sorted(by_season_date.items()):
+            if len(games) <= per_game_max:
+                for game in games:
+                    items_by_season[season_year].extend(
+                        client.get_response_items("/games", params={"id": game.provider_game_id})
+                    )
+                    requests += 1
+            else:
+                items_by_season[season_year].extend(
+                    client.get_response_items(
+                        "/games",
+                        params={
+                            "league": provider_league_id,
+                            "season": str(season_year),
+                            "date": game_date.isoformat(),
+                        },
+                    )
+                )
+                requests += 1
+    finally:
+        http.close()
+
+    games_seen = games_created = games_updated = games_unchanged = 0
+    for season_year, items in sorted(items_by_season.items()):
+        result = ingest_api_sports_american_football_season(
+            session, league_key=league_key, season_year=season_year, items=items
+        )
+        games_seen += result.games_seen
+        games_created += result.games_created
+        games_updated += result.games_updated
+        games_unchanged += result.games_unchanged
+
+    return IngestAmericanFootballLiveResult(
+        league_key=league_key,
+        candidates=len(candidates),
+        requests=requests,
+        seasons=tuple(sorted(items_by_season)),
+        games_seen=games_seen,
+        games_created=games_created,
+        games_updated=games_updated,
+        games_unchanged=games_unchanged,
+    )
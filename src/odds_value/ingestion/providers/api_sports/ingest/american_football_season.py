@@ -1,39 +1,59 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from odds_value.core.config import settings
-from odds_value.db.enums import GameStatusEnum, ProviderEnum, SportEnum
+from odds_value.db.enums import ProviderEnum
 from odds_value.db.models.core.game import Game
 from odds_value.db.models.core.league import League
-from odds_value.db.models.core.provider_league import ProviderLeague
-from odds_value.db.models.core.provider_sport import ProviderSport
 from odds_value.db.models.core.provider_team import ProviderTeam
 from odds_value.db.models.core.season import Season
 from odds_value.db.models.core.team import Team
 from odds_value.db.models.core.team_alias import TeamAlias
 from odds_value.db.models.core.venue import Venue
-from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
 from odds_value.db.repos.core.game_repo import GameRepository
 from odds_value.db.repos.core.league_repo import LeagueRepository
-from odds_value.db.repos.core.provider_league_repo import ProviderLeagueRepository
-from odds_value.db.repos.core.provider_sport_repo import ProviderSportRepository
 from odds_value.db.repos.core.provider_team_repo import ProviderTeamRepository
 from odds_value.db.repos.core.season_repo import SeasonRepository
 from odds_value.db.repos.core.team_alias_repo import TeamAliasRepository
 from odds_value.db.repos.core.team_repo import TeamRepository
 from odds_value.db.repos.core.venue_repo import VenueRepository
-from odds_value.ingestion.dates import parse_api_sports_game_datetime
+from odds_value.db.repos.ingestion.ingested_payload_repo import IngestedPayloadRepository
 from odds_value.ingestion.football.nfl_calendar import in_nfl_regular_season_window
 from odds_value.ingestion.providers.api_sports.client import ApiSportsClient
-from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.providers.api_sports.ingest.lookups import (
+    get_api_sports_base_url,
+    get_api_sports_provider_league_id,
+)
+from odds_value.ingestion.providers.api_sports.normalize import normalize_american_football_games
+from odds_value.ingestion.providers.base.client_registry import shared_http_client
 
 ApiItem = dict[str, Any]
 
+# Keep IN (...) lists well under driver parameter limits.
+_GAME_ID_CHUNK = 500
+
+_GAME_UPDATE_COLS = (
+    "league_id",
+    "season_id",
+    "start_time",
+    "venue_id",
+    "status",
+    "home_team_id",
+    "away_team_id",
+    "home_score",
+    "away_score",
+    "source_last_seen_at",
+    "source_hash",
+)
+
 
 @dataclass(frozen=True)
 class IngestAmericanFootballSeasonResult:
@@ -44,45 +64,7 @@ class IngestAmericanFootballSeasonResult:
     games_updated: int
     teams_created: int
     venues_created: int
-
-
-def _map_status(short: str | None) -> GameStatusEnum:
-    if not short:
-        return GameStatusEnum.UNKNOWN
-
-    s = short.upper()
-
-    if s in {"NS"}:
-        return GameStatusEnum.SCHEDULED
-    if s in {"FT", "AOT", "FINAL"}:
-        return GameStatusEnum.FINAL
-    if s in {"PST", "PPD"}:
-        return GameStatusEnum.POSTPONED
-    if s in {"CANC", "CAN", "ABD"}:
-        return GameStatusEnum.CANCELED
-
-    return GameStatusEnum.IN_PROGRESS
-
-
-def _get_api_sports_base_url(session: Session) -> str:
-    provider_sport_repo = ProviderSportRepository(session)
-    row = provider_sport_repo.one_where(
-        ProviderSport.provider == ProviderEnum.API_SPORTS,
-        ProviderSport.sport == SportEnum.FOOTBALL,
-    )
-    return row.base_url
-
-
-def _get_api_sports_provider_league_id(session: Session, *, league_key: str) -> str:
-    league_repo = LeagueRepository(session)
-    provider_league_repo = ProviderLeagueRepository(session)
-
-    league = league_repo.one_where(League.league_key == league_key)
-    pl = provider_league_repo.one_where(
-        ProviderLeague.provider == ProviderEnum.API_SPORTS,
-        ProviderLeague.league_id == league.id,
-    )
-    return pl.provider_league_id
+    games_unchanged: int = 0
 
 
 def fetch_api_sports_american_football_games_for_season(
@@ -97,12 +79,12 @@ def fetch_api_sports_american_football_games_for_season(
     corresponds to API-Sports' american-football base URL.
     """
 
-    base_url = _get_api_sports_base_url(session)
-    provider_league_id = _get_api_sports_provider_league_id(session, league_key=league_key)
+    base_url = get_api_sports_base_url(session)
+    provider_league_id = get_api_sports_provider_league_id(session, league_key=league_key)
 
     api_key = settings.require_api_sports_key()
 
-    http = BaseHttpClient(base_url=base_url)
+    http = shared_http_client(base_url)
     client = ApiSportsClient(http=http, api_key=api_key)
     try:
         return client.get_response_items(
@@ -113,14 +95,109 @@ def fetch_api_sports_american_football_games_for_season(
         http.close()
 
 
+def iter_api_sports_american_football_games_for_season(
+    session: Session,
+    *,
+    league_key: str,
+    season_year: int,
+) -> Iterator[ApiItem]:
+    """Streaming variant of `fetch_api_sports_american_football_games_for_season`."""
+
+    base_url = get_api_sports_base_url(session)
+    provider_league_id = get_api_sports_provider_league_id(session, league_key=league_key)
+
+    api_key = settings.require_api_sports_key()
+
+    http = shared_http_client(base_url)
+    client = ApiSportsClient(http=http, api_key=api_key)
+    try:
+        yield from client.iter_response_items(
+            "/games",
+            params={"league": provider_league_id, "season": str(season_year)},
+        )
+    finally:
+        http.close()
+
+
+@dataclass
+class _SeasonDimensions:
+    """Rows an API-Sports season ingest resolves against, keyed for in-memory lookup."""
+
+    provider_team_by_provider_id: dict[str, ProviderTeam]
+    team_by_id: dict[int, Team]
+    team_by_provider_id: dict[str, Team]
+    alias_norms: set[str]
+    venue_id_by_key: dict[tuple[str, str | None], int]
+    game_id_by_provider_id: dict[str, int]
+    game_hash_by_provider_id: dict[str, str | None]
+
+
+def _venue_key(game: Mapping[str, Any]) -> tuple[str, str | None] | None:
+    if game["venue_name"] is None:
+        return None
+    return game["venue_name"], game["venue_city"]
+
+
+def _load_season_dimensions(
+    session: Session, *, league_id: int, provider_game_ids: list[str]
+) -> _SeasonDimensions:
+    teams = session.execute(select(Team).where(Team.league_id == league_id)).scalars().all()
+    provider_teams = (
+        session.execute(
+            select(ProviderTeam).where(ProviderTeam.provider == ProviderEnum.API_SPORTS)
+        )
+        .scalars()
+        .all()
+    )
+    alias_norms = session.execute(
+        select(TeamAlias.alias_norm).where(TeamAlias.league_id == league_id)
+    ).scalars()
+    venues = session.execute(
+        select(Venue.id, Venue.name, Venue.city).where(Venue.league_id == league_id)
+    ).all()
+
+    games: dict[str, int] = {}
+    hashes: dict[str, str | None] = {}
+    unique_ids = sorted(set(provider_game_ids))
+    for i in range(0, len(unique_ids), _GAME_ID_CHUNK):
+        chunk = unique_ids[i : i + _GAME_ID_CHUNK]
+        for game_id, provider_game_id, source_hash in session.execute(
+            select(Game.id, Game.provider_game_id, Game.source_hash).where(
+                Game.provider == ProviderEnum.API_SPORTS, Game.provider_game_id.in_(chunk)
+            )
+        ):
+            games.setdefault(provider_game_id, game_id)
+            hashes.setdefault(provider_game_id, source_hash)
+
+    return _SeasonDimensions(
+        provider_team_by_provider_id={pt.provider_team_id: pt for pt in provider_teams},
+        team_by_id={t.id: t for t in teams},
+        team_by_provider_id={t.provider_team_id: t for t in teams if t.provider_team_id},
+        alias_norms=set(alias_norms),
+        venue_id_by_key={(name, city): id_ for id_, name, city in venues},
+        game_id_by_provider_id=games,
+        game_hash_by_provider_id=hashes,
+    )
+
+
 def ingest_api_sports_american_football_season(
     session: Session,
     *,
     league_key: str,
     season_year: int,
     items: list[ApiItem] | None = None,
+    force: bool = False,
 ) -> IngestAmericanFootballSeasonResult:
-    """Upsert an API-Sports american-football season into the DB."""
+    """Upsert an API-Sports american-football season into the DB.
+
+    Dimensions are preloaded and resolved in memory. New teams and venues and all games are
+    written with batched `INSERT ... ON CONFLICT DO UPDATE`, new provider-team mappings and
+    aliases with `ON CONFLICT DO NOTHING`, so concurrent ingests of the same league converge
+    instead of racing on unique constraints.
+
+    Items whose content hash matches the stored `Game.source_hash` are skipped without any
+    writes (`force` re-applies them, e.g. after a mapping change).
+    """
 
     league_repo = LeagueRepository(session)
     season_repo = SeasonRepository(session)
@@ -144,271 +221,205 @@ def ingest_api_sports_american_football_season(
             session, league_key=league_key, season_year=season_year
         )
 
-    games_created = 0
-    games_updated = 0
-    teams_created = 0
-    venues_created = 0
+    bundle = normalize_american_football_games(items, league_key=league_key)
+    team_by_provider_id = {t["provider_team_id"]: t for t in bundle.teams}
+    games = bundle.games
 
-    now = datetime.now(tz=UTC)
-
-    for item in items:
-        game_obj = item.get("game")
-        teams_obj = item.get("teams")
-        scores_obj = item.get("scores")
-
-        if not isinstance(game_obj, dict) or not isinstance(teams_obj, dict):
-            continue
+    dims = _load_season_dimensions(
+        session, league_id=league.id, provider_game_ids=[g["provider_game_id"] for g in games]
+    )
 
-        provider_game_id = str(game_obj.get("id"))
-        if provider_game_id == "None":
-            continue
+    games_unchanged = 0
+    if not force:
+        changed = []
+        for g in games:
+            provider_game_id = g["provider_game_id"]
+            if provider_game_id in dims.game_id_by_provider_id and (
+                dims.game_hash_by_provider_id.get(provider_game_id) == g["source_hash"]
+            ):
+                games_unchanged += 1
+            else:
+                changed.append(g)
+        games = changed
 
-        home = teams_obj.get("home")
-        away = teams_obj.get("away")
-        if not isinstance(home, dict) or not isinstance(away, dict):
-            continue
+    now = datetime.now(tz=UTC)
 
-        def upsert_team(team_data: dict[str, Any]) -> Team:
-            nonlocal teams_created
-            provider_team_id = str(team_data.get("id"))
-            provider_team_name = str(team_data.get("name") or provider_team_id)
+    # Teams and venues first seen in this payload, upserted in one batch each.
+    new_teams: dict[str, dict[str, Any]] = {}
+    new_venues: set[tuple[str, str | None]] = set()
+    for g in games:
+        for provider_team_id in (g["home_provider_team_id"], g["away_provider_team_id"]):
+            if (
+                provider_team_id not in dims.provider_team_by_provider_id
+                and provider_team_id not in dims.team_by_provider_id
+            ):
+                new_teams[provider_team_id] = {
+                    "league_id": league.id,
+                    **team_by_provider_id[provider_team_id],
+                }
+        key = _venue_key(g)
+        if key is not None and key not in dims.venue_id_by_key:
+            new_venues.add(key)
+
+    teams_created = len(new_teams)
+    if new_teams:
+        upserted = team_repo.upsert_many(
+            list(new_teams.values()),
+            constraint="uq_teams_league_provider_team_id",
+            returning=("id",),
+        )
+        for team in session.execute(
+            select(Team).where(Team.id.in_([r["id"] for r in upserted]))
+        ).scalars():
+            dims.team_by_id[team.id] = team
+            dims.team_by_provider_id[team.provider_team_id] = team
+
+    venues_created = len(new_venues)
+    if new_venues:
+        for r in venue_repo.upsert_many(
+            [
+                {"league_id": league.id, "name": n, "city": c}
+                for n, c in sorted(new_venues, key=str)
+            ],
+            constraint="uq_venues_league_name_city",
+            returning=("id", "name", "city"),
+        ):
+            dims.venue_id_by_key[(r["name"], r["city"])] = r["id"]
+
+    # Provider mappings and aliases first seen in this payload. Like teams they are written
+    # in one batch, as insert-if-missing: a concurrent ingest of the same league may have
+    # added them since the dimensions were loaded.
+    new_mappings: dict[str, dict[str, Any]] = {}
+    new_aliases: dict[str, dict[str, Any]] = {}
+
+    def ensure_alias(team_row: Team, provider_team_name: str) -> None:
+        alias_norm = TeamAlias.norm(provider_team_name)
+        if alias_norm in dims.alias_norms:
+            return
+        new_aliases[alias_norm] = {
+            "league_id": league.id,
+            "team_id": team_row.id,
+            "alias": provider_team_name,
+            "alias_norm": alias_norm,
+            "alias_type": "name",
+        }
+        dims.alias_norms.add(alias_norm)
+
+    def upsert_team(provider_team_id: str) -> Team:
+        team_data = team_by_provider_id[provider_team_id]
+        provider_team_name = team_data["name"]
+        team_changes = {
+            "name": provider_team_name,
+            "logo_url": team_data["logo_url"],
+            "is_active": True,
+        }
 
-            mapped = provider_team_repo.first_where(
-                ProviderTeam.provider == ProviderEnum.API_SPORTS,
-                ProviderTeam.provider_team_id == provider_team_id,
-            )
-            if mapped is not None:
-                team_row = team_repo.one_where(Team.id == mapped.team_id)
-                # Keep canonical team row fresh.
-                team_repo.patch(
-                    team_row,
-                    {
-                        "name": provider_team_name,
-                        "logo_url": team_data.get("logo"),
-                        "is_active": True,
-                    },
-                    flush=True,
-                )
-                if mapped.provider_team_name != provider_team_name:
-                    provider_team_repo.patch(
-                        mapped,
-                        {"provider_team_name": provider_team_name},
-                        flush=True,
-                    )
-                # Ensure an alias exists for the current name.
-                alias_norm = TeamAlias.norm(provider_team_name)
-                if (
-                    team_alias_repo.first_where(
-                        TeamAlias.league_id == league.id,
-                        TeamAlias.alias_norm == alias_norm,
-                    )
-                    is None
-                ):
-                    team_alias_repo.add(
-                        TeamAlias(
-                            league_id=league.id,
-                            team_id=team_row.id,
-                            alias=provider_team_name,
-                            alias_norm=alias_norm,
-                            alias_type="name",
-                        ),
-                        flush=True,
+        mapped = dims.provider_team_by_provider_id.get(provider_team_id)
+        if mapped is not None:
+            team_row = dims.team_by_id.get(mapped.team_id)
+            if team_row is None:
+                # Mapped to a team outside this league; fall back to the identity map/DB.
+                team_row = session.get(Team, mapped.team_id)
+                if team_row is None:
+                    raise RuntimeError(
+                        f"ProviderTeam {provider_team_id} maps to missing team {mapped.team_id}"
                     )
-                return team_row
-
-            existing = team_repo.first_where(
-                Team.league_id == league.id,
-                Team.provider_team_id == provider_team_id,
-            )
-            if existing is None:
-                teams_created += 1
-                existing = team_repo.add(
-                    Team(
-                        league_id=league.id,
-                        provider_team_id=provider_team_id,
-                        name=provider_team_name,
-                        logo_url=team_data.get("logo"),
-                    ),
-                    flush=True,
+                dims.team_by_id[team_row.id] = team_row
+            # Keep canonical team row fresh.
+            team_repo.patch(team_row, team_changes, flush=False)
+            if mapped.provider_team_name != provider_team_name:
+                provider_team_repo.patch(
+                    mapped, {"provider_team_name": provider_team_name}, flush=False
                 )
+            ensure_alias(team_row, provider_team_name)
+            return team_row
+
+        existing = dims.team_by_provider_id[provider_team_id]
+        team_repo.patch(existing, team_changes, flush=False)
+        new_mappings[provider_team_id] = {
+            "provider": ProviderEnum.API_SPORTS,
+            "team_id": existing.id,
+            "provider_team_id": provider_team_id,
+            "provider_team_name": provider_team_name,
+        }
+        ensure_alias(existing, provider_team_name)
+        return existing
 
-                provider_team_repo.add(
-                    ProviderTeam(
-                        provider=ProviderEnum.API_SPORTS,
-                        team_id=existing.id,
-                        provider_team_id=provider_team_id,
-                        provider_team_name=provider_team_name,
-                    ),
-                    flush=True,
-                )
-            else:
-                team_repo.patch(
-                    existing,
-                    {
-                        "name": provider_team_name,
-                        "logo_url": team_data.get("logo"),
-                        "is_active": True,
-                    },
-                    flush=True,
-                )
+    game_rows: dict[str, dict[str, Any]] = {}
+    payloads: dict[str, ApiItem] = {}
+    games_created = 0
+    games_updated = 0
 
-                mapped_existing = provider_team_repo.first_where(
-                    ProviderTeam.provider == ProviderEnum.API_SPORTS,
-                    ProviderTeam.provider_team_id == provider_team_id,
-                )
-                if mapped_existing is None:
-                    provider_team_repo.add(
-                        ProviderTeam(
-                            provider=ProviderEnum.API_SPORTS,
-                            team_id=existing.id,
-                            provider_team_id=provider_team_id,
-                            provider_team_name=provider_team_name,
-                        ),
-                        flush=True,
-                    )
-                elif mapped_existing.team_id != existing.id:
-                    raise RuntimeError(
-                        "ProviderTeam mapping mismatch: "
-                        f"provider_team_id={provider_team_id} "
-                        f"mapped_team_id={mapped_existing.team_id} "
-                        f"existing_team_id={existing.id}"
-                    )
-                else:
-                    provider_team_repo.patch(
-                        mapped_existing,
-                        {"provider_team_name": provider_team_name},
-                        flush=True,
-                    )
+    for g in games:
+        provider_game_id = g["provider_game_id"]
+        start_time = g["start_time"]
 
-            alias_norm = TeamAlias.norm(provider_team_name)
-            if (
-                team_alias_repo.first_where(
-                    TeamAlias.league_id == league.id,
-                    TeamAlias.alias_norm == alias_norm,
-                )
-                is None
-            ):
-                team_alias_repo.add(
-                    TeamAlias(
-                        league_id=league.id,
-                        team_id=existing.id,
-                        alias=provider_team_name,
-                        alias_norm=alias_norm,
-                        alias_type="name",
-                    ),
-                    flush=True,
-                )
-            return existing
-
-        home_team = upsert_team(home)
-        away_team = upsert_team(away)
-
-        venue_id: int | None = None
-        venue_obj = game_obj.get("venue")
-        if isinstance(venue_obj, dict):
-            venue_name = venue_obj.get("name")
-            venue_city = venue_obj.get("city")
-            if isinstance(venue_name, str) and venue_name.strip():
-                existing_venue = venue_repo.first_where(
-                    Venue.league_id == league.id,
-                    Venue.name == venue_name,
-                    Venue.city == venue_city,
-                )
-                if existing_venue is None:
-                    venues_created += 1
-                    existing_venue = venue_repo.add(
-                        Venue(
-                            league_id=league.id,
-                            name=venue_name,
-                            city=venue_city if isinstance(venue_city, str) else None,
-                        ),
-                        flush=True,
-                    )
-                venue_id = existing_venue.id
-
-        status_short: str | None = None
-        status_obj = game_obj.get("status")
-        if isinstance(status_obj, dict):
-            ss = status_obj.get("short")
-            if isinstance(ss, str):
-                status_short = ss
-
-        date_obj = game_obj.get("date")
-        try:
-            start_time = parse_api_sports_game_datetime(date_obj, provider_game_id=provider_game_id)
-        except ValueError:
-            continue
+        home_team = upsert_team(g["home_provider_team_id"])
+        away_team = upsert_team(g["away_provider_team_id"])
+
+        venue_key = _venue_key(g)
+        venue_id = dims.venue_id_by_key[venue_key] if venue_key is not None else None
 
         # Payload-agnostic filter: only persist NFL regular season games.
         if league_key == "NFL" and not in_nfl_regular_season_window(start_time, season_year):
             continue
 
-        home_total: int | None = None
-        away_total: int | None = None
-        if isinstance(scores_obj, dict):
-            home_scores = scores_obj.get("home")
-            away_scores = scores_obj.get("away")
-            if isinstance(home_scores, dict):
-                ht = home_scores.get("total")
-                if isinstance(ht, int):
-                    home_total = ht
-            if isinstance(away_scores, dict):
-                at = away_scores.get("total")
-                if isinstance(at, int):
-                    away_total = at
-
-        existing_game = game_repo.first_where(
-            Game.provider == ProviderEnum.API_SPORTS,
-            Game.provider_game_id == provider_game_id,
-        )
+        if provider_game_id in dims.game_id_by_provider_id or provider_game_id in game_rows:
+            games_updated += 1
+        else:
+            games_created += 1
 
-        changes = {
+        game_rows[provider_game_id] = {
+            "provider": ProviderEnum.API_SPORTS,
+            "provider_game_id": provider_game_id,
             "league_id": league.id,
             "season_id": season.id,
             "start_time": start_time,
             "venue_id": venue_id,
-            "status": _map_status(status_short),
+            "status": g["status"],
+            "is_neutral_site": False,
             "home_team_id": home_team.id,
             "away_team_id": away_team.id,
-            "home_score": home_total,
-            "away_score": away_total,
+            "home_score": g["home_score"],
+            "away_score": g["away_score"],
             "source_last_seen_at": now,
+            "source_hash": g["source_hash"],
         }
 
-        if existing_game is None:
-            game_repo.add(
-                Game(
-                    league_id=league.id,
-                    season_id=season.id,
-                    provider=ProviderEnum.API_SPORTS,
-                    provider_game_id=provider_game_id,
-                    start_time=start_time,
-                    venue_id=venue_id,
-                    status=changes["status"],
-                    is_neutral_site=False,
-                    home_team_id=home_team.id,
-                    away_team_id=away_team.id,
-                    home_score=home_total,
-                    away_score=away_total,
-                    source_last_seen_at=now,
-                ),
-                flush=True,
-            )
-            games_created += 1
-        else:
-            game_repo.patch(existing_game, changes, flush=True)
-            games_updated += 1
-
         if settings.store_ingested_payloads:
-            session.add(
-                IngestedPayload(
-                    provider=ProviderEnum.API_SPORTS.value,
-                    entity_type="game",
-                    entity_key=provider_game_id,
-                    fetched_at=now,
-                    payload_json=item,
-                )
+            payloads[provider_game_id] = g["raw"]
+
+    if new_mappings:
+        provider_team_repo.upsert_many(
+            list(new_mappings.values()),
+            constraint="uq_provider_teams_provider_provider_team_id",
+            update_cols=(),
+        )
+        # Re-read so the mappings reflect whichever ingest inserted them.
+        for mapping in session.execute(
+            select(ProviderTeam).where(
+                ProviderTeam.provider == ProviderEnum.API_SPORTS,
+                ProviderTeam.provider_team_id.in_(list(new_mappings)),
             )
+        ).scalars():
+            dims.provider_team_by_provider_id[mapping.provider_team_id] = mapping
+    if new_aliases:
+        team_alias_repo.upsert_many(
+            list(new_aliases.values()),
+            constraint="uq_team_aliases_league_alias_norm",
+            update_cols=(),
+        )
+
+    game_repo.upsert_many(
+        list(game_rows.values()),
+        constraint="uq_game_provider_ext_id",
+        # is_neutral_site is only an insert default; never overwrite curated values.
+        update_cols=_GAME_UPDATE_COLS,
+    )
+    IngestedPayloadRepository(session).record_many(
+        payloads, provider=ProviderEnum.API_SPORTS.value, entity_type="game", fetched_at=now
+    )
+    session.flush()
 
     return IngestAmericanFootballSeasonResult(
         league_key=league_key,
@@ -418,4 +429,70 @@ def ingest_api_sports_american_football_season(
         games_updated=games_updated,
         teams_created=teams_created,
         venues_created=venues_created,
+        games_unchanged=games_unchanged,
     )
+
+
+def _chunks(
+    items: Iterable[ApiItem], *, chunk_size: int, chunk_seconds: float
+) -> Iterator[list[ApiItem]]:
+    chunk: list[ApiItem] = []
+    started = time.monotonic()
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size or time.monotonic() - started >= chunk_seconds:
+            yield chunk
+            chunk = []
+            started = time.monotonic()
+    if chunk:
+        yield chunk
+
+
+def ingest_api_sports_american_football_season_streaming(
+    session: Session,
+    *,
+    league_key: str,
+    season_year: int,
+    items: Iterable[ApiItem] | None = None,
+    chunk_size: int = 200,
+    chunk_seconds: float = 30.0,
+    force: bool = False,
+) -> IngestAmericanFootballSeasonResult:
+    """Bounded-memory variant of `ingest_api_sports_american_football_season`.
+
+    Items are consumed incrementally and applied in chunks of `chunk_size` items (or
+    whatever arrived within `chunk_seconds`). Each chunk is committed and the session
+    is expunged, so neither ORM objects nor raw payloads accumulate across the season.
+    """
+
+    if items is None:
+        items = iter_api_sports_american_football_games_for_season(
+            session, league_key=league_key, season_year=season_year
+        )
+
+    totals = IngestAmericanFootballSeasonResult(
+        league_key=league_key,
+        season_year=season_year,
+        games_seen=0,
+        games_created=0,
+        games_updated=0,
+        teams_created=0,
+        venues_created=0,
+    )
+    for chunk in _chunks(items, chunk_size=max(1, chunk_size), chunk_seconds=chunk_seconds):
+        result = ingest_api_sports_american_football_season(
+            session, league_key=league_key, season_year=season_year, items=chunk, force=force
+        )
+        session.commit()
+        session.expunge_all()
+        totals = IngestAmericanFootballSeasonResult(
+            league_key=league_key,
+            season_year=season_year,
+            games_seen=totals.games_seen + result.games_seen,
+            games_created=totals.games_created + result.games_created,
+            games_updated=totals.games_updated + result.games_updated,
+            teams_created=totals.teams_created + result.teams_created,
+            venues_created=totals.venues_created + result.venues_created,
+            games_unchanged=totals.games_unchanged + result.games_unchanged,
+        )
+    return totals
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
@@ -9,20 +11,18 @@ from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from odds_value.core.config import settings
-from odds_value.db.enums import GameStatusEnum, ProviderEnum, SportEnum
+from odds_value.core.json_codec import content_hash
+from odds_value.db.enums import GameStatusEnum, IngestStatusEnum, ProviderEnum
 from odds_value.db.models.core.game import Game
 from odds_value.db.models.core.league import League
-from odds_value.db.models.core.provider_sport import ProviderSport
 from odds_value.db.models.core.provider_team import ProviderTeam
 from odds_value.db.models.core.season import Season
 from odds_value.db.models.core.team import Team
 from odds_value.db.models.core.team_alias import TeamAlias
 from odds_value.db.models.features.football_team_game_stats import FootballTeamGameStats
 from odds_value.db.models.features.team_game_stats import TeamGameStats
-from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
 from odds_value.db.repos.core.game_repo import GameRepository
 from odds_value.db.repos.core.league_repo import LeagueRepository
-from odds_value.db.repos.core.provider_sport_repo import ProviderSportRepository
 from odds_value.db.repos.core.provider_team_repo import ProviderTeamRepository
 from odds_value.db.repos.core.season_repo import SeasonRepository
 from odds_value.db.repos.core.team_alias_repo import TeamAliasRepository
@@ -31,12 +31,21 @@ from odds_value.db.repos.features.football_team_game_stats_repo import (
     FootballTeamGameStatsRepository,
 )
 from odds_value.db.repos.features.team_game_stats_repo import TeamGameStatsRepository
-from odds_value.ingestion.providers.api_sports.client import ApiSportsClient
+from odds_value.db.repos.ingestion.game_ingest_status_repo import GameIngestStatusRepository
+from odds_value.db.repos.ingestion.ingested_payload_repo import IngestedPayloadRepository
+from odds_value.ingestion.providers.api_sports.client import API_SPORTS_CACHE_RULES, ApiSportsClient
+from odds_value.ingestion.providers.api_sports.ingest.lookups import get_api_sports_base_url
+from odds_value.ingestion.providers.api_sports.schemas import team_stats_decoder
+from odds_value.ingestion.providers.base.cache import response_cache_from_settings
 from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.providers.base.client_registry import shared_http_client
 from odds_value.ingestion.providers.base.errors import ProviderResponseError
 
 ApiItem = dict[str, Any]
 
+# `GameIngestStatus.stage` used to checkpoint the season team-stats ingest.
+TEAM_GAME_STATS_STAGE = "api_sports_team_game_stats"
+
 
 @dataclass(frozen=True)
 class IngestAmericanFootballTeamGameStatsResult:
@@ -46,6 +55,7 @@ class IngestAmericanFootballTeamGameStatsResult:
     team_game_stats_updated: int
     football_stats_created: int
     football_stats_updated: int
+    items_unchanged: int = 0
 
 
 @dataclass(frozen=True)
@@ -63,6 +73,8 @@ class IngestAmericanFootballTeamGameStatsSeasonResult:
     team_game_stats_updated: int
     football_stats_created: int
     football_stats_updated: int
+    items_unchanged: int = 0
+    games_skipped_checkpointed: int = 0
 
 
 def _format_failure_reason(exc: BaseException, *, max_len: int = 300) -> str:
@@ -73,13 +85,23 @@ def _format_failure_reason(exc: BaseException, *, max_len: int = 300) -> str:
     return reason
 
 
-def _get_api_sports_base_url(session: Session) -> str:
-    provider_sport_repo = ProviderSportRepository(session)
-    row = provider_sport_repo.one_where(
-        ProviderSport.provider == ProviderEnum.API_SPORTS,
-        ProviderSport.sport == SportEnum.FOOTBALL,
+def _stats_item_hash(item: ApiItem, game: Game) -> str:
+    # TeamGameStats.score is copied from the game, so a score correction must also count.
+    return content_hash({"item": item, "score": [game.home_score, game.away_score]})
+
+
+def _stored_stats_hashes(session: Session, game: Game) -> dict[str, str | None]:
+    """`source_hash` of the game's existing stats rows, keyed by API-Sports team id."""
+
+    rows = session.execute(
+        select(ProviderTeam.provider_team_id, TeamGameStats.source_hash)
+        .join(ProviderTeam, ProviderTeam.team_id == TeamGameStats.team_id)
+        .where(
+            TeamGameStats.game_id == game.id,
+            ProviderTeam.provider == ProviderEnum.API_SPORTS,
+        )
     )
-    return row.base_url
+    return {provider_team_id: source_hash for provider_team_id, source_hash in rows}
 
 
 def fetch_api_sports_american_football_team_stats_for_game(
@@ -87,14 +109,21 @@ def fetch_api_sports_american_football_team_stats_for_game(
     *,
     provider_game_id: str,
     client: ApiSportsClient | None = None,
+    use_cache: bool = False,
 ) -> list[ApiItem]:
-    """Fetch API-Sports american-football team stats for a single game."""
+    """Fetch API-Sports american-football team stats for a single game.
+
+    `use_cache` should only be set for FINAL games, whose stats no longer change.
+    """
 
     created_http: BaseHttpClient | None = None
     if client is None:
-        base_url = _get_api_sports_base_url(session)
+        base_url = get_api_sports_base_url(session)
         api_key = settings.require_api_sports_key()
-        created_http = BaseHttpClient(base_url=base_url)
+        created_http = shared_http_client(
+            base_url,
+            cache=response_cache_from_settings(API_SPORTS_CACHE_RULES) if use_cache else None,
+        )
         client = ApiSportsClient(http=created_http, api_key=api_key)
 
     try:
@@ -120,8 +149,12 @@ def ingest_api_sports_american_football_team_game_stats(
     provider_game_id: str,
     items: list[ApiItem] | None = None,
     client: ApiSportsClient | None = None,
+    force: bool = False,
 ) -> IngestAmericanFootballTeamGameStatsResult:
-    """Upsert team-game stats for a single API-Sports american-football game."""
+    """Upsert team-game stats for a single API-Sports american-football game.
+
+    Items identical to the last applied ones (by content hash) are skipped unless `force`.
+    """
 
     game_repo = GameRepository(session)
     team_repo = TeamRepository(session)
@@ -140,6 +173,7 @@ def ingest_api_sports_american_football_team_game_stats(
             session,
             provider_game_id=str(provider_game_id),
             client=client,
+            use_cache=game.status == GameStatusEnum.FINAL,
         )
 
     now = datetime.now(tz=UTC)
@@ -148,18 +182,20 @@ def ingest_api_sports_american_football_team_game_stats(
     tgs_updated = 0
     fb_created = 0
     fb_updated = 0
+    items_unchanged = 0
 
-    for item in items:
-        team_obj = item.get("team")
-        stats_obj = item.get("statistics")
-        if not isinstance(team_obj, dict) or not isinstance(stats_obj, dict):
-            continue
+    stored_hashes = _stored_stats_hashes(session, game) if items and not force else {}
+    payloads: dict[str, ApiItem] = {}
 
-        provider_team_id = str(team_obj.get("id"))
-        if provider_team_id == "None":
+    for item, decoded in team_stats_decoder.decode(items):
+        provider_team_id = str(decoded["team"]["id"])
+
+        source_hash = _stats_item_hash(item, game)
+        if stored_hashes.get(provider_team_id) == source_hash:
+            items_unchanged += 1
             continue
 
-        provider_team_name = str(team_obj.get("name") or provider_team_id)
+        provider_team_name = decoded["team"].get("name") or provider_team_id
 
         mapped = provider_team_repo.first_where(
             ProviderTeam.provider == ProviderEnum.API_SPORTS,
@@ -186,7 +222,7 @@ def ingest_api_sports_american_football_team_game_stats(
                         league_id=game.league_id,
                         provider_team_id=provider_team_id,
                         name=provider_team_name,
-                        logo_url=team_obj.get("logo"),
+                        logo_url=decoded["team"].get("logo"),
                     ),
                     flush=True,
                 )
@@ -244,6 +280,7 @@ def ingest_api_sports_american_football_team_game_stats(
                     team_id=team.id,
                     is_home=is_home,
                     score=score,
+                    source_hash=source_hash,
                 ),
                 flush=True,
             )
@@ -254,24 +291,16 @@ def ingest_api_sports_american_football_team_game_stats(
                 {
                     "is_home": is_home,
                     "score": score,
+                    "source_hash": source_hash,
                 },
                 flush=True,
             )
             tgs_updated += 1
 
-        yards_total: int | None = None
-        yards = stats_obj.get("yards")
-        if isinstance(yards, dict):
-            yt = yards.get("total")
-            if isinstance(yt, int):
-                yards_total = yt
-
-        turnovers: int | None = None
-        to_obj = stats_obj.get("turnovers")
-        if isinstance(to_obj, dict):
-            tv = to_obj.get("total")
-            if isinstance(tv, int):
-                turnovers = tv
+        stats = decoded["statistics"]
+        yards_total = (stats.get("yards") or {}).get("total")
+        turnovers = (stats.get("turnovers") or {}).get("total")
+        stats_obj = item["statistics"]
 
         existing_fb = football_repo.get(existing_tgs.id)
         if existing_fb is None:
@@ -280,7 +309,7 @@ def ingest_api_sports_american_football_team_game_stats(
                     team_game_stats_id=existing_tgs.id,
                     yards_total=yards_total,
                     turnovers=turnovers,
-                    stats_json=stats_obj,
+                    stats=stats_obj,
                 ),
                 flush=True,
             )
@@ -291,22 +320,21 @@ def ingest_api_sports_american_football_team_game_stats(
                 {
                     "yards_total": yards_total,
                     "turnovers": turnovers,
-                    "stats_json": stats_obj,
+                    "stats": stats_obj,
                 },
                 flush=True,
             )
             fb_updated += 1
 
         if settings.store_ingested_payloads:
-            session.add(
-                IngestedPayload(
-                    provider=ProviderEnum.API_SPORTS.value,
-                    entity_type="team_game_statistics",
-                    entity_key=f"{provider_game_id}:{provider_team_id}",
-                    fetched_at=now,
-                    payload_json=item,
-                )
-            )
+            payloads[f"{provider_game_id}:{provider_team_id}"] = item
+
+    IngestedPayloadRepository(session).record_many(
+        payloads,
+        provider=ProviderEnum.API_SPORTS.value,
+        entity_type="team_game_statistics",
+        fetched_at=now,
+    )
 
     return IngestAmericanFootballTeamGameStatsResult(
         provider_game_id=str(provider_game_id),
@@ -315,6 +343,7 @@ def ingest_api_sports_american_football_team_game_stats(
         team_game_stats_updated=tgs_updated,
         football_stats_created=fb_created,
         football_stats_updated=fb_updated,
+        items_unchanged=items_unchanged,
     )
 
 
@@ -332,11 +361,25 @@ def ingest_api_sports_american_football_team_game_stats_for_season(
     failures_limit: int = 25,
     stop_on_failure: bool = False,
     items_by_provider_game_id: dict[str, list[ApiItem]] | None = None,
+    force: bool = False,
+    fetch_workers: int = 4,
+    queue_size: int = 16,
+    resume: bool = False,
+    retry_failed: bool = False,
 ) -> IngestAmericanFootballTeamGameStatsSeasonResult:
     """Fetch and upsert team-game stats for every game in a season.
 
     This is intentionally provider-agnostic in data modeling, but provider-specific
     in the fetch implementation.
+
+    Fetching and writing overlap: `fetch_workers` threads prefetch up to `queue_size`
+    games ahead while this thread, the only one touching the session, applies results
+    in game order (one SAVEPOINT per game, committed every `commit_every` games).
+    `sleep_seconds` is applied by each fetch worker before its request.
+
+    Every attempted game gets a durable `GameIngestStatus` (OK or FAILED with reason and
+    attempt count), committed together with its data. `resume` skips games already OK;
+    `retry_failed` only attempts games whose last attempt FAILED.
     """
 
     league_repo = LeagueRepository(session)
@@ -371,13 +414,17 @@ def ingest_api_sports_american_football_team_game_stats_for_season(
     tgs_updated = 0
     fb_created = 0
     fb_updated = 0
+    items_unchanged = 0
 
     http: BaseHttpClient | None = None
     api_client: ApiSportsClient | None = None
     if items_by_provider_game_id is None:
-        base_url = _get_api_sports_base_url(session)
+        base_url = get_api_sports_base_url(session)
         api_key = settings.require_api_sports_key()
-        http = BaseHttpClient(base_url=base_url)
+        http = shared_http_client(
+            base_url,
+            cache=response_cache_from_settings(API_SPORTS_CACHE_RULES) if only_final else None,
+        )
         api_client = ApiSportsClient(http=http, api_key=api_key)
 
     complete_game_ids: set[int] = set()
@@ -397,24 +444,74 @@ def ingest_api_sports_american_football_team_game_stats_for_season(
         )
         complete_game_ids = set(session.execute(complete_stmt).scalars().all())
 
+    def fetch(provider_game_id: str) -> list[ApiItem] | None:
+        # Runs on a fetch worker: must not touch the session (the client is always set
+        # here, so the fetch helper never reads from it).
+        if items_by_provider_game_id is not None:
+            # Missing entries fall back to a live fetch on the writer thread.
+            return items_by_provider_game_id.get(provider_game_id)
+        if sleep_seconds > 0:
+            time.sleep(sleep_seconds)
+        return fetch_api_sports_american_football_team_stats_for_game(
+            session, provider_game_id=provider_game_id, client=api_client
+        )
+
+    status_repo = GameIngestStatusRepository(session)
+    statuses = status_repo.by_game_id([g.id for g in games], stage=TEAM_GAME_STATS_STAGE)
+    games_skipped_checkpointed = 0
+
+    to_fetch: list[Game] = []
+    for game in games:
+        status = statuses[game.id].status if game.id in statuses else None
+        if (retry_failed and status != IngestStatusEnum.FAILED) or (
+            resume and status == IngestStatusEnum.OK
+        ):
+            games_skipped_checkpointed += 1
+        elif skip_existing and game.id in complete_game_ids:
+            games_skipped_existing += 1
+            status_repo.mark_ok(statuses, game.id, stage=TEAM_GAME_STATS_STAGE)
+        else:
+            to_fetch.append(game)
+
+    # Persist the plan up front so a crashed run leaves PENDING rows to resume from.
+    status_repo.ensure_pending(statuses, [g.id for g in to_fetch], stage=TEAM_GAME_STATS_STAGE)
+    session.commit()
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, fetch_workers), thread_name_prefix="api-sports-stats-fetch"
+    )
+    pending: deque[tuple[int, str, Future[list[ApiItem] | None]]] = deque()
+    fetch_iter = iter(to_fetch)
+
+    def refill() -> None:
+        while len(pending) < max(1, fetch_workers) + max(0, queue_size):
+            next_game = next(fetch_iter, None)
+            if next_game is None:
+                return
+            provider_game_id = next_game.provider_game_id
+            pending.append(
+                (next_game.id, provider_game_id, executor.submit(fetch, provider_game_id))
+            )
+
     try:
-        for idx, game in enumerate(games, start=1):
-            if skip_existing and game.id in complete_game_ids:
-                games_skipped_existing += 1
-                continue
+        refill()
+        idx = 0
+        while pending:
+            game_id, provider_game_id, fetched = pending.popleft()
+            refill()
+            idx += 1
             try:
-                per_game_items = None
-                if items_by_provider_game_id is not None:
-                    per_game_items = items_by_provider_game_id.get(game.provider_game_id)
+                per_game_items = fetched.result()
 
                 # Isolate each game in a SAVEPOINT so a single failure doesn't poison
                 # the whole batch or force us to rollback prior successes.
                 with session.begin_nested():
                     result = ingest_api_sports_american_football_team_game_stats(
                         session,
-                        provider_game_id=game.provider_game_id,
+                        provider_game_id=provider_game_id,
                         items=per_game_items,
                         client=api_client,
+                        force=force,
                     )
 
                 items_seen += result.items_seen
@@ -422,28 +519,38 @@ def ingest_api_sports_american_football_team_game_stats_for_season(
                 tgs_updated += result.team_game_stats_updated
                 fb_created += result.football_stats_created
                 fb_updated += result.football_stats_updated
+                items_unchanged += result.items_unchanged
                 games_processed += 1
+                status_repo.record_attempt(
+                    statuses, game_id, stage=TEAM_GAME_STATS_STAGE, at=datetime.now(tz=UTC)
+                )
             except Exception as exc:
                 games_failed += 1
                 reason = _format_failure_reason(exc)
                 failure_reasons[reason] = failure_reasons.get(reason, 0) + 1
                 if len(failed_game_ids_sample) < max(0, failures_limit):
-                    failed_game_ids_sample.append(str(game.provider_game_id))
+                    failed_game_ids_sample.append(str(provider_game_id))
                 if show_failures:
-                    print(f"FAILED provider_game_id={game.provider_game_id} | {reason}")
-                if stop_on_failure:
-                    raise
+                    print(f"FAILED provider_game_id={provider_game_id} | {reason}")
                 # If SQLAlchemy marked the session as inactive due to a DB error,
                 # we must rollback to proceed.
                 if not session.is_active:
                     session.rollback()
+                status_repo.record_attempt(
+                    statuses,
+                    game_id,
+                    stage=TEAM_GAME_STATS_STAGE,
+                    at=datetime.now(tz=UTC),
+                    error=reason,
+                )
+                if stop_on_failure:
+                    session.commit()
+                    raise
 
             if commit_every > 0 and idx % commit_every == 0:
                 session.commit()
-
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
     finally:
+        executor.shutdown(wait=True, cancel_futures=True)
         if http is not None:
             http.close()
 
@@ -463,4 +570,6 @@ def ingest_api_sports_american_football_team_game_stats_for_season(
         team_game_stats_updated=tgs_updated,
         football_stats_created=fb_created,
         football_stats_updated=fb_updated,
+        items_unchanged=items_unchanged,
+        games_skipped_checkpointed=games_skipped_checkpointed,
     )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from odds_value.db.enums import ProviderEnum, SportEnum
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.provider_league import ProviderLeague
+from odds_value.db.models.core.provider_sport import ProviderSport
+from odds_value.db.repos.core.league_repo import LeagueRepository
+from odds_value.db.repos.core.provider_league_repo import ProviderLeagueRepository
+from odds_value.db.repos.core.provider_sport_repo import ProviderSportRepository
+
+
+def get_api_sports_base_url(session: Session) -> str:
+    """Configured API-Sports american-football base URL (`provider_sports`)."""
+
+    provider_sport_repo = ProviderSportRepository(session)
+    row = provider_sport_repo.one_where(
+        ProviderSport.provider == ProviderEnum.API_SPORTS,
+        ProviderSport.sport == SportEnum.FOOTBALL,
+    )
+    return row.base_url
+
+
+def get_api_sports_provider_league_id(session: Session, *, league_key: str) -> str:
+    """API-Sports league id mapped to a canonical league key (`provider_leagues`)."""
+
+    league_repo = LeagueRepository(session)
+    provider_league_repo = ProviderLeagueRepository(session)
+
+    league = league_repo.one_where(League.league_key == league_key)
+    pl = provider_league_repo.one_where(
+        ProviderLeague.provider == ProviderEnum.API_SPORTS,
+        ProviderLeague.league_id == league.id,
+    )
+    return pl.provider_league_id
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from odds_value.core.json_codec import content_hash
+from odds_value.db.enums import GameStatusEnum
+from odds_value.ingestion.dates import parse_api_sports_game_datetime
+from odds_value.ingestion.providers.api_sports.schemas import (
+    GameScores,
+    GameStatus,
+    LeagueRef,
+    Total,
+    VenueRef,
+    games_decoder,
+)
+from odds_value.ingestion.providers.base.types import EntityBundle
+
+
+def map_game_status(short: str | None) -> GameStatusEnum:
+    if not short:
+        return GameStatusEnum.UNKNOWN
+
+    s = short.upper()
+
+    if s in {"NS"}:
+        return GameStatusEnum.SCHEDULED
+    if s in {"FT", "AOT", "FINAL"}:
+        return GameStatusEnum.FINAL
+    if s in {"PST", "PPD"}:
+        return GameStatusEnum.POSTPONED
+    if s in {"CANC", "CAN", "ABD"}:
+        return GameStatusEnum.CANCELED
+
+    return GameStatusEnum.IN_PROGRESS
+
+
+def normalize_american_football_games(
+    items: Iterable[dict[str, Any]], *, league_key: str
+) -> EntityBundle:
+    """Normalize API-Sports american-football `/games` items into canonical entity payloads.
+
+    Items are decoded with the typed `/games` schema. Malformed optional fields (scores,
+    season, venue, ...) become None; items without a usable game id, teams or date are
+    dropped and reported as schema drift.
+    Leagues, seasons, teams and venues are deduplicated (last occurrence wins); games keep
+    payload order. Each game carries the raw item and its content hash for change detection.
+
+    Payload keys:
+      - leagues: league_key, provider_league_id, name
+      - seasons: league_key, year
+      - teams: provider_team_id, name, logo_url
+      - venues: name, city
+      - games: provider_game_id, season_year, start_time, status, home_provider_team_id,
+        away_provider_team_id, home_score, away_score, venue_name, venue_city,
+        source_hash, raw
+    """
+
+    leagues: dict[str, dict[str, Any]] = {}
+    seasons: dict[int, dict[str, Any]] = {}
+    teams: dict[str, dict[str, Any]] = {}
+    venues: dict[tuple[str, str | None], dict[str, Any]] = {}
+    games: list[Mapping[str, Any]] = []
+
+    for item, decoded in games_decoder.decode(items):
+        game_obj = decoded["game"]
+        provider_game_id = str(game_obj["id"])
+        try:
+            start_time = parse_api_sports_game_datetime(
+                game_obj["date"], provider_game_id=provider_game_id
+            )
+        except ValueError:
+            games_decoder.reject("game.date: unparseable")
+            continue
+
+        home, away = decoded["teams"]["home"], decoded["teams"]["away"]
+        for team_ref in (home, away):
+            provider_team_id = str(team_ref["id"])
+            teams[provider_team_id] = {
+                "provider_team_id": provider_team_id,
+                "name": team_ref.get("name") or provider_team_id,
+                "logo_url": team_ref.get("logo"),
+            }
+
+        league_ref: LeagueRef = decoded.get("league") or {}
+        season_year = league_ref.get("season")
+        league_id = league_ref.get("id")
+        if league_id is not None:
+            provider_league_id = str(league_id)
+            leagues[provider_league_id] = {
+                "league_key": league_key,
+                "provider_league_id": provider_league_id,
+                "name": league_ref.get("name"),
+            }
+        if season_year is not None:
+            seasons[season_year] = {"league_key": league_key, "year": season_year}
+
+        venue_name: str | None = None
+        venue_city: str | None = None
+        venue: VenueRef = game_obj.get("venue") or {}
+        name = venue.get("name")
+        if name and name.strip():
+            venue_name = name
+            venue_city = venue.get("city")
+            venues[(venue_name, venue_city)] = {"name": venue_name, "city": venue_city}
+
+        status: GameStatus = game_obj.get("status") or {}
+        scores: GameScores = decoded.get("scores") or {}
+        home_total: Total = scores.get("home") or {}
+        away_total: Total = scores.get("away") or {}
+        games.append(
+            {
+                "provider_game_id": provider_game_id,
+                "season_year": season_year,
+                "start_time": start_time,
+                "status": map_game_status(status.get("short")),
+                "home_provider_team_id": str(home["id"]),
+                "away_provider_team_id": str(away["id"]),
+                "home_score": home_total.get("total"),
+                "away_score": away_total.get("total"),
+                "venue_name": venue_name,
+                "venue_city": venue_city,
+                "source_hash": content_hash(item),
+                "raw": item,
+            }
+        )
+
+    return EntityBundle(
+        leagues=list(leagues.values()),
+        seasons=list(seasons.values()),
+        teams=list(teams.values()),
+        games=games,
+        venues=list(venues.values()),
+    )
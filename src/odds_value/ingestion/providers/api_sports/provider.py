@@ -3,10 +3,12 @@ from __future__ import annotations
 from sqlalchemy.orm import Session
 
 from odds_value.db.enums import ProviderEnum, SportEnum
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.provider_league import ProviderLeague
 from odds_value.db.models.core.provider_sport import ProviderSport
 from odds_value.ingestion.providers.api_sports.adapters.football import ApiSportsFootballAdapter
 from odds_value.ingestion.providers.api_sports.client import ApiSportsClient
-from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.providers.base.client_registry import shared_http_client
 from odds_value.ingestion.providers.base.registry import AdapterKey, AdapterRegistry
 
 
@@ -22,6 +24,16 @@ def _get_base_url(session: Session) -> str:
     return row.base_url
 
 
+def _get_provider_league_ids(session: Session) -> dict[str, str]:
+    rows = (
+        session.query(League.league_key, ProviderLeague.provider_league_id)
+        .join(ProviderLeague, ProviderLeague.league_id == League.id)
+        .filter(ProviderLeague.provider == ProviderEnum.API_SPORTS)
+        .all()
+    )
+    return dict(rows)
+
+
 def register_api_sports_adapters(
     registry: AdapterRegistry,
     *,
@@ -29,19 +41,28 @@ def register_api_sports_adapters(
     api_key: str,
 ) -> None:
     base_url = _get_base_url(session)
+    provider_league_ids = _get_provider_league_ids(session)
 
     def make_client() -> ApiSportsClient:
-        http = BaseHttpClient(base_url=base_url)
+        http = shared_http_client(base_url)
         return ApiSportsClient(http=http, api_key=api_key)
 
     # Register NFL adapter
     registry.register(
         AdapterKey(provider=ProviderEnum.API_SPORTS.value, league_key="NFL"),
-        factory=lambda: ApiSportsFootballAdapter(client=make_client(), league_key="NFL"),
+        factory=lambda: ApiSportsFootballAdapter(
+            client=make_client(),
+            league_key="NFL",
+            provider_league_id=provider_league_ids.get("NFL"),
+        ),
     )
 
     # Register NCAAF adapter
     registry.register(
         AdapterKey(provider=ProviderEnum.API_SPORTS.value, league_key="NCAAF"),
-        factory=lambda: ApiSportsFootballAdapter(client=make_client(), league_key="NCAAF"),
+        factory=lambda: ApiSportsFootballAdapter(
+            client=make_client(),
+            league_key="NCAAF",
+            provider_league_id=provider_league_ids.get("NCAAF"),
+        ),
     )
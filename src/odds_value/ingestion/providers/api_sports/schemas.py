@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Generic, NotRequired, TypedDict, TypeVar
+
+from pydantic import GetCoreSchemaHandler, TypeAdapter, ValidationError
+from pydantic_core import CoreSchema, core_schema
+
+ApiItem = dict[str, Any]
+
+T = TypeVar("T")
+
+
+class _NoneOnError:
+    """Pydantic marker: an invalid value validates to None instead of rejecting the item."""
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return core_schema.with_default_schema(handler(source), default=None, on_error="default")
+
+
+# Optional field the normalizers can live without: missing, null or malformed -> None.
+# Only identity fields (game id, team ids, game date) are strict and reject the item.
+Lenient = Annotated[T | None, _NoneOnError()]
+
+
+# Items decode into plain typed dicts: pydantic-core builds them without calling into
+# Python, which roughly halves decoding time compared with (slotted) dataclasses. Lenient
+# keys are always present after validation (None when missing).
+
+
+class TeamRef(TypedDict):
+    id: int
+    name: NotRequired[Lenient[str]]
+    logo: NotRequired[Lenient[str]]
+
+
+class GameTeams(TypedDict):
+    home: TeamRef
+    away: TeamRef
+
+
+class VenueRef(TypedDict, total=False):
+    name: Lenient[str]
+    city: Lenient[str]
+
+
+class GameStatus(TypedDict, total=False):
+    short: Lenient[str]
+
+
+class GameInfo(TypedDict):
+    id: int
+    # Dict ({"timestamp": ..., "date": ..., "time": ...}) or ISO string, passed through
+    # as-is (validating it here would copy the dict); `parse_api_sports_game_datetime`
+    # checks it and the normalizer rejects the item when it is unusable.
+    date: Any
+    venue: NotRequired[Lenient[VenueRef]]
+    status: NotRequired[Lenient[GameStatus]]
+
+
+class LeagueRef(TypedDict, total=False):
+    id: Lenient[int]
+    name: Lenient[str]
+    season: Lenient[int]
+
+
+class Total(TypedDict, total=False):
+    total: Lenient[int]
+
+
+class GameScores(TypedDict, total=False):
+    home: Lenient[Total]
+    away: Lenient[Total]
+
+
+class GameItem(TypedDict):
+    """One `/games` response item (only the fields `normalize` reads)."""
+
+    game: GameInfo
+    teams: GameTeams
+    league: NotRequired[Lenient[LeagueRef]]
+    scores: NotRequired[Lenient[GameScores]]
+
+
+class TeamStatistics(TypedDict, total=False):
+    yards: Lenient[Total]
+    turnovers: Lenient[Total]
+
+
+class TeamStatsItem(TypedDict):
+    """One `/games/statistics/teams` response item (the full `statistics` stays in the raw item)."""
+
+    team: TeamRef
+    statistics: TeamStatistics
+
+
+@dataclass
+class SchemaDriftStats:
+    items_seen: int = 0
+    items_rejected: int = 0
+    # "<field path>: <error type>" -> count
+    errors: Counter[str] = field(default_factory=Counter)
+
+
+class SchemaDriftRegistry:
+    """Thread-safe per-endpoint counts of provider items that failed typed decoding."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, SchemaDriftStats] = {}
+
+    def record(self, endpoint: str, *, seen: int, errors: list[ValidationError]) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, SchemaDriftStats())
+            stats.items_seen += seen
+            stats.items_rejected += len(errors)
+            for exc in errors:
+                for err in exc.errors():
+                    loc = ".".join(str(p) for p in err["loc"]) or "<item>"
+                    stats.errors[f"{loc}: {err['type']}"] += 1
+
+    def record_rejection(self, endpoint: str, reason: str) -> None:
+        """Count an item that decoded but was still unusable (e.g. an unparseable date)."""
+
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, SchemaDriftStats())
+            stats.items_rejected += 1
+            stats.errors[reason] += 1
+
+    def snapshot(self) -> dict[str, SchemaDriftStats]:
+        with self._lock:
+            return {
+                k: SchemaDriftStats(v.items_seen, v.items_rejected, Counter(v.errors))
+                for k, v in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def format_lines(self) -> list[str]:
+        lines: list[str] = []
+        for endpoint, s in sorted(self.snapshot().items()):
+            if not s.items_rejected:
+                continue
+            top = ", ".join(f"{k} x{n}" for k, n in s.errors.most_common(5))
+            lines.append(
+                f"schema drift {endpoint}: rejected={s.items_rejected}/{s.items_seen} | {top}"
+            )
+        return lines
+
+
+# Process-wide registry every decoder reports to; CLI commands print it.
+default_schema_drift_registry = SchemaDriftRegistry()
+
+
+@dataclass(frozen=True)
+class ItemDecoder(Generic[T]):  # noqa: UP046
+    """Validate raw response items into typed structs, reporting rejects as schema drift.
+
+    The schemas cover only the fields the normalizers read and fall back to None for
+    malformed optional fields inside pydantic-core, so no Python runs per field
+    (`scripts/bench_api_sports_decode.py` times decoding against the JSON parse).
+    """
+
+    endpoint: str
+    adapter: TypeAdapter[T]
+    registry: SchemaDriftRegistry = field(
+        default_factory=lambda: default_schema_drift_registry, repr=False
+    )
+
+    def decode(self, items: Iterable[ApiItem]) -> list[tuple[ApiItem, T]]:
+        """(raw, decoded) pairs for the items that match the schema; rejects are dropped."""
+
+        decoded: list[tuple[ApiItem, T]] = []
+        errors: list[ValidationError] = []
+        seen = 0
+        for item in items:
+            seen += 1
+            try:
+                decoded.append((item, self.adapter.validate_python(item)))
+            except ValidationError as exc:
+                errors.append(exc)
+        self.registry.record(self.endpoint, seen=seen, errors=errors)
+        return decoded
+
+    def reject(self, reason: str) -> None:
+        """Report a decoded item the caller could not use."""
+
+        self.registry.record_rejection(self.endpoint, reason)
+
+
+games_decoder: ItemDecoder[GameItem] = ItemDecoder("/games", TypeAdapter(GameItem))
+team_stats_decoder: ItemDecoder[TeamStatsItem] = ItemDecoder(
+    "/games/statistics/teams", TypeAdapter(TeamStatsItem)
+)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from odds_value.core.config import settings
+
+# Query params that carry credentials; they never take part in cache keys.
+REDACTED_PARAMS = frozenset({"apikey", "api_key", "key", "token"})
+
+CACHE_STATUS_HEADER = "x-odds-value-cache"
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Cache policy for GET requests whose path starts with `path_prefix`.
+
+    `ttl_s=None` means the response never expires (immutable provider data). `cacheable`
+    vets successful bodies before they are stored, for providers that report errors or
+    not-yet-available data with HTTP 200.
+    """
+
+    path_prefix: str
+    ttl_s: float | None
+    cacheable: Callable[[bytes], bool] | None = None
+
+    def accepts(self, content: bytes) -> bool:
+        return self.cacheable is None or self.cacheable(content)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+
+def _normalize_path(path: str) -> str:
+    return "/" + path.strip("/")
+
+
+def normalize_params(params: Mapping[str, Any] | None) -> list[tuple[str, str]]:
+    """Stable, credential-free representation of query params."""
+
+    if not params:
+        return []
+    return sorted(
+        (str(k), str(v)) for k, v in params.items() if str(k).lower() not in REDACTED_PARAMS
+    )
+
+
+def cache_key(
+    method: str, base_url: str, path: str, params: Mapping[str, Any] | None = None
+) -> str:
+    raw = json.dumps(
+        [method.upper(), base_url.rstrip("/"), _normalize_path(path), normalize_params(params)],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ResponseCache:
+    """Size-bounded on-disk cache of successful JSON GET responses.
+
+    Entries are one file each (a JSON metadata line followed by the raw body) so
+    several processes can share a cache directory. Reads bump the file mtime and
+    eviction drops the least recently used files once `max_bytes` is exceeded.
+    """
+
+    directory: Path
+    rules: Sequence[CacheRule] = ()
+    max_bytes: int = 1024 * 1024 * 1024
+
+    _time: Callable[[], float] = field(default=time.time, repr=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def rule_for(self, path: str) -> CacheRule | None:
+        """Return the first rule matching `path`; None means the path is not cached."""
+
+        norm = _normalize_path(path)
+        for rule in self.rules:
+            if norm.startswith(_normalize_path(rule.path_prefix)):
+                return rule
+        return None
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.entry"
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry_path = self._entry_path(key)
+        try:
+            with entry_path.open("rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+
+        expires_at = meta.get("expires_at")
+        if expires_at is not None and float(expires_at) <= self._time():
+            self._remove(entry_path)
+            return None
+
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(entry_path)
+
+        return CachedResponse(
+            status_code=int(meta["status_code"]),
+            headers=dict(meta.get("headers") or {}),
+            content=content,
+        )
+
+    def put(self, key: str, resp: httpx.Response, *, ttl_s: float | None) -> None:
+        now = self._time()
+        meta = {
+            "url": str(resp.request.url.copy_with(query=None)),
+            "stored_at": now,
+            "expires_at": None if ttl_s is None else now + ttl_s,
+            "status_code": resp.status_code,
+            "headers": {"content-type": resp.headers.get("content-type", "application/json")},
+        }
+        data = json.dumps(meta, separators=(",", ":")).encode("utf-8") + b"\n" + resp.content
+
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = (
+            entry_path.parent / f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_bytes(data)
+
+        previous = entry_path.stat().st_size if entry_path.exists() else 0
+        os.replace(tmp_path, entry_path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(data) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry_path in self.directory.glob("*/*.entry"):
+                self._remove(entry_path)
+            self._total_bytes = 0
+
+    def _remove(self, entry_path: Path) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            entry_path.unlink()
+
+    def _scan_total_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.directory.glob("*/*.entry"))
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for p in self.directory.glob("*/*.entry"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort(key=lambda e: e[0])
+
+        total = sum(size for _, size, _ in entries)
+        # Evict down to 90% so we don't rescan on every subsequent put.
+        target = int(self.max_bytes * 0.9)
+        for _, size, p in entries:
+            if total <= target:
+                break
+            self._remove(p)
+            total -= size
+        self._total_bytes = total
+
+
+def response_cache_from_settings(rules: Sequence[CacheRule]) -> ResponseCache | None:
+    """Build the shared response cache when `HTTP_CACHE_DIR` is configured."""
+
+    if not settings.http_cache_dir:
+        return None
+    return ResponseCache(
+        directory=Path(settings.http_cache_dir),
+        rules=rules,
+        max_bytes=settings.http_cache_max_bytes,
+    )
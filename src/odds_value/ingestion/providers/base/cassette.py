@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from odds_value.core.config import settings
+
+from .cache import REDACTED_PARAMS, cache_key
+from .errors import ProviderCassetteMiss
+
+# Hop-by-hop / transfer headers that no longer describe the stored (decoded) body.
+_DROPPED_HEADERS = frozenset(
+    {"set-cookie", "content-encoding", "content-length", "transfer-encoding", "connection"}
+)
+
+
+def exchange_key(request: httpx.Request) -> str:
+    """Credential-free key identifying a request across record and replay."""
+
+    url = request.url
+    return cache_key(request.method, f"{url.scheme}://{url.host}", url.path, dict(url.params))
+
+
+def _redacted_url(url: httpx.URL) -> str:
+    params = [(k, v) for k, v in url.params.multi_items() if k.lower() not in REDACTED_PARAMS]
+    return str(url.copy_with(params=params))
+
+
+@dataclass(frozen=True)
+class CassetteEntry:
+    key: str
+    method: str
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    elapsed_s: float
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "method": self.method,
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "content_b64": base64.b64encode(self.content).decode("ascii"),
+            "elapsed_s": self.elapsed_s,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> CassetteEntry:
+        return cls(
+            key=str(data["key"]),
+            method=str(data["method"]),
+            url=str(data["url"]),
+            status_code=int(data["status_code"]),
+            headers=dict(data.get("headers") or {}),
+            content=base64.b64decode(data["content_b64"]),
+            elapsed_s=float(data.get("elapsed_s") or 0.0),
+        )
+
+
+def load_cassettes(directory: Path) -> dict[str, list[CassetteEntry]]:
+    """Read every recorded exchange under `directory`, grouped by request key in order."""
+
+    entries: dict[str, list[CassetteEntry]] = defaultdict(list)
+    for path in sorted(Path(directory).glob("*/*.jsonl.gz")):
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    entry = CassetteEntry.from_json(json.loads(line))
+                    entries[entry.key].append(entry)
+    return dict(entries)
+
+
+class _Recorder:
+    """Appends exchanges to `<directory>/<host>/<pid>-<start>.jsonl.gz`.
+
+    Each exchange is its own gzip member, so files stay readable if the process dies
+    and concurrent processes never share a file.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._file_name = f"{os.getpid()}-{int(time.time())}.jsonl.gz"
+
+    def record(self, request: httpx.Request, resp: httpx.Response, elapsed_s: float) -> None:
+        entry = CassetteEntry(
+            key=exchange_key(request),
+            method=request.method,
+            url=_redacted_url(request.url),
+            status_code=resp.status_code,
+            headers={k: v for k, v in resp.headers.items() if k.lower() not in _DROPPED_HEADERS},
+            content=resp.content,
+            elapsed_s=elapsed_s,
+        )
+        line = json.dumps(entry.to_json(), separators=(",", ":")).encode("utf-8") + b"\n"
+        path = self.directory / (request.url.host or "_") / self._file_name
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "ab") as f:
+                f.write(line)
+
+
+@cache
+def _recorder(directory: Path) -> _Recorder:
+    return _Recorder(directory)
+
+
+@dataclass
+class RecordingTransport(httpx.BaseTransport):
+    """Pass requests through to `inner` and append every exchange to a cassette."""
+
+    directory: Path
+    inner: httpx.BaseTransport = field(default_factory=httpx.HTTPTransport)
+
+    _monotonic: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        self._recorder = _recorder(self.directory)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = self._monotonic()
+        resp = self.inner.handle_request(request)
+        resp.read()
+        self._recorder.record(request, resp, self._monotonic() - started)
+        return resp
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+@dataclass
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    directory: Path
+    inner: httpx.AsyncBaseTransport = field(default_factory=httpx.AsyncHTTPTransport)
+
+    _monotonic: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        self._recorder = _recorder(self.directory)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = self._monotonic()
+        resp = await self.inner.handle_async_request(request)
+        await resp.aread()
+        self._recorder.record(request, resp, self._monotonic() - started)
+        return resp
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+@dataclass
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Serve recorded exchanges without touching the network (sync and async).
+
+    Repeated requests replay recordings in order and then keep returning the last one.
+    Each response is delayed by `latency_s + recorded_elapsed * latency_scale`, and
+    `rate_limit_probability` injects HTTP 429s (seeded, so runs are reproducible).
+    """
+
+    directory: Path
+    latency_s: float = 0.0
+    latency_scale: float = 0.0
+    rate_limit_probability: float = 0.0
+    retry_after_s: float = 1.0
+    seed: int | None = 0
+
+    _sleep: Callable[[float], None] = field(default=time.sleep, repr=False)
+    _async_sleep: Callable[[float], Awaitable[None]] = field(default=asyncio.sleep, repr=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        self._entries = load_cassettes(self.directory)
+        self._served: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._random = random.Random(self.seed)
+        self.rate_limited = 0
+
+    def _next(self, request: httpx.Request) -> tuple[httpx.Response, float]:
+        with self._lock:
+            if self.rate_limit_probability and self._random.random() < self.rate_limit_probability:
+                self.rate_limited += 1
+                headers = {"Retry-After": f"{self.retry_after_s:g}"}
+                return httpx.Response(429, headers=headers, request=request), self.latency_s
+
+            key = exchange_key(request)
+            entries = self._entries.get(key)
+            if not entries:
+                raise ProviderCassetteMiss(
+                    f"No recorded exchange for {request.method} {_redacted_url(request.url)}"
+                )
+            i = self._served[key]
+            self._served[key] = i + 1
+            entry = entries[min(i, len(entries) - 1)]
+
+        resp = httpx.Response(
+            entry.status_code, headers=entry.headers, content=entry.content, request=request
+        )
+        return resp, self.latency_s + entry.elapsed_s * self.latency_scale
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        resp, delay = self._next(request)
+        if delay > 0:
+            self._sleep(delay)
+        return resp
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        resp, delay = self._next(request)
+        if delay > 0:
+            await self._async_sleep(delay)
+        return resp
+
+
+def _cassette_mode() -> str | None:
+    mode = (settings.http_cassette_mode or "").lower()
+    if mode in {"", "off"}:
+        return None
+    if mode not in {"record", "replay"}:
+        raise ValueError(
+            f"Unknown HTTP_CASSETTE_MODE={settings.http_cassette_mode!r} "
+            "(expected record, replay or off)"
+        )
+    return mode
+
+
+@cache
+def _replay_transport(directory: str) -> ReplayTransport:
+    # One shared instance so replay order and 429 injection span every client.
+    return ReplayTransport(
+        directory=Path(directory),
+        latency_s=settings.http_cassette_latency_s,
+        latency_scale=settings.http_cassette_latency_scale,
+        rate_limit_probability=settings.http_cassette_rate_limit_probability,
+    )
+
+
+def cassette_transport_from_settings() -> httpx.BaseTransport | None:
+    """Transport selected by `HTTP_CASSETTE_MODE` (None => real network)."""
+
+    mode = _cassette_mode()
+    if mode == "record":
+        return RecordingTransport(directory=Path(settings.http_cassette_dir))
+    if mode == "replay":
+        return _replay_transport(settings.http_cassette_dir)
+    return None
+
+
+def async_cassette_transport_from_settings() -> httpx.AsyncBaseTransport | None:
+    mode = _cassette_mode()
+    if mode == "record":
+        return AsyncRecordingTransport(directory=Path(settings.http_cassette_dir))
+    if mode == "replay":
+        return _replay_transport(settings.http_cassette_dir)
+    return None
@@ -1,26 +1,240 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+import importlib.util
+import random
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from types import TracebackType
 from typing import Any
 
 import httpx
 
+from odds_value.core.config import settings
+from odds_value.core.json_codec import JsonDecoder, default_json_decoder
+
+from .cache import CACHE_STATUS_HEADER, CacheRule, ResponseCache, cache_key
+from .cassette import async_cassette_transport_from_settings, cassette_transport_from_settings
 from .errors import ProviderRateLimited, ProviderRequestError
+from .metrics import HttpEvent, HttpEventKind, HttpHook, default_metrics_registry, endpoint_template
+from .retry import CircuitBreaker, RetryPolicy, default_circuit_breaker
+from .single_flight import AsyncSingleFlight, SingleFlight, flight_key
 
 Json = dict[str, Any]
 JsonValue = object
 
 
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool / protocol options for the underlying httpx client.
+
+    `http2` needs the optional `h2` package and silently falls back to HTTP/1.1 without
+    it. `compression=False` asks providers for uncompressed bodies.
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_s: float = 30.0
+    http2: bool = False
+    compression: bool = True
+
+
+def pool_config_from_settings() -> PoolConfig:
+    return PoolConfig(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry_s=settings.http_keepalive_expiry_s,
+        http2=settings.http2,
+        compression=settings.http_compression,
+    )
+
+
+def httpx_client_kwargs(
+    base_url: str,
+    *,
+    timeout_s: float,
+    connect_timeout_s: float,
+    headers: Mapping[str, str],
+    pool: PoolConfig,
+) -> dict[str, Any]:
+    all_headers = dict(headers)
+    if not pool.compression:
+        all_headers.setdefault("Accept-Encoding", "identity")
+    return {
+        "base_url": base_url.rstrip("/") + "/",
+        "timeout": httpx.Timeout(timeout_s, connect=connect_timeout_s),
+        "headers": all_headers,
+        "limits": httpx.Limits(
+            max_connections=pool.max_connections,
+            max_keepalive_connections=pool.max_keepalive_connections,
+            keepalive_expiry=pool.keepalive_expiry_s,
+        ),
+        "http2": pool.http2 and importlib.util.find_spec("h2") is not None,
+    }
+
+
+def _check_status(resp: httpx.Response, method: str) -> None:
+    if resp.status_code == 429:
+        raise ProviderRateLimited("Provider rate limited the request (HTTP 429).")
+
+    try:
+        resp.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise ProviderRequestError(
+            f"HTTP {resp.status_code} for {method} {resp.request.url}"
+        ) from e
+
+
+def _cache_plan(
+    cache: ResponseCache | None,
+    base_url: str,
+    method: str,
+    path: str,
+    params: Mapping[str, Any] | None,
+) -> tuple[str, CacheRule] | None:
+    if cache is None or method.upper() != "GET":
+        return None
+    rule = cache.rule_for(path)
+    if rule is None:
+        return None
+    return cache_key(method, base_url, path, params), rule
+
+
+def _cached_response(
+    cache: ResponseCache,
+    key: str,
+    request: httpx.Request,
+) -> httpx.Response | None:
+    hit = cache.get(key)
+    if hit is None:
+        return None
+    return httpx.Response(
+        hit.status_code,
+        headers={**hit.headers, CACHE_STATUS_HEADER: "hit"},
+        content=hit.content,
+        request=request,
+    )
+
+
+def _coalesce_key(
+    policy: RetryPolicy,
+    base_url: str,
+    method: str,
+    path: str,
+    params: Mapping[str, Any] | None,
+    json: Mapping[str, Any] | None,
+    headers: Mapping[str, str] | None,
+) -> str | None:
+    """Single-flight key for requests that are safe to share, else None."""
+
+    if json is not None or method.upper() not in policy.idempotent_methods:
+        return None
+    return flight_key(method, base_url, path, params, headers)
+
+
+def _retry_delay(
+    policy: RetryPolicy,
+    method: str,
+    attempt: int,
+    *,
+    rand: float,
+    resp: httpx.Response | None = None,
+) -> float | None:
+    """Seconds to wait before the next attempt, or None when we should stop.
+
+    `resp=None` means the attempt failed at the transport level (timeout/network).
+    """
+
+    if attempt >= policy.max_attempts:
+        return None
+    if resp is not None and resp.status_code == 429:
+        return policy.retry_after_s(resp.headers.get("Retry-After"), policy.rate_limited_wait_s)
+    if method.upper() not in policy.idempotent_methods:
+        return None
+    if resp is None:
+        return policy.backoff_s(attempt, rand)
+    if resp.status_code in policy.retry_statuses:
+        return policy.retry_after_s(
+            resp.headers.get("Retry-After"), policy.backoff_s(attempt, rand)
+        )
+    return None
+
+
+def _record_health(breaker: CircuitBreaker | None, host: str, resp: httpx.Response | None) -> None:
+    if breaker is None:
+        return
+    if resp is None or resp.status_code >= 500:
+        breaker.record_failure(host)
+    else:
+        breaker.record_success(host)
+
+
+def _default_hooks() -> list[HttpHook]:
+    return [default_metrics_registry]
+
+
+def _emit(
+    hooks: Sequence[HttpHook],
+    kind: HttpEventKind,
+    host: str,
+    method: str,
+    path: str,
+    *,
+    resp: httpx.Response | None = None,
+    elapsed_s: float = 0.0,
+    attempt: int = 1,
+    reason: str | None = None,
+) -> None:
+    if not hooks:
+        return
+    event = HttpEvent(
+        kind=kind,
+        provider=host,
+        method=method.upper(),
+        endpoint=endpoint_template(path),
+        status_code=None if resp is None else resp.status_code,
+        elapsed_s=elapsed_s,
+        bytes_received=0 if resp is None else len(resp.content),
+        attempt=attempt,
+        reason=reason,
+    )
+    for hook in hooks:
+        hook(event)
+
+
+def _decode(decoder: JsonDecoder, content: bytes) -> JsonValue:
+    try:
+        return decoder(content)
+    except ValueError as e:
+        raise ProviderRequestError("Response was not valid JSON.") from e
+
+
+def _json_value(resp: httpx.Response, method: str, decoder: JsonDecoder) -> JsonValue:
+    _check_status(resp, method)
+    return _decode(decoder, resp.content)
+
+
+def _json_object(resp: httpx.Response, method: str, decoder: JsonDecoder) -> Json:
+    data = _json_value(resp, method, decoder)
+    if not isinstance(data, dict):
+        raise ProviderRequestError(f"Expected JSON object, got {type(data)}")
+    return data
+
+
 @dataclass
 class BaseHttpClient:
     """
     Provider-agnostic HTTP client wrapper.
 
-    - Uses a single underlying httpx.Client for connection pooling.
+    - Uses a single underlying httpx.Client for connection pooling (or borrows a shared
+      one via `client`; see `HttpClientRegistry`).
     - Provides consistent error handling.
     - Provider-specific clients can subclass and add convenience methods / auth.
+    - Optionally serves GET requests from an on-disk `ResponseCache`.
+    - Retries per `retry_policy` and fails fast while the host's circuit is open.
+    - Coalesces identical concurrent GETs into one network call (`single_flight`).
+    - Reports every attempt, cache hit and wait to `hooks` (see `metrics.py`).
     """
 
     base_url: str
@@ -28,18 +242,40 @@ class BaseHttpClient:
     connect_timeout_s: float = 10.0
     headers: Mapping[str, str] = field(default_factory=dict)
 
-    transport: httpx.BaseTransport | None = None
+    # Defaults to the record/replay cassette transport when HTTP_CASSETTE_MODE is set.
+    transport: httpx.BaseTransport | None = field(default_factory=cassette_transport_from_settings)
+    pool: PoolConfig = field(default_factory=pool_config_from_settings)
+    # Borrowed, already-configured httpx client (pool/transport fields are then ignored).
+    client: httpx.Client | None = field(default=None, repr=False)
+    cache: ResponseCache | None = None
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    circuit_breaker: CircuitBreaker | None = field(default_factory=lambda: default_circuit_breaker)
+    json_decoder: JsonDecoder = field(default_factory=default_json_decoder, repr=False)
+    # Identical concurrent GETs share one network call (None disables coalescing).
+    single_flight: SingleFlight[httpx.Response] | None = field(default_factory=SingleFlight)
+    # Instrumentation callbacks; the default feeds the process-wide metrics registry.
+    hooks: Sequence[HttpHook] = field(default_factory=_default_hooks, repr=False)
+
+    _sleep: Callable[[float], None] = field(default=time.sleep, repr=False)
+    _random: Callable[[], float] = field(default=random.random, repr=False)
 
     def __post_init__(self) -> None:
-        self._client = httpx.Client(
-            base_url=self.base_url.rstrip("/") + "/",
-            timeout=httpx.Timeout(self.timeout_s, connect=self.connect_timeout_s),
-            headers=dict(self.headers),
+        self._owns_client = self.client is None
+        self._client = self.client or httpx.Client(
             transport=self.transport,
+            **httpx_client_kwargs(
+                self.base_url,
+                timeout_s=self.timeout_s,
+                connect_timeout_s=self.connect_timeout_s,
+                headers=self.headers,
+                pool=self.pool,
+            ),
         )
 
     def close(self) -> None:
-        self._client.close()
+        # Shared pools (see `client_registry.py`) outlive the clients that borrow them.
+        if self._owns_client:
+            self._client.close()
 
     def __enter__(self) -> BaseHttpClient:
         return self
@@ -61,16 +297,166 @@ class BaseHttpClient:
         json: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
     ) -> httpx.Response:
-        try:
-            return self._client.request(
-                method=method,
-                url=path.lstrip("/"),
-                params=params,
-                json=json,
-                headers=headers,
+        plan = _cache_plan(self.cache, self.base_url, method, path, params)
+        if plan is not None:
+            assert self.cache is not None
+            request = self._client.build_request(method, path.lstrip("/"), params=params)
+            cached = _cached_response(self.cache, plan[0], request)
+            if cached is not None:
+                _emit(self.hooks, "cache_hit", self._client.base_url.host, method, path)
+                return cached
+
+        key = (
+            None
+            if self.single_flight is None
+            else _coalesce_key(
+                self.retry_policy, self.base_url, method, path, params, json, headers
             )
-        except (httpx.TimeoutException, httpx.NetworkError) as e:
-            raise ProviderRequestError(str(e)) from e
+        )
+        if key is None:
+            return self._send(method, path, params=params, json=json, headers=headers, plan=plan)
+        assert self.single_flight is not None
+        return self.single_flight.do(
+            key,
+            lambda: self._send(method, path, params=params, json=None, headers=headers, plan=plan),
+        )
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None,
+        json: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        plan: tuple[str, CacheRule] | None,
+    ) -> httpx.Response:
+        host = self._client.base_url.host
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(host)
+            started = time.perf_counter()
+            try:
+                resp = self._client.request(
+                    method=method,
+                    url=path.lstrip("/"),
+                    params=params,
+                    json=json,
+                    headers=headers,
+                )
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                elapsed = time.perf_counter() - started
+                _emit(self.hooks, "error", host, method, path, elapsed_s=elapsed, attempt=attempt)
+                _record_health(self.circuit_breaker, host, None)
+                delay = _retry_delay(self.retry_policy, method, attempt, rand=self._random())
+                if delay is None:
+                    raise ProviderRequestError(str(e)) from e
+                self.sleep_for(path, delay, reason="retry", method=method)
+                continue
+
+            elapsed = time.perf_counter() - started
+            _emit(
+                self.hooks,
+                "response",
+                host,
+                method,
+                path,
+                resp=resp,
+                elapsed_s=elapsed,
+                attempt=attempt,
+            )
+            _record_health(self.circuit_breaker, host, resp)
+            delay = _retry_delay(self.retry_policy, method, attempt, rand=self._random(), resp=resp)
+            if delay is None:
+                break
+            self.sleep_for(path, delay, reason="retry", method=method)
+
+        if plan is not None and resp.is_success and plan[1].accepts(resp.content):
+            assert self.cache is not None
+            self.cache.put(plan[0], resp, ttl_s=plan[1].ttl_s)
+        return resp
+
+    def record_sleep(self, path: str, seconds: float, *, reason: str, method: str = "GET") -> None:
+        """Report time spent waiting on behalf of `path` (e.g. rate-limit pacing)."""
+
+        if seconds > 0:
+            host = self._client.base_url.host
+            _emit(self.hooks, "sleep", host, method, path, elapsed_s=seconds, reason=reason)
+
+    def sleep_for(self, path: str, seconds: float, *, reason: str, method: str = "GET") -> None:
+        self.record_sleep(path, seconds, reason=reason, method=method)
+        self._sleep(seconds)
+
+    def is_cached(self, path: str, params: Mapping[str, Any] | None = None) -> bool:
+        """True when a GET for `path` + `params` would be served from the response cache."""
+
+        if self.cache is None:
+            return False
+        plan = _cache_plan(self.cache, self.base_url, "GET", path, params)
+        if plan is None:
+            return False
+        assert self.cache is not None
+        return self.cache.get(plan[0]) is not None
+
+    def is_in_flight(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> bool:
+        """True when an identical GET is already running and a new call would join it."""
+
+        if self.single_flight is None:
+            return False
+        return self.single_flight.in_flight(flight_key("GET", self.base_url, path, params, headers))
+
+    def decode_json(self, content: bytes) -> JsonValue:
+        """Decode a body previously returned by `request_bytes` with this client's decoder."""
+
+        return _decode(self.json_decoder, content)
+
+    def request_bytes(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> bytes:
+        """Perform an HTTP request and return the raw, undecoded response body.
+
+        Status handling matches `request_json`; callers that only archive or forward the
+        payload avoid a decode/re-encode round trip.
+        """
+
+        resp = self._request(method, path, params=params, json=json, headers=headers)
+        _check_status(resp, method)
+        return resp.content
+
+    def get_bytes_with_headers(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> tuple[bytes, httpx.Headers]:
+        """Like `get_bytes`, but also returns response headers."""
+
+        resp = self._request("GET", path, params=params, headers=headers)
+        _check_status(resp, "GET")
+        return resp.content, resp.headers
+
+    def get_bytes(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> bytes:
+        return self.request_bytes("GET", path, params=params, headers=headers)
 
     def request_json(
         self,
@@ -86,26 +472,7 @@ class BaseHttpClient:
         Raises ProviderRequestError (including ProviderRateLimited) on transport issues / non-2xx.
         """
         resp = self._request(method, path, params=params, json=json, headers=headers)
-
-        if resp.status_code == 429:
-            raise ProviderRateLimited("Provider rate limited the request (HTTP 429).")
-
-        try:
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise ProviderRequestError(
-                f"HTTP {resp.status_code} for {method} {resp.request.url}"
-            ) from e
-
-        try:
-            data = resp.json()
-        except ValueError as e:
-            raise ProviderRequestError("Response was not valid JSON.") from e
-
-        if not isinstance(data, dict):
-            raise ProviderRequestError(f"Expected JSON object, got {type(data)}")
-
-        return data
+        return _json_object(resp, method, self.json_decoder)
 
     def request_json_value(
         self,
@@ -123,21 +490,7 @@ class BaseHttpClient:
         """
 
         resp = self._request(method, path, params=params, json=json, headers=headers)
-
-        if resp.status_code == 429:
-            raise ProviderRateLimited("Provider rate limited the request (HTTP 429).")
-
-        try:
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise ProviderRequestError(
-                f"HTTP {resp.status_code} for {method} {resp.request.url}"
-            ) from e
-
-        try:
-            return resp.json()
-        except ValueError as e:
-            raise ProviderRequestError("Response was not valid JSON.") from e
+        return _json_value(resp, method, self.json_decoder)
 
     def get_json_value(
         self,
@@ -160,41 +513,303 @@ class BaseHttpClient:
         """Like `request_json`, but also returns response headers."""
 
         resp = self._request(method, path, params=params, json=json, headers=headers)
+        return _json_object(resp, method, self.json_decoder), resp.headers
 
-        if resp.status_code == 429:
-            raise ProviderRateLimited("Provider rate limited the request (HTTP 429).")
+    def get_json(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Json:
+        return self.request_json("GET", path, params=params, headers=headers)
 
-        try:
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise ProviderRequestError(
-                f"HTTP {resp.status_code} for {method} {resp.request.url}"
-            ) from e
+    def get_json_with_headers(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> tuple[Json, httpx.Headers]:
+        return self.request_json_with_headers("GET", path, params=params, headers=headers)
 
-        try:
-            data = resp.json()
-        except ValueError as e:
-            raise ProviderRequestError("Response was not valid JSON.") from e
+    def get_json_value_with_headers(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> tuple[JsonValue, httpx.Headers]:
+        """Like `get_json_value`, but also returns response headers."""
 
-        if not isinstance(data, dict):
-            raise ProviderRequestError(f"Expected JSON object, got {type(data)}")
+        resp = self._request("GET", path, params=params, headers=headers)
+        return _json_value(resp, "GET", self.json_decoder), resp.headers
 
-        return data, resp.headers
 
-    def get_json(
+@dataclass
+class AsyncBaseHttpClient:
+    """
+    Async sibling of `BaseHttpClient` backed by a single httpx.AsyncClient.
+
+    Error mapping is shared with the sync client, so callers see the same
+    ProviderRequestError / ProviderRateLimited exceptions.
+    """
+
+    base_url: str
+    timeout_s: float = 30.0
+    connect_timeout_s: float = 10.0
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    transport: httpx.AsyncBaseTransport | None = field(
+        default_factory=async_cassette_transport_from_settings
+    )
+    pool: PoolConfig = field(default_factory=pool_config_from_settings)
+    cache: ResponseCache | None = None
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    circuit_breaker: CircuitBreaker | None = field(default_factory=lambda: default_circuit_breaker)
+    json_decoder: JsonDecoder = field(default_factory=default_json_decoder, repr=False)
+    single_flight: AsyncSingleFlight[httpx.Response] | None = field(
+        default_factory=AsyncSingleFlight
+    )
+    hooks: Sequence[HttpHook] = field(default_factory=_default_hooks, repr=False)
+
+    _sleep: Callable[[float], Awaitable[None]] = field(default=asyncio.sleep, repr=False)
+    _random: Callable[[], float] = field(default=random.random, repr=False)
+
+    def __post_init__(self) -> None:
+        self._client = httpx.AsyncClient(
+            transport=self.transport,
+            **httpx_client_kwargs(
+                self.base_url,
+                timeout_s=self.timeout_s,
+                connect_timeout_s=self.connect_timeout_s,
+                headers=self.headers,
+                pool=self.pool,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncBaseHttpClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        plan = _cache_plan(self.cache, self.base_url, method, path, params)
+        if plan is not None:
+            assert self.cache is not None
+            request = self._client.build_request(method, path.lstrip("/"), params=params)
+            cached = _cached_response(self.cache, plan[0], request)
+            if cached is not None:
+                _emit(self.hooks, "cache_hit", self._client.base_url.host, method, path)
+                return cached
+
+        key = (
+            None
+            if self.single_flight is None
+            else _coalesce_key(
+                self.retry_policy, self.base_url, method, path, params, json, headers
+            )
+        )
+        if key is None:
+            return await self._send(
+                method, path, params=params, json=json, headers=headers, plan=plan
+            )
+        assert self.single_flight is not None
+        return await self.single_flight.do(
+            key,
+            lambda: self._send(method, path, params=params, json=None, headers=headers, plan=plan),
+        )
+
+    async def _send(
         self,
+        method: str,
         path: str,
         *,
+        params: Mapping[str, Any] | None,
+        json: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        plan: tuple[str, CacheRule] | None,
+    ) -> httpx.Response:
+        host = self._client.base_url.host
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(host)
+            started = time.perf_counter()
+            try:
+                resp = await self._client.request(
+                    method=method,
+                    url=path.lstrip("/"),
+                    params=params,
+                    json=json,
+                    headers=headers,
+                )
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                elapsed = time.perf_counter() - started
+                _emit(self.hooks, "error", host, method, path, elapsed_s=elapsed, attempt=attempt)
+                _record_health(self.circuit_breaker, host, None)
+                delay = _retry_delay(self.retry_policy, method, attempt, rand=self._random())
+                if delay is None:
+                    raise ProviderRequestError(str(e)) from e
+                await self.sleep_for(path, delay, reason="retry", method=method)
+                continue
+
+            elapsed = time.perf_counter() - started
+            _emit(
+                self.hooks,
+                "response",
+                host,
+                method,
+                path,
+                resp=resp,
+                elapsed_s=elapsed,
+                attempt=attempt,
+            )
+            _record_health(self.circuit_breaker, host, resp)
+            delay = _retry_delay(self.retry_policy, method, attempt, rand=self._random(), resp=resp)
+            if delay is None:
+                break
+            await self.sleep_for(path, delay, reason="retry", method=method)
+
+        if plan is not None and resp.is_success and plan[1].accepts(resp.content):
+            assert self.cache is not None
+            self.cache.put(plan[0], resp, ttl_s=plan[1].ttl_s)
+        return resp
+
+    def record_sleep(self, path: str, seconds: float, *, reason: str, method: str = "GET") -> None:
+        if seconds > 0:
+            host = self._client.base_url.host
+            _emit(self.hooks, "sleep", host, method, path, elapsed_s=seconds, reason=reason)
+
+    async def sleep_for(
+        self, path: str, seconds: float, *, reason: str, method: str = "GET"
+    ) -> None:
+        self.record_sleep(path, seconds, reason=reason, method=method)
+        await self._sleep(seconds)
+
+    def is_cached(self, path: str, params: Mapping[str, Any] | None = None) -> bool:
+        if self.cache is None:
+            return False
+        plan = _cache_plan(self.cache, self.base_url, "GET", path, params)
+        if plan is None:
+            return False
+        assert self.cache is not None
+        return self.cache.get(plan[0]) is not None
+
+    def is_in_flight(
+        self,
+        path: str,
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
+    ) -> bool:
+        """True when an identical GET is already running and a new call would join it."""
+
+        if self.single_flight is None:
+            return False
+        return self.single_flight.in_flight(flight_key("GET", self.base_url, path, params, headers))
+
+    def decode_json(self, content: bytes) -> JsonValue:
+        return _decode(self.json_decoder, content)
+
+    async def request_bytes(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> bytes:
+        resp = await self._request(method, path, params=params, json=json, headers=headers)
+        _check_status(resp, method)
+        return resp.content
+
+    async def get_bytes(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> bytes:
+        return await self.request_bytes("GET", path, params=params, headers=headers)
+
+    async def request_json(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> Json:
-        return self.request_json("GET", path, params=params, headers=headers)
+        resp = await self._request(method, path, params=params, json=json, headers=headers)
+        return _json_object(resp, method, self.json_decoder)
 
-    def get_json_with_headers(
+    async def request_json_value(
         self,
+        method: str,
         path: str,
         *,
         params: Mapping[str, Any] | None = None,
+        json: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> JsonValue:
+        resp = await self._request(method, path, params=params, json=json, headers=headers)
+        return _json_value(resp, method, self.json_decoder)
+
+    async def request_json_with_headers(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
     ) -> tuple[Json, httpx.Headers]:
-        return self.request_json_with_headers("GET", path, params=params, headers=headers)
+        resp = await self._request(method, path, params=params, json=json, headers=headers)
+        return _json_object(resp, method, self.json_decoder), resp.headers
+
+    async def get_json(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Json:
+        return await self.request_json("GET", path, params=params, headers=headers)
+
+    async def get_json_value(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> JsonValue:
+        return await self.request_json_value("GET", path, params=params, headers=headers)
+
+    async def get_json_with_headers(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> tuple[Json, httpx.Headers]:
+        return await self.request_json_with_headers("GET", path, params=params, headers=headers)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from .cassette import cassette_transport_from_settings
+from .client import BaseHttpClient, PoolConfig, httpx_client_kwargs, pool_config_from_settings
+from .single_flight import SingleFlight
+
+_PoolKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class HttpClientRegistry:
+    """Long-lived httpx connection pools shared by every client for a base URL.
+
+    `http_client()` returns a lightweight `BaseHttpClient` that borrows the pool (and the
+    single-flight table) for its base URL, so adapters and ingest functions can create
+    and close clients freely without repeating TCP/TLS handshakes.
+    """
+
+    pool: PoolConfig = field(default_factory=pool_config_from_settings)
+    timeout_s: float = 30.0
+    connect_timeout_s: float = 10.0
+
+    _transport_factory: Callable[[], httpx.BaseTransport | None] = field(
+        default=cassette_transport_from_settings, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pools: dict[_PoolKey, httpx.Client] = {}
+        self._flights: dict[_PoolKey, SingleFlight[httpx.Response]] = {}
+
+    def _pool_for(
+        self, base_url: str, headers: Mapping[str, str]
+    ) -> tuple[httpx.Client, SingleFlight[httpx.Response]]:
+        key: _PoolKey = (base_url.rstrip("/"), tuple(sorted(headers.items())))
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None or pool.is_closed:
+                pool = httpx.Client(
+                    transport=self._transport_factory(),
+                    **httpx_client_kwargs(
+                        base_url,
+                        timeout_s=self.timeout_s,
+                        connect_timeout_s=self.connect_timeout_s,
+                        headers=headers,
+                        pool=self.pool,
+                    ),
+                )
+                self._pools[key] = pool
+                self._flights[key] = SingleFlight()
+            return pool, self._flights[key]
+
+    def http_client(
+        self,
+        base_url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> BaseHttpClient:
+        """Client for `base_url` backed by the shared pool; extra kwargs go to BaseHttpClient."""
+
+        pool, flight = self._pool_for(base_url, headers or {})
+        kwargs.setdefault("single_flight", flight)
+        return BaseHttpClient(
+            base_url=base_url,
+            headers=dict(headers or {}),
+            client=pool,
+            transport=None,
+            pool=self.pool,
+            **kwargs,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+            self._flights.clear()
+
+
+# Process-wide registry used by provider adapters and ingest functions.
+default_http_client_registry = HttpClientRegistry()
+
+
+def shared_http_client(base_url: str, **kwargs: Any) -> BaseHttpClient:
+    return default_http_client_registry.http_client(base_url, **kwargs)
@@ -15,6 +15,14 @@ class ProviderRateLimited(ProviderRequestError):
     """Provider throttled the request (e.g., HTTP 429)."""
 
 
+class ProviderCircuitOpen(ProviderRequestError):
+    """Host has failed repeatedly; requests fail fast until the breaker resets."""
+
+
+class ProviderCassetteMiss(ProviderRequestError):
+    """Replay transport has no recorded exchange for the request."""
+
+
 class ProviderResponseError(ProviderError):
     """Provider returned a well-formed response indicating an application-level error."""
 
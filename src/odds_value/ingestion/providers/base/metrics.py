@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import copy
+import re
+import threading
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is unbounded.
+LATENCY_BUCKETS_S: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_ID_SEGMENT = re.compile(r"\d+|[0-9a-fA-F]{16,}")
+
+HttpEventKind = Literal["response", "error", "cache_hit", "sleep"]
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse id-like path segments so metrics group by endpoint, not by entity."""
+
+    segments = [s for s in path.strip("/").split("/") if s]
+    return "/" + "/".join("{id}" if _ID_SEGMENT.fullmatch(s) else s for s in segments)
+
+
+@dataclass(frozen=True)
+class HttpEvent:
+    """One observable step of a provider request.
+
+    - response: a network attempt completed (any status)
+    - error: a network attempt failed at the transport level
+    - cache_hit: served from the response cache
+    - sleep: time spent waiting (`reason` is "retry" or "rate_limit")
+    """
+
+    kind: HttpEventKind
+    provider: str
+    method: str
+    endpoint: str
+    status_code: int | None = None
+    elapsed_s: float = 0.0
+    bytes_received: int = 0
+    attempt: int = 1
+    reason: str | None = None
+
+
+HttpHook = Callable[[HttpEvent], None]
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    bytes_received: int = 0
+    latency_total_s: float = 0.0
+    latency_buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_S) + 1))
+    status_codes: Counter[int] = field(default_factory=Counter)
+    sleep_s: dict[str, float] = field(default_factory=dict)
+
+    def observe_latency(self, elapsed_s: float) -> None:
+        self.latency_total_s += elapsed_s
+        for i, bound in enumerate(LATENCY_BUCKETS_S):
+            if elapsed_s <= bound:
+                self.latency_buckets[i] += 1
+                return
+        self.latency_buckets[-1] += 1
+
+    def latency_quantile_s(self, q: float) -> float | None:
+        """Histogram upper bound covering quantile `q` (inf for the overflow bucket)."""
+
+        n = sum(self.latency_buckets)
+        if n == 0:
+            return None
+        target = q * n
+        seen = 0
+        for i, count in enumerate(self.latency_buckets):
+            seen += count
+            if seen >= target and count:
+                return LATENCY_BUCKETS_S[i] if i < len(LATENCY_BUCKETS_S) else float("inf")
+        return float("inf")
+
+
+class MetricsRegistry:
+    """Thread-safe per-(provider, method, endpoint) aggregates; usable directly as a hook."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str, str], EndpointStats] = {}
+
+    def __call__(self, event: HttpEvent) -> None:
+        key = (event.provider, event.method.upper(), event.endpoint)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats()
+
+            if event.kind == "sleep":
+                reason = event.reason or "other"
+                stats.sleep_s[reason] = stats.sleep_s.get(reason, 0.0) + event.elapsed_s
+                return
+            if event.kind == "cache_hit":
+                stats.cache_hits += 1
+                return
+
+            stats.requests += 1
+            if event.attempt > 1:
+                stats.retries += 1
+            stats.observe_latency(event.elapsed_s)
+            if event.kind == "error":
+                stats.errors += 1
+                return
+            stats.bytes_received += event.bytes_received
+            if event.status_code is not None:
+                stats.status_codes[event.status_code] += 1
+
+    def snapshot(self) -> dict[tuple[str, str, str], EndpointStats]:
+        with self._lock:
+            return copy.deepcopy(self._stats)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def format_lines(self) -> list[str]:
+        lines: list[str] = []
+        for (provider, method, endpoint), s in sorted(self.snapshot().items()):
+            mean = s.latency_total_s / s.requests if s.requests else 0.0
+            p50 = s.latency_quantile_s(0.5)
+            p95 = s.latency_quantile_s(0.95)
+            parts = [
+                f"http {provider} {method} {endpoint}:",
+                f"requests={s.requests}",
+                f"retries={s.retries}",
+                f"errors={s.errors}",
+                f"cache_hits={s.cache_hits}",
+                f"bytes={s.bytes_received}",
+                f"mean={mean:.3f}s",
+                f"p50<={p50 if p50 is not None else '-'}s",
+                f"p95<={p95 if p95 is not None else '-'}s",
+                "status="
+                + (",".join(f"{k}:{v}" for k, v in sorted(s.status_codes.items())) or "-"),
+            ]
+            parts.extend(
+                f"sleep_{reason}={secs:.1f}s" for reason, secs in sorted(s.sleep_s.items())
+            )
+            lines.append(" ".join(parts))
+        return lines
+
+
+# Process-wide registry every client reports to by default; CLI commands print it.
+default_metrics_registry = MetricsRegistry()
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Protocol
+
+from sqlalchemy import Engine, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from odds_value.core.config import settings
+from odds_value.db.models.ingestion.rate_limit_bucket import RateLimitBucket
+
+
+@dataclass(frozen=True)
+class BucketState:
+    tokens: float
+    updated_at: float
+    blocked_until: float = 0.0
+
+
+def reserve_token(
+    state: BucketState | None, *, now: float, rate_per_s: float, burst: float
+) -> tuple[BucketState, float]:
+    """Reserve one token and return (new_state, seconds_to_wait).
+
+    Tokens may go negative: a negative balance is a queue of reservations, so each
+    caller learns its own wait time from a single atomic update (no retry loop).
+    """
+
+    if state is None:
+        state = BucketState(tokens=burst, updated_at=now)
+
+    elapsed = max(0.0, now - state.updated_at)
+    tokens = min(burst, state.tokens + elapsed * rate_per_s) - 1.0
+
+    wait = 0.0 if tokens >= 0 else -tokens / rate_per_s
+    wait = max(wait, state.blocked_until - now)
+    return BucketState(tokens=tokens, updated_at=now, blocked_until=state.blocked_until), wait
+
+
+def observe_remaining(
+    state: BucketState | None,
+    *,
+    now: float,
+    remaining: int,
+    low_watermark: int,
+    burst: float,
+    cooldown_s: float,
+) -> BucketState:
+    """Fold a provider-reported remaining count into the shared bucket."""
+
+    if state is None:
+        state = BucketState(tokens=burst, updated_at=now)
+
+    # Never believe we hold more tokens than the provider says are left.
+    tokens = min(state.tokens, float(remaining - low_watermark))
+    blocked_until = state.blocked_until
+    if remaining <= low_watermark:
+        blocked_until = max(blocked_until, now + cooldown_s)
+    return BucketState(tokens=tokens, updated_at=state.updated_at, blocked_until=blocked_until)
+
+
+class RateLimitBackend(Protocol):
+    """Shared storage for token buckets, safe to use from several processes."""
+
+    def reserve(self, key: str, *, rate_per_s: float, burst: float) -> float:
+        """Reserve a request slot and return how many seconds to wait before sending."""
+        ...
+
+    def observe(
+        self,
+        key: str,
+        *,
+        remaining: int,
+        low_watermark: int,
+        burst: float,
+        cooldown_s: float,
+    ) -> None:
+        """Record a provider-reported remaining count (from any process)."""
+        ...
+
+
+BucketUpdate = Callable[[BucketState | None, float], BucketState]
+
+
+class _BucketBackend(ABC):
+    """Shared reserve/observe logic; subclasses provide an atomic read-modify-write."""
+
+    @abstractmethod
+    def _update(self, key: str, *, burst: float, fn: BucketUpdate) -> None:
+        """Apply `fn(state, now)` to the bucket `key` atomically and store the result."""
+
+    def reserve(self, key: str, *, rate_per_s: float, burst: float) -> float:
+        wait = 0.0
+
+        def apply(state: BucketState | None, now: float) -> BucketState:
+            nonlocal wait
+            new, wait = reserve_token(state, now=now, rate_per_s=rate_per_s, burst=burst)
+            return new
+
+        self._update(key, burst=burst, fn=apply)
+        return wait
+
+    def observe(
+        self,
+        key: str,
+        *,
+        remaining: int,
+        low_watermark: int,
+        burst: float,
+        cooldown_s: float,
+    ) -> None:
+        self._update(
+            key,
+            burst=burst,
+            fn=lambda state, now: observe_remaining(
+                state,
+                now=now,
+                remaining=remaining,
+                low_watermark=low_watermark,
+                burst=burst,
+                cooldown_s=cooldown_s,
+            ),
+        )
+
+
+@dataclass
+class SqliteRateLimitBackend(_BucketBackend):
+    """Token buckets in a local SQLite file; `BEGIN IMMEDIATE` serializes writers.
+
+    Suitable for several CLI processes on one machine without touching the main DB.
+    """
+
+    path: Path
+    timeout_s: float = 30.0
+
+    _time: Callable[[], float] = field(default=time.time, repr=False)
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, "
+                "blocked_until REAL NOT NULL DEFAULT 0)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout_s, isolation_level=None)
+
+    def _update(self, key: str, *, burst: float, fn: BucketUpdate) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated_at, blocked_until FROM rate_limit_buckets WHERE key = ?",
+                (key,),
+            ).fetchone()
+            state = None if row is None else BucketState(*row)
+            new = fn(state, float(self._time()))
+            conn.execute(
+                "INSERT INTO rate_limit_buckets (key, tokens, updated_at, blocked_until) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "tokens = excluded.tokens, updated_at = excluded.updated_at, "
+                "blocked_until = excluded.blocked_until",
+                (key, new.tokens, new.updated_at, new.blocked_until),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+
+@dataclass
+class DatabaseRateLimitBackend(_BucketBackend):
+    """Token buckets in the `rate_limit_buckets` table of the main database.
+
+    On Postgres the bucket row is locked with `SELECT ... FOR UPDATE`, so Cloud Run
+    tasks on different machines share one budget. SQLite serializes on its DB lock.
+    """
+
+    engine: Engine
+
+    _time: Callable[[], float] = field(default=time.time, repr=False)
+
+    def _update(self, key: str, *, burst: float, fn: BucketUpdate) -> None:
+        insert = postgresql.insert if self.engine.dialect.name == "postgresql" else sqlite.insert
+        with self.engine.begin() as conn:
+            now = float(self._time())
+            # Ensure the row exists so concurrent first callers all lock the same row.
+            conn.execute(
+                insert(RateLimitBucket)
+                .values(key=key, tokens=burst, updated_at=now, blocked_until=0.0)
+                .on_conflict_do_nothing(index_elements=["key"])
+            )
+            row = conn.execute(
+                select(
+                    RateLimitBucket.tokens,
+                    RateLimitBucket.updated_at,
+                    RateLimitBucket.blocked_until,
+                )
+                .where(RateLimitBucket.key == key)
+                .with_for_update()
+            ).one()
+            new = fn(BucketState(*row), now)
+            conn.execute(
+                update(RateLimitBucket)
+                .where(RateLimitBucket.key == key)
+                .values(
+                    tokens=new.tokens,
+                    updated_at=new.updated_at,
+                    blocked_until=new.blocked_until,
+                )
+            )
+
+
+@cache
+def rate_limit_backend_from_settings() -> RateLimitBackend | None:
+    """Shared limiter backend selected by `RATE_LIMIT_BACKEND` (None => in-process only)."""
+
+    backend = settings.rate_limit_backend.lower()
+    if backend == "memory":
+        return None
+    if backend == "sqlite":
+        return SqliteRateLimitBackend(path=Path(settings.rate_limit_sqlite_path))
+    if backend == "database":
+        from odds_value.db import DatabaseConfig, create_db_engine
+
+        return DatabaseRateLimitBackend(
+            engine=create_db_engine(DatabaseConfig(database_url=settings.database_url))
+        )
+    raise ValueError(
+        f"Unknown RATE_LIMIT_BACKEND={settings.rate_limit_backend!r} "
+        "(expected memory, sqlite or database)"
+    )
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from .errors import ProviderCircuitOpen
+
+
+def parse_retry_after(value: str | None, *, now: datetime | None = None) -> float | None:
+    """Parse a `Retry-After` header (delta-seconds or HTTP-date) into seconds."""
+
+    if value is None or not value.strip():
+        return None
+    v = value.strip()
+    try:
+        return max(0.0, float(v))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(v)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    now = now or datetime.now(tz=UTC)
+    return max(0.0, (when - now).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry behavior shared by every provider client.
+
+    - HTTP 429 waits for `Retry-After` (or `rate_limited_wait_s` without one).
+    - 5xx responses, timeouts and network errors back off exponentially with full jitter.
+    - Non-idempotent methods are only retried on 429, where the request was not processed.
+    """
+
+    max_attempts: int = 5
+    backoff_base_s: float = 1.0
+    backoff_max_s: float = 30.0
+    rate_limited_wait_s: float = 60.0
+    max_retry_after_s: float = 300.0
+    retry_statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def backoff_s(self, attempt: int, rand: float) -> float:
+        """Full-jitter backoff for the given 1-based attempt; `rand` is in [0, 1)."""
+
+        ceiling = min(self.backoff_max_s, self.backoff_base_s * (2.0 ** (attempt - 1)))
+        return ceiling * rand
+
+    def retry_after_s(self, header: str | None, fallback: float) -> float:
+        parsed = parse_retry_after(header)
+        if parsed is None:
+            return fallback
+        return min(parsed, self.max_retry_after_s)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+@dataclass
+class _HostState:
+    consecutive_failures: int = 0
+    opened_at: float | None = None
+
+
+@dataclass
+class CircuitBreaker:
+    """Per-host circuit breaker.
+
+    After `failure_threshold` consecutive transport/5xx failures the host is "open" and
+    requests fail fast with ProviderCircuitOpen. Once `reset_timeout_s` has passed a
+    trial request is let through; success closes the circuit, failure re-opens it.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout_s: float = 30.0
+
+    _monotonic: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+
+    def before_request(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state.opened_at is None:
+                return
+            remaining = self.reset_timeout_s - (self._monotonic() - state.opened_at)
+            if remaining > 0:
+                raise ProviderCircuitOpen(
+                    f"Circuit open for {host} after {state.consecutive_failures} failures; "
+                    f"retry in {remaining:.1f}s"
+                )
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostState())
+            state.consecutive_failures += 1
+            if state.consecutive_failures >= self.failure_threshold:
+                state.opened_at = self._monotonic()
+
+
+# Process-wide breaker so every client talking to one host shares its health.
+default_circuit_breaker = CircuitBreaker()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from .cache import cache_key
+
+ResultT = TypeVar("ResultT")
+
+
+def flight_key(
+    method: str,
+    base_url: str,
+    path: str,
+    params: Mapping[str, Any] | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> str:
+    """Cache-style key that also distinguishes per-request headers (e.g. API keys)."""
+
+    key = cache_key(method, base_url, path, params)
+    if not headers:
+        return key
+    raw = "\n".join(f"{k.lower()}:{v}" for k, v in sorted(headers.items()))
+    return f"{key}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]}"
+
+
+@dataclass
+class _Call(Generic[ResultT]):  # noqa: UP046
+    done: threading.Event = field(default_factory=threading.Event)
+    result: ResultT | None = None
+    error: BaseException | None = None
+
+
+class SingleFlight(Generic[ResultT]):  # noqa: UP046
+    """Collapse concurrent calls with the same key into one execution (thread-safe).
+
+    The first caller runs `fn`; callers arriving while it is in flight wait and
+    receive the same result (or exception). Completed calls are not remembered.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call[ResultT]] = {}
+        self.coalesced = 0
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key: str, fn: Callable[[], ResultT]) -> ResultT:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight(Generic[ResultT]):  # noqa: UP046
+    """asyncio flavor of `SingleFlight`; use from a single event loop."""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future[ResultT]] = {}
+        self.coalesced = 0
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        fut = self._calls.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            # Shield so one cancelled waiter does not cancel the shared call.
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._calls[key] = fut
+        try:
+            result = await fn()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                fut.cancel()
+            else:
+                fut.set_exception(e)
+                # Waiters re-raise it; avoid "exception was never retrieved" noise.
+                fut.exception()
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
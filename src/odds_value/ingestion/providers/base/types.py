@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 Json = dict[str, Any]
@@ -32,3 +32,4 @@ class EntityBundle:
     seasons: list[Mapping[str, Any]]
     teams: list[Mapping[str, Any]]
     games: list[Mapping[str, Any]]
+    venues: list[Mapping[str, Any]] = field(default_factory=list)
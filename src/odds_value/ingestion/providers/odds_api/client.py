@@ -1,16 +1,47 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import hashlib
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 from odds_value.core.config import settings
+from odds_value.ingestion.providers.base.cache import CacheRule
 from odds_value.ingestion.providers.base.client import BaseHttpClient
 from odds_value.ingestion.providers.base.errors import ProviderRequestError
 
 ApiItem = dict[str, Any]
 
+# Historical snapshots are immutable; live odds are never cached.
+ODDS_API_CACHE_RULES: tuple[CacheRule, ...] = (CacheRule("/historical/", ttl_s=None),)
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def api_key_fingerprint(api_key: str) -> str:
+    """Stable, non-reversible identifier for an API key (used as the quota ledger key)."""
+
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def estimate_request_cost(*, markets: Sequence[str], regions: str, historical: bool = False) -> int:
+    """Credits The Odds API charges for one odds request.
+
+    Live odds cost 1 per market per region; historical snapshots cost 10x that.
+    """
+
+    n_regions = len([r for r in regions.split(",") if r.strip()]) or 1
+    cost = max(1, len(markets)) * n_regions
+    return cost * 10 if historical else cost
+
 
 def _iso_z(dt: datetime) -> str:
     if dt.tzinfo is None:
@@ -39,10 +70,40 @@ class HistoricalOddsSnapshot:
     items: list[ApiItem]
 
 
+@dataclass(frozen=True)
+class OddsApiQuota:
+    """Usage reported by the `x-requests-*` headers of a single response."""
+
+    remaining: int | None
+    used: int | None
+    last: int | None
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> OddsApiQuota | None:
+        quota = cls(
+            remaining=_parse_int(headers.get("x-requests-remaining")),
+            used=_parse_int(headers.get("x-requests-used")),
+            last=_parse_int(headers.get("x-requests-last")),
+        )
+        # Cached responses carry no usage headers and cost nothing.
+        if quota.remaining is None and quota.used is None and quota.last is None:
+            return None
+        return quota
+
+
 class OddsApiClient:
     def __init__(self, *, http: BaseHttpClient, api_key: str | None = None) -> None:
         self.http = http
         self.api_key = api_key or settings.require_odds_api_key()
+        # Usage from the most recent response (None until a billed response is seen).
+        self.last_quota: OddsApiQuota | None = None
+
+    @property
+    def api_key_hash(self) -> str:
+        return api_key_fingerprint(self.api_key)
+
+    def _observe(self, headers: Mapping[str, str]) -> None:
+        self.last_quota = OddsApiQuota.from_headers(headers)
 
     def get_odds(
         self,
@@ -64,7 +125,10 @@ class OddsApiClient:
         if bookmakers:
             params["bookmakers"] = ",".join(bookmakers)
 
-        value = self.http.get_json_value(f"/sports/{sport_key}/odds", params=params)
+        value, headers = self.http.get_json_value_with_headers(
+            f"/sports/{sport_key}/odds", params=params
+        )
+        self._observe(headers)
         if not isinstance(value, list):
             raise ProviderRequestError(f"Expected list response, got {type(value)}")
 
@@ -74,6 +138,47 @@ class OddsApiClient:
                 items.append(v)
         return items
 
+    def _historical_odds_params(
+        self,
+        *,
+        regions: str,
+        markets: Sequence[str],
+        date: datetime,
+        odds_format: str,
+        bookmakers: Sequence[str] | None,
+    ) -> dict[str, str]:
+        params: dict[str, str] = {
+            "apiKey": self.api_key,
+            "regions": regions,
+            "markets": ",".join(markets),
+            "oddsFormat": odds_format,
+            "date": _iso_z(date),
+        }
+        if bookmakers:
+            params["bookmakers"] = ",".join(bookmakers)
+        return params
+
+    def is_historical_odds_cached(
+        self,
+        *,
+        sport_key: str,
+        regions: str,
+        markets: Sequence[str],
+        date: datetime,
+        odds_format: str = "american",
+        bookmakers: Sequence[str] | None = None,
+    ) -> bool:
+        """True when `get_historical_odds` would be served from the response cache (free)."""
+
+        params = self._historical_odds_params(
+            regions=regions,
+            markets=markets,
+            date=date,
+            odds_format=odds_format,
+            bookmakers=bookmakers,
+        )
+        return self.http.is_cached(f"/historical/sports/{sport_key}/odds", params)
+
     def get_historical_odds(
         self,
         *,
@@ -90,17 +195,17 @@ class OddsApiClient:
         Response: wrapper object containing `timestamp`, `previous_timestamp`, `next_timestamp`, and `data`.
         """
 
-        params: dict[str, str] = {
-            "apiKey": self.api_key,
-            "regions": regions,
-            "markets": ",".join(markets),
-            "oddsFormat": odds_format,
-            "date": _iso_z(date),
-        }
-        if bookmakers:
-            params["bookmakers"] = ",".join(bookmakers)
-
-        payload = self.http.get_json(f"/historical/sports/{sport_key}/odds", params=params)
+        params = self._historical_odds_params(
+            regions=regions,
+            markets=markets,
+            date=date,
+            odds_format=odds_format,
+            bookmakers=bookmakers,
+        )
+        payload, headers = self.http.get_json_with_headers(
+            f"/historical/sports/{sport_key}/odds", params=params
+        )
+        self._observe(headers)
 
         ts = _parse_optional_iso_z(payload.get("timestamp"))
         if ts is None:
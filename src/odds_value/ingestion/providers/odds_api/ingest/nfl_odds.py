@@ -15,16 +15,21 @@ from odds_value.db.models.core.league import League
 from odds_value.db.models.core.season import Season
 from odds_value.db.models.core.team import Team
 from odds_value.db.models.core.team_alias import TeamAlias
-from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
 from odds_value.db.models.odds.book import Book
-from odds_value.db.models.odds.odds_snapshot import OddsSnapshot
 from odds_value.db.repos.core.league_repo import LeagueRepository
 from odds_value.db.repos.core.season_repo import SeasonRepository
 from odds_value.db.repos.core.team_repo import TeamRepository
+from odds_value.db.repos.ingestion.ingested_payload_repo import IngestedPayloadRepository
 from odds_value.db.repos.odds.book_repo import BookRepository
+from odds_value.db.repos.odds.odds_api_quota_repo import OddsApiQuotaLedgerRepository
 from odds_value.db.repos.odds.odds_snapshot_repo import OddsSnapshotRepository
-from odds_value.ingestion.providers.base.client import BaseHttpClient
-from odds_value.ingestion.providers.odds_api.client import OddsApiClient
+from odds_value.ingestion.providers.base.cache import response_cache_from_settings
+from odds_value.ingestion.providers.base.client_registry import shared_http_client
+from odds_value.ingestion.providers.odds_api.client import (
+    ODDS_API_CACHE_RULES,
+    OddsApiClient,
+    estimate_request_cost,
+)
 from odds_value.ingestion.providers.odds_api.parser import (
     ParsedSnapshot,
     norm_team_name,
@@ -45,6 +50,13 @@ class IngestOddsApiNflAsOfSeasonResult:
     snapshots_created: int
     books_created: int
     payloads_created: int
+    dry_run: bool = False
+    batches_planned: int = 0
+    batches_fetched: int = 0
+    credits_estimated: int = 0
+    credits_spent: int = 0
+    requests_remaining: int | None = None
+    stopped_on_budget: bool = False
 
 
 def _as_utc(dt: datetime) -> datetime:
@@ -76,6 +88,32 @@ def _build_team_norms(
     return norms
 
 
+def _flush_snapshots(
+    snap_repo: OddsSnapshotRepository, rows: list[dict[str, Any]], *, update_existing: bool
+) -> int:
+    created = snap_repo.bulk_load(
+        rows,
+        constraint="uq_odds_snapshots_identity",
+        update_cols=("line", "price") if update_existing else (),
+        coalesce_nulls=False,
+    )
+    rows.clear()
+    return created
+
+
+def _exceeds_budget(
+    cost: int,
+    *,
+    credits_spent: int,
+    max_credits: int | None,
+    requests_remaining: int | None,
+    min_remaining: int,
+) -> bool:
+    if max_credits is not None and credits_spent + cost > max_credits:
+        return True
+    return requests_remaining is not None and requests_remaining - cost < min_remaining
+
+
 def ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
     session: Session,
     *,
@@ -87,7 +125,12 @@ def ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
     markets: list[str] | None = None,
     bookmakers: list[str] | None = None,
     items_by_captured_at: dict[datetime, list[ApiItem]] | None = None,
+    snapshot_at_by_captured_at: dict[datetime, datetime] | None = None,
+    update_existing: bool = False,
     commit_every: int = 250,
+    max_credits: int | None = None,
+    min_remaining: int | None = None,
+    dry_run: bool = False,
 ) -> IngestOddsApiNflAsOfSeasonResult:
     """Ingest spreads/totals/moneyline from The Odds API for NFL games in a season.
 
@@ -95,6 +138,16 @@ def ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
     for each unique captured_at using `date=...` historical parameter.
 
     Matching: events are matched to DB games using commence_time (with tolerance) + team alias norms.
+
+    Budget: each uncached batch is charged an estimated cost up front. The run stops cleanly
+    (committing what it has) before it would spend more than `max_credits` or leave fewer than
+    `min_remaining` account credits. `dry_run` only reports the batches and estimated credits.
+    Actual usage from the `x-requests-*` headers is recorded in the quota ledger.
+
+    `items_by_captured_at` replaces the provider calls with already-fetched batches;
+    `snapshot_at_by_captured_at` gives the provider snapshot time each batch was taken at
+    (defaults to the requested time). Existing snapshots are kept as-is unless
+    `update_existing`, which overwrites their line and price (and counts them as created).
     """
 
     if markets is None:
@@ -141,12 +194,34 @@ def ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
     http = (
         None
         if items_by_captured_at is not None
-        else BaseHttpClient(base_url=settings.odds_api_base_url)
+        else shared_http_client(
+            settings.odds_api_base_url,
+            cache=response_cache_from_settings(ODDS_API_CACHE_RULES),
+        )
     )
     client = None if http is None else OddsApiClient(http=http)
 
     sport_key = _sport_key_for_league_key(league_key)
 
+    if max_credits is None:
+        max_credits = settings.odds_api_credit_budget
+    if min_remaining is None:
+        min_remaining = settings.odds_api_min_remaining
+
+    quota_repo = OddsApiQuotaLedgerRepository(session)
+    payload_repo = IngestedPayloadRepository(session)
+    requests_remaining: int | None = None
+    if client is not None:
+        latest = quota_repo.latest(client.api_key_hash)
+        requests_remaining = None if latest is None else latest.requests_remaining
+
+    batch_cost = estimate_request_cost(markets=markets, regions=regions, historical=True)
+    batches_planned = 0
+    batches_fetched = 0
+    credits_estimated = 0
+    credits_spent = 0
+    stopped_on_budget = False
+
     snapshots_created = 0
     books_created = 0
     payloads_created = 0
@@ -157,15 +232,45 @@ def ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
     book_by_key: dict[str, Book] = {b.key: b for b in session.execute(select(Book)).scalars().all()}
 
     processed_games = 0
+    # Snapshots are buffered and bulk-inserted at each commit; existing identities are kept
+    # unless `update_existing`.
+    snapshot_rows: list[dict[str, Any]] = []
     team_norms_cache: dict[int, set[str]] = {}
 
     try:
         for captured_at, batch_games in sorted(games_by_captured_at.items(), key=lambda kv: kv[0]):
             if items_by_captured_at is not None:
-                provider_snapshot_at = captured_at
+                provider_snapshot_at = (snapshot_at_by_captured_at or {}).get(
+                    captured_at, captured_at
+                )
                 items = items_by_captured_at.get(captured_at, [])
             else:
                 assert client is not None
+                cost = (
+                    0
+                    if client.is_historical_odds_cached(
+                        sport_key=sport_key,
+                        regions=regions,
+                        markets=markets,
+                        date=captured_at,
+                        bookmakers=bookmakers,
+                    )
+                    else batch_cost
+                )
+                batches_planned += 1
+                credits_estimated += cost
+                if dry_run:
+                    continue
+                if cost and _exceeds_budget(
+                    cost,
+                    credits_spent=credits_spent,
+                    max_credits=max_credits,
+                    requests_remaining=requests_remaining,
+                    min_remaining=min_remaining,
+                ):
+                    stopped_on_budget = True
+                    break
+
                 snapshot = client.get_historical_odds(
                     sport_key=sport_key,
                     regions=regions,
@@ -176,20 +281,34 @@ def ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
                 )
                 provider_snapshot_at = snapshot.timestamp
                 items = snapshot.items
+                batches_fetched += 1
+
+                quota = client.last_quota
+                if quota is not None:
+                    spent = quota.last if quota.last is not None else cost
+                    credits_spent += spent
+                    if quota.remaining is not None:
+                        requests_remaining = quota.remaining
+                    quota_repo.record(
+                        api_key_hash=client.api_key_hash,
+                        seen_at=datetime.now(tz=UTC),
+                        cost=spent,
+                        requests_used=quota.used,
+                        requests_remaining=quota.remaining,
+                    )
 
             if settings.store_ingested_payloads:
-                session.add(
-                    IngestedPayload(
-                        provider=ProviderEnum.ODDS_API,
-                        entity_type="odds_api_batch",
-                        entity_key=f"{sport_key}:{captured_at.isoformat()}",
-                        fetched_at=datetime.now(tz=UTC),
-                        payload_json={
+                payload_repo.record_many(
+                    {
+                        f"{sport_key}:{captured_at.isoformat()}": {
                             "requested_date": captured_at.isoformat(),
                             "snapshot_timestamp": provider_snapshot_at.isoformat(),
                             "items": items,
-                        },
-                    )
+                        }
+                    },
+                    provider=ProviderEnum.ODDS_API,
+                    entity_type="odds_api_batch",
+                    fetched_at=datetime.now(tz=UTC),
                 )
                 payloads_created += 1
 
@@ -290,34 +409,30 @@ def ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
                                 book_repo.patch(existing, {"name": ps.book_name}, flush=True)
                         book_by_key[ps.book_key] = book
 
-                    existing_snap = snap_repo.first_where(
-                        OddsSnapshot.game_id == game.id,
-                        OddsSnapshot.book_id == book.id,
-                        OddsSnapshot.market_type == ps.market_type,
-                        OddsSnapshot.side_type == ps.side_type,
-                        OddsSnapshot.captured_at == provider_snapshot_at,
+                    snapshot_rows.append(
+                        {
+                            "game_id": game.id,
+                            "book_id": book.id,
+                            "captured_at": provider_snapshot_at,
+                            "market_type": ps.market_type,
+                            "side_type": ps.side_type,
+                            "line": ps.line,
+                            "price": ps.price,
+                            "is_closing": False,
+                            "provider": str(ProviderEnum.ODDS_API),
+                        }
                     )
-                    if existing_snap is None:
-                        snap_repo.add(
-                            OddsSnapshot(
-                                game_id=game.id,
-                                book_id=book.id,
-                                captured_at=provider_snapshot_at,
-                                market_type=ps.market_type,
-                                side_type=ps.side_type,
-                                line=ps.line,
-                                price=ps.price,
-                                is_closing=False,
-                                provider=str(ProviderEnum.ODDS_API),
-                            ),
-                            flush=False,
-                        )
-                        snapshots_created += 1
 
                 processed_games += 1
                 if commit_every and processed_games % commit_every == 0:
+                    snapshots_created += _flush_snapshots(
+                        snap_repo, snapshot_rows, update_existing=update_existing
+                    )
                     session.commit()
 
+            snapshots_created += _flush_snapshots(
+                snap_repo, snapshot_rows, update_existing=update_existing
+            )
             session.commit()
 
     finally:
@@ -333,4 +448,11 @@ def ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
         snapshots_created=snapshots_created,
         books_created=books_created,
         payloads_created=payloads_created,
+        dry_run=dry_run,
+        batches_planned=batches_planned,
+        batches_fetched=batches_fetched,
+        credits_estimated=credits_estimated,
+        credits_spent=credits_spent,
+        requests_remaining=requests_remaining,
+        stopped_on_budget=stopped_on_budget,
     )
@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from itertools import batched, groupby
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from odds_value.core.config import settings
+from odds_value.db.enums import ProviderEnum
+from odds_value.db.models.core.game import Game
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.provider_league import ProviderLeague
+from odds_value.db.models.core.season import Season
+from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
+from odds_value.db.models.ingestion.payload_body import PayloadBody
+from odds_value.ingestion.payload_archive import ArchivedPayload, iter_archived_payloads
+from odds_value.ingestion.providers.api_sports.ingest.american_football_season import (
+    ingest_api_sports_american_football_season_streaming,
+)
+from odds_value.ingestion.providers.api_sports.ingest.american_football_team_game_stats import (
+    ingest_api_sports_american_football_team_game_stats,
+)
+from odds_value.ingestion.providers.odds_api.ingest.nfl_odds import (
+    ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season,
+)
+
+ApiItem = dict[str, Any]
+
+# Entity types replayed, in dependency order: stats and odds attach to existing games.
+REPLAY_ENTITY_TYPES: tuple[str, ...] = ("game", "team_game_statistics", "odds_api_batch")
+
+# Rows fetched per round trip while streaming the archive.
+_STREAM_BATCH = 1000
+
+# Odds batches applied per chunk.
+_ODDS_BATCHES_PER_CHUNK = 50
+
+
+@dataclass
+class ReplayResult:
+    # Latest payload per entity; superseded versions are never read.
+    payloads_read: int = 0
+    elapsed_s: float = 0.0
+    games_created: int = 0
+    games_updated: int = 0
+    team_stats_games: int = 0
+    team_game_stats_written: int = 0
+    odds_snapshots_created: int = 0
+    # Archived entities that could not be applied (e.g. stats for a game not in the DB).
+    failures: dict[str, int] = field(default_factory=dict)
+
+
+def _archived_in_window(
+    archive_root: Path,
+    *,
+    provider: str,
+    entity_type: str,
+    since: datetime | None,
+    until: datetime | None,
+) -> Iterator[ArchivedPayload]:
+    for archived in iter_archived_payloads(
+        archive_root,
+        provider=provider,
+        entity_type=entity_type,
+        since=None if since is None else since.date(),
+        until=None if until is None else until.date(),
+    ):
+        fetched_at = _as_utc(archived.fetched_at)
+        if (since is None or fetched_at >= _as_utc(since)) and (
+            until is None or fetched_at < _as_utc(until)
+        ):
+            yield archived
+
+
+def _iter_latest_payloads(
+    session: Session,
+    *,
+    provider: str,
+    entity_type: str,
+    since: datetime | None,
+    until: datetime | None,
+    archive_root: Path | None,
+) -> Iterator[tuple[str, Any]]:
+    """Latest archived payload per entity key, streamed as (entity_key, payload).
+
+    The database picks the latest row per key itself and rows arrive in entity_key order.
+    Exported partition files (older than anything left in the DB) only fill in keys with
+    no row in the window; a first pass over them indexes each key's latest fetched_at so
+    payloads are never all held at once.
+    """
+
+    window = [IngestedPayload.provider == provider, IngestedPayload.entity_type == entity_type]
+    if since is not None:
+        window.append(IngestedPayload.fetched_at >= since)
+    if until is not None:
+        window.append(IngestedPayload.fetched_at < until)
+
+    if archive_root is not None:
+        in_db = set(session.scalars(select(IngestedPayload.entity_key).where(*window).distinct()))
+        newest: dict[str, datetime] = {}
+        archived = partial(
+            _archived_in_window,
+            archive_root,
+            provider=provider,
+            entity_type=entity_type,
+            since=since,
+            until=until,
+        )
+        for entry in archived():
+            key = entry.entity_key
+            if key not in in_db and entry.fetched_at >= newest.get(key, entry.fetched_at):
+                newest[key] = entry.fetched_at
+        del in_db
+        for entry in archived():
+            # Popped so a row repeated by a rerun export is replayed once.
+            if newest.get(entry.entity_key) == entry.fetched_at:
+                del newest[entry.entity_key]
+                yield entry.entity_key, entry.payload
+
+    ranked = (
+        select(
+            IngestedPayload.id,
+            func.row_number()
+            .over(
+                partition_by=IngestedPayload.entity_key,
+                order_by=(IngestedPayload.fetched_at.desc(), IngestedPayload.id.desc()),
+            )
+            .label("recency"),
+        )
+        .where(*window)
+        .subquery()
+    )
+    stmt = (
+        select(IngestedPayload.entity_key, PayloadBody.payload_json, PayloadBody.payload_compressed)
+        .join(ranked, ranked.c.id == IngestedPayload.id)
+        .join(PayloadBody, PayloadBody.content_hash == IngestedPayload.content_hash)
+        .where(ranked.c.recency == 1)
+        .order_by(IngestedPayload.entity_key)
+        .execution_options(yield_per=_STREAM_BATCH)
+    )
+    for entity_key, plain, packed in session.execute(stmt):
+        yield entity_key, plain if plain is not None else packed
+
+
+def _as_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC)
+
+
+def _count_failure(result: ReplayResult, reason: str) -> None:
+    result.failures[reason] = result.failures.get(reason, 0) + 1
+
+
+@contextmanager
+def _archiving_disabled() -> Iterator[None]:
+    # Replayed items came from the archive; writing them back would only add lookup rows.
+    previous = settings.store_ingested_payloads
+    settings.store_ingested_payloads = False
+    try:
+        yield
+    finally:
+        settings.store_ingested_payloads = previous
+
+
+def _replay_games(
+    session: Session,
+    payloads: Iterable[tuple[str, ApiItem]],
+    result: ReplayResult,
+    *,
+    chunk_size: int,
+) -> None:
+    league_key_by_provider_id = dict(
+        session.execute(
+            select(ProviderLeague.provider_league_id, League.league_key)
+            .join(League, League.id == ProviderLeague.league_id)
+            .where(ProviderLeague.provider == ProviderEnum.API_SPORTS)
+        ).all()
+    )
+
+    for chunk in batched(payloads, max(1, chunk_size), strict=False):
+        result.payloads_read += len(chunk)
+        by_season: dict[tuple[str, int], list[ApiItem]] = defaultdict(list)
+        for _, item in chunk:
+            league_obj = item.get("league")
+            if not isinstance(league_obj, dict):
+                _count_failure(result, "game: no league")
+                continue
+            league_key = league_key_by_provider_id.get(str(league_obj.get("id")))
+            season = league_obj.get("season")
+            season_year = (
+                int(season) if isinstance(season, int | str) and str(season).isdigit() else None
+            )
+            if league_key is None or season_year is None:
+                _count_failure(result, "game: unknown league/season")
+                continue
+            by_season[(league_key, season_year)].append(item)
+
+        for (league_key, season_year), season_items in sorted(by_season.items()):
+            season = ingest_api_sports_american_football_season_streaming(
+                session,
+                league_key=league_key,
+                season_year=season_year,
+                items=season_items,
+                chunk_size=chunk_size,
+                force=True,
+            )
+            result.games_created += season.games_created
+            result.games_updated += season.games_updated
+
+
+def _replay_team_stats(
+    session: Session,
+    payloads: Iterable[tuple[str, ApiItem]],
+    result: ReplayResult,
+    *,
+    commit_every: int,
+) -> None:
+    # Keys are "<game>:<team>" and DB rows arrive in key order, so a game's items are adjacent
+    # (a game split between archive files and the DB is simply applied twice).
+    by_game = groupby(payloads, key=lambda kv: kv[0].partition(":")[0])
+    for idx, (provider_game_id, entries) in enumerate(by_game, start=1):
+        game_items = [item for _, item in entries]
+        result.payloads_read += len(game_items)
+        try:
+            with session.begin_nested():
+                stats = ingest_api_sports_american_football_team_game_stats(
+                    session, provider_game_id=provider_game_id, items=game_items, force=True
+                )
+        except Exception as exc:
+            _count_failure(result, f"team_game_statistics: {exc.__class__.__name__}")
+            continue
+        result.team_stats_games += 1
+        result.team_game_stats_written += (
+            stats.team_game_stats_created + stats.team_game_stats_updated
+        )
+        if commit_every > 0 and idx % commit_every == 0:
+            session.commit()
+    session.commit()
+
+
+def _replay_odds(
+    session: Session,
+    payloads: Iterable[tuple[str, Any]],
+    result: ReplayResult,
+    *,
+    as_of_hours: int,
+    commit_every: int,
+) -> None:
+    # Each batch holds a whole slate of events, so only a few are resident at a time.
+    for chunk in batched(payloads, _ODDS_BATCHES_PER_CHUNK, strict=False):
+        result.payloads_read += len(chunk)
+        _replay_odds_chunk(
+            session, chunk, result, as_of_hours=as_of_hours, commit_every=commit_every
+        )
+
+
+def _replay_odds_chunk(
+    session: Session,
+    payloads: Iterable[tuple[str, Any]],
+    result: ReplayResult,
+    *,
+    as_of_hours: int,
+    commit_every: int,
+) -> None:
+    items_by_captured_at: dict[datetime, list[ApiItem]] = {}
+    snapshot_at_by_captured_at: dict[datetime, datetime] = {}
+    for entity_key, payload in payloads:
+        sport_key, _, captured = entity_key.partition(":")
+        if sport_key != "americanfootball_nfl" or not isinstance(payload, dict):
+            continue
+        items = payload.get("items")
+        if not isinstance(items, list):
+            continue
+        captured_at = _as_utc(datetime.fromisoformat(captured))
+        items_by_captured_at[captured_at] = items
+        # Snapshots were stored under the provider's snapshot time, not the requested one.
+        snapshot_at = payload.get("snapshot_timestamp")
+        if isinstance(snapshot_at, str):
+            snapshot_at_by_captured_at[captured_at] = _as_utc(datetime.fromisoformat(snapshot_at))
+    if not items_by_captured_at:
+        return
+
+    first, last = min(items_by_captured_at), max(items_by_captured_at)
+    # Only seasons whose kickoffs could map onto an archived batch.
+    spans = session.execute(
+        select(Season.year, func.min(Game.start_time), func.max(Game.start_time))
+        .join(League, League.id == Season.league_id)
+        .join(Game, Game.season_id == Season.id)
+        .where(League.league_key == "NFL")
+        .group_by(Season.year)
+        .order_by(Season.year)
+    ).all()
+    seasons = [
+        year
+        for year, earliest, latest in spans
+        if earliest is not None
+        and _as_utc(latest) >= first
+        and _as_utc(earliest) <= last + timedelta(hours=as_of_hours + 1)
+    ]
+
+    for season_year in seasons:
+        odds = ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
+            session,
+            league_key="NFL",
+            season_year=season_year,
+            as_of_hours=as_of_hours,
+            items_by_captured_at=items_by_captured_at,
+            snapshot_at_by_captured_at=snapshot_at_by_captured_at,
+            update_existing=True,
+            commit_every=commit_every,
+        )
+        result.odds_snapshots_created += odds.snapshots_created
+
+
+def replay_ingested_payloads(
+    session: Session,
+    *,
+    entity_types: Sequence[str] = REPLAY_ENTITY_TYPES,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    as_of_hours: int = 6,
+    chunk_size: int = 500,
+    commit_every: int = 250,
+    archive_root: Path | None = None,
+) -> ReplayResult:
+    """Rebuild games, team-game stats and odds snapshots from the `IngestedPayload` archive.
+
+    Only the latest archived payload of each entity is read, streamed per entity type and
+    fed in bounded chunks to the regular ingest functions through their `items` parameters
+    with `force=True`, so the current mapping is re-applied with batched writes and no
+    provider requests. `since`/`until` bound fetched_at. Odds batches are
+    matched to games with `as_of_hours`, which must match the original ingest; replayed
+    snapshots keep the archived provider snapshot time and overwrite stored line and price.
+    With `archive_root`, payloads exported by `export_ingested_payloads` are replayed too.
+    """
+
+    unknown = set(entity_types) - set(REPLAY_ENTITY_TYPES)
+    if unknown:
+        raise ValueError(
+            f"Unknown replay entity types {sorted(unknown)} (expected {REPLAY_ENTITY_TYPES})"
+        )
+
+    started = time.monotonic()
+    result = ReplayResult()
+    with _archiving_disabled():
+        for entity_type in REPLAY_ENTITY_TYPES:
+            if entity_type not in entity_types:
+                continue
+            provider = (
+                ProviderEnum.ODDS_API
+                if entity_type == "odds_api_batch"
+                else ProviderEnum.API_SPORTS
+            )
+            payloads = _iter_latest_payloads(
+                session,
+                provider=provider,
+                entity_type=entity_type,
+                since=since,
+                until=until,
+                archive_root=archive_root,
+            )
+            if entity_type == "game":
+                _replay_games(session, payloads, result, chunk_size=chunk_size)
+            elif entity_type == "team_game_statistics":
+                _replay_team_stats(session, payloads, result, commit_every=commit_every)
+            else:
+                _replay_odds(
+                    session,
+                    payloads,
+                    result,
+                    as_of_hours=as_of_hours,
+                    commit_every=commit_every,
+                )
+            session.commit()
+
+    result.elapsed_s = time.monotonic() - started
+    return result
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from odds_value.ingestion.providers.api_sports.client import AsyncApiSportsClient
+from odds_value.ingestion.providers.base.client import AsyncBaseHttpClient
+from odds_value.ingestion.providers.base.errors import ProviderRequestError
+from odds_value.ingestion.providers.base.retry import NO_RETRY
+
+
+async def test_async_api_sports_client_bounds_in_flight_requests() -> None:
+    in_flight = 0
+    max_seen = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_seen
+        assert request.headers["x-apisports-key"] == "k"
+        in_flight += 1
+        max_seen = max(max_seen, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        game_id = request.url.params["game"]
+        return httpx.Response(200, json={"response": [{"game": game_id}], "errors": []})
+
+    http = AsyncBaseHttpClient(
+        base_url="https://example.test", transport=httpx.MockTransport(handler)
+    )
+    client = AsyncApiSportsClient(http=http, api_key="k", max_in_flight=3)
+    try:
+        results = await asyncio.gather(
+            *(
+                client.get_response_items("/games/statistics/teams", params={"game": str(i)})
+                for i in range(10)
+            )
+        )
+    finally:
+        await http.aclose()
+
+    assert [r[0]["game"] for r in results] == [str(i) for i in range(10)]
+    assert 1 < max_seen <= 3
+
+
+async def test_async_base_http_client_maps_status_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={})
+
+    async with AsyncBaseHttpClient(
+        base_url="https://example.test",
+        transport=httpx.MockTransport(handler),
+        retry_policy=NO_RETRY,
+        circuit_breaker=None,
+    ) as http:
+        with pytest.raises(ProviderRequestError):
+            await http.get_json("/games")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+import pytest
+
+from odds_value.db.enums import GameStatusEnum
+from odds_value.ingestion.providers.api_sports.adapters.football import ApiSportsFootballAdapter
+from odds_value.ingestion.providers.api_sports.client import ApiSportsClient
+from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.providers.base.errors import ProviderCapabilityError
+from odds_value.ingestion.providers.base.types import IngestQuery
+
+
+def _item(game_id: int, day: int, home: int, away: int, venue: str | None) -> dict[str, Any]:
+    ts = int(datetime(2025, 9, day, 17, 0, tzinfo=UTC).timestamp())
+    return {
+        "game": {
+            "id": game_id,
+            "date": {"timestamp": ts},
+            "venue": {"name": venue, "city": None},
+            "status": {"short": "FT"},
+        },
+        "league": {"id": 1, "name": "NFL", "season": "2025"},
+        "teams": {
+            "home": {"id": home, "name": f"Team {home}", "logo": None},
+            "away": {"id": away, "name": f"Team {away}", "logo": None},
+        },
+        "scores": {"home": {"total": 21}, "away": {"total": 14}},
+    }
+
+
+GAME_DAYS = {1: 7, 2: 7, 3: 14}
+ITEMS = [
+    _item(1, GAME_DAYS[1], 10, 11, "Stadium A"),
+    _item(2, GAME_DAYS[2], 12, 13, "Stadium A"),
+    _item(3, GAME_DAYS[3], 10, 12, None),
+    {"game": {"id": 4}, "teams": {}},  # malformed, dropped
+]
+
+
+def _adapter(seen: list[httpx.Request], provider_league_id: str | None = "1") -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        params = request.url.params
+        if "date" in params:
+            day = int(params["date"][-2:])
+            items = [i for i in ITEMS if GAME_DAYS.get(i["game"]["id"]) == day]
+        else:
+            items = ITEMS
+        return httpx.Response(200, json={"errors": [], "response": items})
+
+    http = BaseHttpClient(
+        base_url="https://adapter.test",
+        transport=httpx.MockTransport(handler),
+        circuit_breaker=None,
+    )
+    return ApiSportsFootballAdapter(
+        client=ApiSportsClient(http=http, api_key="k"),
+        league_key="NFL",
+        provider_league_id=provider_league_id,
+    )
+
+
+def test_season_fetch_returns_normalized_bundle() -> None:
+    seen: list[httpx.Request] = []
+    bundle = _adapter(seen).fetch_entities(IngestQuery(league_key="NFL", season_year=2025))
+
+    assert [dict(r.url.params) for r in seen] == [{"league": "1", "season": "2025"}]
+    assert bundle.leagues == [{"league_key": "NFL", "provider_league_id": "1", "name": "NFL"}]
+    assert bundle.seasons == [{"league_key": "NFL", "year": 2025}]
+    assert sorted(t["provider_team_id"] for t in bundle.teams) == ["10", "11", "12", "13"]
+    assert bundle.venues == [{"name": "Stadium A", "city": None}]
+    assert [g["provider_game_id"] for g in bundle.games] == ["1", "2", "3"]
+    game = bundle.games[0]
+    assert game["status"] == GameStatusEnum.FINAL
+    assert (game["home_score"], game["away_score"]) == (21, 14)
+    assert game["home_provider_team_id"] == "10"
+    assert bundle.games[2]["venue_name"] is None
+
+
+def test_date_range_fetch_narrows_season_or_walks_days() -> None:
+    seen: list[httpx.Request] = []
+    adapter = _adapter(seen)
+
+    in_season = adapter.fetch_entities(
+        IngestQuery(league_key="NFL", season_year=2025, date_from="2025-09-10")
+    )
+    assert [g["provider_game_id"] for g in in_season.games] == ["3"]
+    assert len(seen) == 1
+
+    seen.clear()
+    by_day = adapter.fetch_entities(
+        IngestQuery(league_key="NFL", date_from="2025-09-06", date_to="2025-09-08")
+    )
+    assert [r.url.params["date"] for r in seen] == ["2025-09-06", "2025-09-07", "2025-09-08"]
+    assert [g["provider_game_id"] for g in by_day.games] == ["1", "2"]
+
+
+def test_range_queries_need_a_provider_league_id() -> None:
+    adapter = _adapter([], provider_league_id=None)
+    with pytest.raises(ProviderCapabilityError):
+        adapter.fetch_entities(IngestQuery(league_key="NFL", season_year=2025))
+    with pytest.raises(ProviderCapabilityError):
+        _adapter([]).fetch_entities(IngestQuery(league_key="NFL"))
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import httpx
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.core.config import settings
+from odds_value.db.base import Base
+from odds_value.db.enums import GameStatusEnum, ProviderEnum, SportEnum
+from odds_value.db.models.core.game import Game
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.provider_league import ProviderLeague
+from odds_value.db.models.core.provider_sport import ProviderSport
+from odds_value.db.models.core.provider_team import ProviderTeam
+from odds_value.db.models.core.season import Season
+from odds_value.db.models.core.team import Team
+from odds_value.ingestion.providers.api_sports.ingest import american_football_live as live_ingest
+from odds_value.ingestion.providers.api_sports.ingest.american_football_live import (
+    ingest_api_sports_american_football_live,
+)
+from odds_value.ingestion.providers.base.client import BaseHttpClient
+
+NOW = datetime(2025, 10, 12, 23, 0, tzinfo=UTC)
+
+# provider_game_id -> (start_time, stored status, source_last_seen_at)
+GAMES: dict[str, tuple[datetime, GameStatusEnum, datetime | None]] = {
+    "40001": (NOW - timedelta(hours=1), GameStatusEnum.IN_PROGRESS, NOW - timedelta(minutes=5)),
+    "40002": (NOW - timedelta(hours=3), GameStatusEnum.SCHEDULED, None),
+    "40003": (NOW - timedelta(hours=6), GameStatusEnum.FINAL, NOW - timedelta(hours=2)),
+    "40004": (NOW + timedelta(hours=1, minutes=30), GameStatusEnum.SCHEDULED, None),
+    # outside the window
+    "40005": (NOW - timedelta(hours=10), GameStatusEnum.FINAL, NOW - timedelta(hours=7)),
+    "40006": (NOW + timedelta(days=7), GameStatusEnum.SCHEDULED, None),
+}
+
+
+def _seed() -> Session:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+    session.add(nfl)
+    session.flush()
+    session.add(
+        ProviderSport(
+            provider=ProviderEnum.API_SPORTS,
+            sport=SportEnum.FOOTBALL,
+            base_url="https://live.test",
+        )
+    )
+    session.add(
+        ProviderLeague(
+            provider=ProviderEnum.API_SPORTS,
+            league_id=nfl.id,
+            provider_league_id="1",
+            provider_league_name="NFL",
+        )
+    )
+    season = Season(league_id=nfl.id, year=2025, name="2025")
+    home = Team(league_id=nfl.id, provider_team_id="12", name="Philadelphia Eagles")
+    away = Team(league_id=nfl.id, provider_team_id="10", name="Cincinnati Bengals")
+    session.add_all([season, Season(league_id=nfl.id, year=2024, name="2024"), home, away])
+    session.flush()
+    session.add_all(
+        [
+            ProviderTeam(provider=ProviderEnum.API_SPORTS, team_id=home.id, provider_team_id="12"),
+            ProviderTeam(provider=ProviderEnum.API_SPORTS, team_id=away.id, provider_team_id="10"),
+        ]
+    )
+    session.add_all(
+        Game(
+            league_id=nfl.id,
+            season_id=season.id,
+            provider=ProviderEnum.API_SPORTS,
+            provider_game_id=pgid,
+            start_time=start,
+            status=status,
+            home_team_id=home.id,
+            away_team_id=away.id,
+            source_last_seen_at=seen,
+        )
+        for pgid, (start, status, seen) in GAMES.items()
+    )
+    session.commit()
+    return session
+
+
+def _item(pgid: str) -> dict[str, Any]:
+    start = GAMES[pgid][0]
+    return {
+        "game": {
+            "id": int(pgid),
+            "date": {"timestamp": int(start.timestamp())},
+            "venue": {"name": "Lincoln Financial Field", "city": "Philadelphia"},
+            "status": {"short": "FT" if start <= NOW - timedelta(hours=1) else "NS"},
+        },
+        "league": {"id": 1, "name": "NFL", "season": "2025"},
+        "teams": {
+            "home": {"id": 12, "name": "Philadelphia Eagles"},
+            "away": {"id": 10, "name": "Cincinnati Bengals"},
+        },
+        "scores": {"home": {"total": 24}, "away": {"total": 17}},
+    }
+
+
+def _use_transport(monkeypatch: pytest.MonkeyPatch, seen: list[httpx.Request]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        params = request.url.params
+        if "id" in params:
+            pgids = [params["id"]]
+        else:
+            pgids = [
+                p
+                for p, (start, _, _) in GAMES.items()
+                if start.date().isoformat() == params["date"]
+            ]
+        return httpx.Response(200, json={"errors": [], "response": [_item(p) for p in pgids]})
+
+    monkeypatch.setattr(settings, "api_sports_key", "k")
+    monkeypatch.setattr(
+        live_ingest,
+        "shared_http_client",
+        lambda base_url, **_: BaseHttpClient(
+            base_url=base_url, transport=httpx.MockTransport(handler), circuit_breaker=None
+        ),
+    )
+
+
+def test_live_refresh_fetches_only_games_in_the_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = _seed()
+    seen: list[httpx.Request] = []
+    _use_transport(monkeypatch, seen)
+
+    result = ingest_api_sports_american_football_live(
+        session, league_key="NFL", now=NOW, lookback_hours=4, lookahead_hours=2
+    )
+    session.commit()
+
+    assert result.candidates == 4
+    assert result.seasons == (2025,)
+    # Three candidates on 2025-10-12 share one date request; the lone 10-13 game goes by id.
+    assert [dict(r.url.params) for r in seen] == [
+        {"league": "1", "season": "2025", "date": "2025-10-12"},
+        {"id": "40004"},
+    ]
+    assert result.requests == 2
+    statuses = dict(session.execute(sa.select(Game.provider_game_id, Game.status)).all())
+    assert statuses["40001"] == GameStatusEnum.FINAL
+    assert statuses["40006"] == GameStatusEnum.SCHEDULED
+
+    # Nothing new upstream: the same window re-fetches but writes nothing.
+    again = ingest_api_sports_american_football_live(
+        session, league_key="NFL", now=NOW, lookback_hours=4, lookahead_hours=2
+    )
+    assert again.games_updated == 0
+    assert again.games_unchanged == again.games_seen
+
+
+def test_live_refresh_skips_quiet_leagues_without_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _seed()
+    seen: list[httpx.Request] = []
+    _use_transport(monkeypatch, seen)
+    quiet = NOW + timedelta(days=3)
+    session.execute(
+        sa.update(Game)
+        .where(Game.status == GameStatusEnum.IN_PROGRESS)
+        .values(status=GameStatusEnum.FINAL)
+    )
+
+    result = ingest_api_sports_american_football_live(session, league_key="NFL", now=quiet)
+
+    assert result.candidates == 0
+    assert result.requests == 0
+    assert seen == []
@@ -40,10 +40,21 @@ def test_api_sports_rate_limiter_uses_headers_for_minute_cooldown() -> None:
     assert 60.0 in sleeps
 
 
+def test_api_sports_rate_limiter_cooldown_holds_the_pacing_lock() -> None:
+    held: list[bool] = []
+    limiter = ApiSportsRateLimiter(_monotonic=lambda: 0.0)
+    limiter._sleep = lambda _: held.append(limiter._lock.locked())
+
+    limiter.after_response({"X-RateLimit-Limit": "300", "X-RateLimit-Remaining": "0"})
+
+    assert held == [True]
+    assert not limiter._lock.locked()
+
+
 def test_api_sports_client_reads_rate_limit_headers() -> None:
     class DummyHttp(BaseHttpClient):
         def __init__(self) -> None:
-            pass
+            self.single_flight = None
 
         def get_json_with_headers(
             self, path: str, *, params: Any | None = None, headers: Any | None = None
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter
+
+from odds_value.ingestion.providers.api_sports import normalize
+from odds_value.ingestion.providers.api_sports.schemas import (
+    GameItem,
+    ItemDecoder,
+    SchemaDriftRegistry,
+    TeamStatsItem,
+)
+
+GAMES = TypeAdapter(GameItem)
+
+
+def test_games_decoder_types_items_and_reports_drift() -> None:
+    registry = SchemaDriftRegistry()
+    decoder = ItemDecoder("/games", TypeAdapter(GameItem), registry=registry)
+    good = {
+        "game": {
+            "id": 17394,
+            "date": {"timestamp": 1760288400},
+            "venue": {"name": "Lucas Oil Stadium", "city": None},
+            "status": {"short": "FT", "long": "Finished"},
+        },
+        "league": {"id": 1, "name": "NFL", "season": "2025"},
+        "teams": {
+            "home": {"id": 21, "name": "Indianapolis Colts"},
+            "away": {"id": 11, "name": "Arizona Cardinals"},
+        },
+        "scores": {"home": {"total": 31, "quarter_1": 7}, "away": {"total": None}},
+    }
+    drifted = {"game": {"id": "abc", "date": "2025-10-12T17:00:00Z"}, "teams": {"home": {}}}
+
+    ((raw, item),) = decoder.decode([good, drifted])
+
+    assert raw is good
+    assert item["game"]["id"] == 17394
+    assert item.get("league") == {"id": 1, "name": "NFL", "season": 2025}
+    assert item.get("scores") == {"home": {"total": 31}, "away": {"total": None}}
+
+    stats = registry.snapshot()["/games"]
+    assert (stats.items_seen, stats.items_rejected) == (2, 1)
+    assert stats.errors["game.id: int_parsing"] == 1
+    assert stats.errors["teams.home.id: missing"] == 1
+    (line,) = registry.format_lines()
+    assert line.startswith("schema drift /games: rejected=1/2 |")
+
+
+def test_team_stats_decoder_keeps_only_typed_totals() -> None:
+    registry = SchemaDriftRegistry()
+    decoder = ItemDecoder("/games/statistics/teams", TypeAdapter(TeamStatsItem), registry=registry)
+
+    ((_, item),) = decoder.decode(
+        [
+            {
+                "team": {"id": 12, "name": "Philadelphia Eagles", "logo": "x"},
+                "statistics": {"yards": {"total": 402}, "first_downs": {"total": 21}},
+            }
+        ]
+    )
+
+    assert item["team"]["id"] == 12
+    assert item["statistics"] == {"yards": {"total": 402}, "turnovers": None}
+    assert registry.format_lines() == []
+
+
+def test_normalize_keeps_games_with_malformed_optional_fields(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = SchemaDriftRegistry()
+    monkeypatch.setattr(normalize, "games_decoder", ItemDecoder("/games", GAMES, registry=registry))
+
+    def game(provider_game_id: int, **game: Any) -> dict[str, Any]:
+        return {
+            "game": {
+                "id": provider_game_id,
+                "date": {"timestamp": 1760288400},
+                "venue": {"name": "Lucas Oil Stadium", "city": "Indianapolis"},
+                **game,
+            },
+            "league": {"id": 1, "season": "2025"},
+            "teams": {"home": {"id": 21}, "away": {"id": 11}},
+            "scores": {"home": {"total": 31}, "away": {"total": 20}},
+        }
+
+    dash_score = game(1)
+    dash_score["scores"]["home"]["total"] = "-"
+    bad_season = game(2)
+    bad_season["league"]["season"] = "TBD"
+    bad_city = game(3, venue={"name": "Lucas Oil Stadium", "city": 46204})
+    bad_date = game(4, date="next sunday")
+
+    bundle = normalize.normalize_american_football_games(
+        [dash_score, bad_season, bad_city, bad_date], league_key="NFL"
+    )
+
+    by_id = {g["provider_game_id"]: g for g in bundle.games}
+    assert sorted(by_id) == ["1", "2", "3"]
+    assert (by_id["1"]["home_score"], by_id["1"]["away_score"]) == (None, 20)
+    assert (by_id["2"]["season_year"], by_id["3"]["season_year"]) == (None, 2025)
+    assert by_id["3"]["venue_city"] is None
+    assert bundle.venues == [
+        {"name": "Lucas Oil Stadium", "city": "Indianapolis"},
+        {"name": "Lucas Oil Stadium", "city": None},
+    ]
+
+    # Only the game without a usable date is rejected, and it is counted.
+    stats = registry.snapshot()["/games"]
+    assert (stats.items_seen, stats.items_rejected) == (4, 1)
+    assert stats.errors == {"game.date: unparseable": 1}
@@ -1,21 +1,35 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from typing import Any
 
+import httpx
+import pytest
 import sqlalchemy as sa
 from sqlalchemy.orm import Session
 
 import odds_value.db.models  # noqa: F401
+from odds_value.core.config import settings
 from odds_value.db.base import Base
 from odds_value.db.enums import ProviderEnum, SportEnum
+from odds_value.db.models.core.game import Game
 from odds_value.db.models.core.league import League
 from odds_value.db.models.core.provider_league import ProviderLeague
 from odds_value.db.models.core.provider_sport import ProviderSport
 from odds_value.db.models.core.provider_team import ProviderTeam
+from odds_value.db.models.core.season import Season
+from odds_value.db.models.core.team import Team
 from odds_value.db.models.core.team_alias import TeamAlias
+from odds_value.db.models.core.venue import Venue
+from odds_value.ingestion.providers.api_sports.ingest import (
+    american_football_season as season_ingest,
+)
 from odds_value.ingestion.providers.api_sports.ingest.american_football_season import (
     ingest_api_sports_american_football_season,
+    ingest_api_sports_american_football_season_streaming,
 )
+from odds_value.ingestion.providers.base.client import BaseHttpClient
 
 
 def _make_session() -> Session:
@@ -94,9 +108,98 @@ def test_ingest_api_sports_season_upserts_games_and_teams() -> None:
     session.commit()
 
     assert result2.games_created == 0
-    assert result2.games_updated == 1
+    assert result2.games_updated == 0
+    assert result2.games_unchanged == 1
     assert result2.teams_created == 0
 
+    # a changed item is re-applied
+    items[0]["scores"] = {"home": {"total": 34}, "away": {"total": 27}}
+    result3 = ingest_api_sports_american_football_season(
+        session,
+        league_key="NFL",
+        season_year=2025,
+        items=items,
+    )
+    session.commit()
+
+    assert result3.games_updated == 1
+    assert result3.games_unchanged == 0
+    assert session.query(Game).one().home_score == 34
+
+
+def test_concurrent_season_ingests_on_empty_league_converge(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = sa.create_engine(f"sqlite+pysqlite:///{tmp_path / 'race.db'}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as seed:
+        nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+        seed.add(nfl)
+        seed.flush()
+        seed.add(
+            ProviderSport(
+                provider=ProviderEnum.API_SPORTS,
+                sport=SportEnum.FOOTBALL,
+                base_url="https://example.test",
+            )
+        )
+        seed.add(
+            ProviderLeague(
+                provider=ProviderEnum.API_SPORTS,
+                league_id=nfl.id,
+                provider_league_id="1",
+                provider_league_name="NFL",
+            )
+        )
+        seed.add(Season(league_id=nfl.id, year=2025, name="2025"))
+        seed.commit()
+
+    ts = int(datetime(2025, 10, 12, 17, 0, tzinfo=UTC).timestamp())
+    items: list[dict[str, Any]] = [
+        {
+            "game": {"id": 17394, "date": {"timestamp": ts}, "status": {"short": "FT"}},
+            "league": {"id": 1, "name": "NFL", "season": "2025"},
+            "teams": {
+                "home": {"id": 21, "name": "Indianapolis Colts"},
+                "away": {"id": 11, "name": "Arizona Cardinals"},
+            },
+        }
+    ]
+
+    # The other ingest commits the same teams after this one has loaded its (empty)
+    # dimensions, so every mapping and alias this one writes already exists.
+    load_dims = season_ingest._load_season_dimensions
+    raced = False
+
+    def load_then_race(session: Session, **kwargs: Any) -> Any:
+        nonlocal raced
+        dims = load_dims(session, **kwargs)
+        if not raced:
+            raced = True
+            session.commit()
+            with Session(engine) as other:
+                ingest_api_sports_american_football_season(
+                    other, league_key="NFL", season_year=2025, items=items
+                )
+                other.commit()
+        return dims
+
+    monkeypatch.setattr(season_ingest, "_load_season_dimensions", load_then_race)
+
+    with Session(engine) as session:
+        ingest_api_sports_american_football_season(
+            session, league_key="NFL", season_year=2025, items=items
+        )
+        session.commit()
+
+        assert raced
+        assert session.query(Team).count() == 2
+        assert session.query(ProviderTeam).count() == 2
+        assert session.query(TeamAlias).count() == 2
+        game = session.query(Game).one()
+        mapped = {pt.provider_team_id: pt.team_id for pt in session.query(ProviderTeam).all()}
+        assert (game.home_team_id, game.away_team_id) == (mapped["21"], mapped["11"])
+
 
 def test_ingest_api_sports_season_excludes_non_regular_season_by_default() -> None:
     session = _make_session()
@@ -185,3 +288,137 @@ def test_ingest_api_sports_season_excludes_non_regular_season_by_default() -> No
 
     assert result_regular_only.games_seen == 3
     assert result_regular_only.games_created == 1
+
+
+def test_ingest_api_sports_season_resolves_dimensions_without_per_item_queries() -> None:
+    session = _make_session()
+
+    nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+    session.add(nfl)
+    session.commit()
+
+    ts = int(datetime(2025, 10, 12, 17, 0, tzinfo=UTC).timestamp())
+    items = [
+        {
+            "game": {
+                "id": 500 + i,
+                "date": {"timestamp": ts},
+                "venue": {"name": "Lucas Oil Stadium", "city": None},
+                "status": {"short": "FT"},
+            },
+            "teams": {
+                "home": {"id": 21, "name": "Indianapolis Colts", "logo": "x"},
+                "away": {"id": 11 + i % 3, "name": f"Team {11 + i % 3}", "logo": "y"},
+            },
+            "scores": {"home": {"total": 31}, "away": {"total": 27}},
+        }
+        for i in range(30)
+    ]
+
+    selects: list[str] = []
+
+    def count_selects(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    sa.event.listen(session.get_bind(), "before_cursor_execute", count_selects)
+
+    result1 = ingest_api_sports_american_football_season(
+        session, league_key="NFL", season_year=2025, items=items
+    )
+    session.commit()
+    first_run_selects = len(selects)
+
+    selects.clear()
+    result2 = ingest_api_sports_american_football_season(
+        session, league_key="NFL", season_year=2025, items=items, force=True
+    )
+    session.commit()
+
+    assert result1.games_created == 30
+    assert result1.teams_created == 4
+    assert result2.games_created == 0
+    assert result2.games_updated == 30
+
+    # Only the preload queries (plus refreshes of expired rows) run, not per-item lookups.
+    assert first_run_selects < 15
+    assert len(selects) < 15
+
+    # A NULL city still matches the same venue instead of creating duplicates.
+    assert session.query(Venue).count() == 1
+
+
+def test_streaming_season_ingest_commits_in_chunks_with_bounded_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _make_session()
+
+    nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+    session.add(nfl)
+    session.flush()
+    session.add(
+        ProviderSport(
+            provider=ProviderEnum.API_SPORTS,
+            sport=SportEnum.FOOTBALL,
+            base_url="https://stream.test",
+        )
+    )
+    session.add(
+        ProviderLeague(
+            provider=ProviderEnum.API_SPORTS,
+            league_id=nfl.id,
+            provider_league_id="1",
+            provider_league_name="NFL",
+        )
+    )
+    session.commit()
+
+    ts = int(datetime(2025, 10, 12, 17, 0, tzinfo=UTC).timestamp())
+    body = {
+        "errors": [],
+        "response": [
+            {
+                "game": {"id": 900 + i, "date": {"timestamp": ts}, "status": {"short": "FT"}},
+                "teams": {
+                    "home": {"id": 21, "name": "Indianapolis Colts"},
+                    "away": {"id": 11, "name": "Arizona Cardinals"},
+                },
+                "scores": {"home": {"total": i}, "away": {"total": 0}},
+            }
+            for i in range(45)
+        ],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["season"] == "2025"
+        return httpx.Response(200, json=body)
+
+    monkeypatch.setattr(settings, "api_sports_key", "k")
+    monkeypatch.setattr(
+        season_ingest,
+        "shared_http_client",
+        lambda base_url, **_: BaseHttpClient(
+            base_url=base_url, transport=httpx.MockTransport(handler), circuit_breaker=None
+        ),
+    )
+
+    identity_sizes: list[int] = []
+    items = season_ingest.iter_api_sports_american_football_games_for_season(
+        session, league_key="NFL", season_year=2025
+    )
+
+    def observed() -> Iterator[dict[str, Any]]:
+        for item in items:
+            identity_sizes.append(len(session.identity_map))
+            yield item
+
+    result = ingest_api_sports_american_football_season_streaming(
+        session, league_key="NFL", season_year=2025, items=observed(), chunk_size=10
+    )
+
+    assert result.games_seen == 45
+    assert result.games_created == 45
+    assert result.teams_created == 2
+    assert session.query(Game).count() == 45
+    # Each chunk is committed and expunged, so the session never holds the whole season.
+    assert max(identity_sizes) < 30
@@ -1,22 +1,35 @@
 from __future__ import annotations
 
+import threading
+import time
 from datetime import UTC, datetime
+from typing import Any
 
+import httpx
+import pytest
 import sqlalchemy as sa
 from sqlalchemy.orm import Session
 
 import odds_value.db.models  # noqa: F401
+from odds_value.core.config import settings
 from odds_value.db.base import Base
-from odds_value.db.enums import GameStatusEnum, ProviderEnum, SportEnum
+from odds_value.db.enums import GameStatusEnum, IngestStatusEnum, ProviderEnum, SportEnum
 from odds_value.db.models.core.game import Game
 from odds_value.db.models.core.league import League
+from odds_value.db.models.core.provider_sport import ProviderSport
 from odds_value.db.models.core.provider_team import ProviderTeam
 from odds_value.db.models.core.season import Season
 from odds_value.db.models.core.team import Team
+from odds_value.db.models.features.team_game_stats import TeamGameStats
+from odds_value.db.models.ingestion.game_ingest_status import GameIngestStatus
+from odds_value.ingestion.providers.api_sports.ingest import (
+    american_football_team_game_stats as stats_ingest,
+)
 from odds_value.ingestion.providers.api_sports.ingest.american_football_team_game_stats import (
     ingest_api_sports_american_football_team_game_stats,
     ingest_api_sports_american_football_team_game_stats_for_season,
 )
+from odds_value.ingestion.providers.base.client import BaseHttpClient
 
 
 def _make_session() -> Session:
@@ -93,7 +106,7 @@ def test_ingest_api_sports_team_game_stats_upserts_team_game_stats_and_football(
     assert result1.team_game_stats_created == 2
     assert result1.football_stats_created == 2
 
-    # idempotent re-run updates
+    # unchanged items are skipped without writes
     result2 = ingest_api_sports_american_football_team_game_stats(
         session,
         provider_game_id="17281",
@@ -101,10 +114,35 @@ def test_ingest_api_sports_team_game_stats_upserts_team_game_stats_and_football(
     )
     session.commit()
 
-    assert result2.team_game_stats_created == 0
-    assert result2.team_game_stats_updated == 2
-    assert result2.football_stats_created == 0
-    assert result2.football_stats_updated == 2
+    assert result2.items_unchanged == 2
+    assert result2.team_game_stats_updated == 0
+    assert result2.football_stats_updated == 0
+
+    # forced re-run updates
+    result3 = ingest_api_sports_american_football_team_game_stats(
+        session,
+        provider_game_id="17281",
+        items=items,
+        force=True,
+    )
+    session.commit()
+
+    assert result3.team_game_stats_created == 0
+    assert result3.team_game_stats_updated == 2
+    assert result3.football_stats_created == 0
+    assert result3.football_stats_updated == 2
+
+    # only the changed item is re-applied
+    items[0]["statistics"]["yards"]["total"] = 433
+    result4 = ingest_api_sports_american_football_team_game_stats(
+        session,
+        provider_game_id="17281",
+        items=items,
+    )
+    session.commit()
+
+    assert result4.items_unchanged == 1
+    assert result4.football_stats_updated == 1
 
 
 def test_ingest_api_sports_team_game_stats_for_season_uses_db_games() -> None:
@@ -282,3 +320,147 @@ def test_ingest_api_sports_team_game_stats_for_season_skip_existing() -> None:
     assert second.games_processed == 0
     assert second.games_skipped_existing == 1
     assert second.items_seen == 0
+
+
+def _seed_final_games(count: int) -> Session:
+    session = _make_session()
+
+    nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+    session.add(nfl)
+    session.flush()
+    session.add(
+        ProviderSport(
+            provider=ProviderEnum.API_SPORTS,
+            sport=SportEnum.FOOTBALL,
+            base_url="https://stats.test",
+        )
+    )
+    season = Season(league_id=nfl.id, year=2025, name="2025")
+    home = Team(league_id=nfl.id, provider_team_id="12", name="Philadelphia Eagles")
+    away = Team(league_id=nfl.id, provider_team_id="10", name="Cincinnati Bengals")
+    session.add_all([season, home, away])
+    session.flush()
+    session.add_all(
+        [
+            ProviderTeam(provider=ProviderEnum.API_SPORTS, team_id=home.id, provider_team_id="12"),
+            ProviderTeam(provider=ProviderEnum.API_SPORTS, team_id=away.id, provider_team_id="10"),
+        ]
+    )
+    session.add_all(
+        [
+            Game(
+                league_id=nfl.id,
+                season_id=season.id,
+                provider=ProviderEnum.API_SPORTS,
+                provider_game_id=str(30000 + i),
+                start_time=datetime(2025, 10, 1 + i, 0, 0, tzinfo=UTC),
+                status=GameStatusEnum.FINAL,
+                is_neutral_site=False,
+                home_team_id=home.id,
+                away_team_id=away.id,
+                home_score=i,
+                away_score=0,
+            )
+            for i in range(count)
+        ]
+    )
+    session.commit()
+    return session
+
+
+def _stats_response(request: httpx.Request, *, failing: set[str]) -> httpx.Response:
+    game_id = request.url.params.get("game") or request.url.params["id"]
+    if game_id in failing:
+        return httpx.Response(200, json={"response": [], "errors": {"game": "bad id"}})
+    return httpx.Response(
+        200,
+        json={
+            "errors": [],
+            "response": [
+                {"team": {"id": 12, "name": "Philadelphia Eagles"}, "statistics": {}},
+                {"team": {"id": 10, "name": "Cincinnati Bengals"}, "statistics": {}},
+            ],
+        },
+    )
+
+
+def _use_stats_transport(monkeypatch: pytest.MonkeyPatch, handler: Any) -> None:
+    monkeypatch.setattr(settings, "api_sports_key", "k")
+    monkeypatch.setattr(
+        stats_ingest,
+        "shared_http_client",
+        lambda base_url, **_: BaseHttpClient(
+            base_url=base_url, transport=httpx.MockTransport(handler), circuit_breaker=None
+        ),
+    )
+
+
+def test_team_game_stats_season_pipeline_overlaps_fetches_and_isolates_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _seed_final_games(8)
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return _stats_response(request, failing={"30003"})
+
+    _use_stats_transport(monkeypatch, handler)
+
+    result = ingest_api_sports_american_football_team_game_stats_for_season(
+        session,
+        league_key="NFL",
+        season_year=2025,
+        commit_every=3,
+        fetch_workers=4,
+        queue_size=2,
+    )
+
+    assert result.games_processed == 7
+    assert result.games_failed == 1
+    assert result.failed_game_ids_sample == ["30003"]
+    assert session.query(TeamGameStats).count() == 14
+    assert 1 < max_in_flight <= 4
+
+
+def test_team_game_stats_season_checkpoints_and_retries_failed_games(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _seed_final_games(4)
+    failing = {"30002"}
+    _use_stats_transport(monkeypatch, lambda request: _stats_response(request, failing=failing))
+
+    first = ingest_api_sports_american_football_team_game_stats_for_season(
+        session, league_key="NFL", season_year=2025
+    )
+    assert (first.games_processed, first.games_failed) == (3, 1)
+
+    assert session.query(GameIngestStatus).count() == 4
+    failed = session.query(GameIngestStatus).filter_by(status=IngestStatusEnum.FAILED).one()
+    assert session.get(Game, failed.game_id).provider_game_id == "30002"  # type: ignore[union-attr]
+    assert failed.attempts == 1
+    assert failed.last_error is not None and "bad id" in failed.last_error
+
+    failing.clear()
+    retried = ingest_api_sports_american_football_team_game_stats_for_season(
+        session, league_key="NFL", season_year=2025, retry_failed=True, skip_existing=False
+    )
+    assert retried.games_processed == 1
+    assert retried.games_skipped_checkpointed == 3
+    session.refresh(failed)
+    assert (failed.status, failed.attempts, failed.last_error) == (IngestStatusEnum.OK, 2, None)
+
+    resumed = ingest_api_sports_american_football_team_game_stats_for_season(
+        session, league_key="NFL", season_year=2025, resume=True, skip_existing=False
+    )
+    assert resumed.games_processed == 0
+    assert resumed.games_skipped_checkpointed == 4
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.core.config import settings
+from odds_value.db.base import Base
+from odds_value.db.bulk import _copy_converter, bulk_load
+from odds_value.db.enums import MarketTypeEnum, SideTypeEnum, SportEnum
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.team import Team
+from odds_value.db.models.ingestion.payload_body import PayloadBody
+from odds_value.db.models.odds.odds_snapshot import OddsSnapshot
+from odds_value.db.repos.odds.odds_snapshot_repo import OddsSnapshotRepository
+
+
+def _make_session() -> Session:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return Session(engine)
+
+
+def test_bulk_load_inserts_and_upserts_with_executemany_on_sqlite() -> None:
+    session = _make_session()
+    nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+    session.add(nfl)
+
+    teams = [
+        {"league_id": 1, "provider_team_id": str(i), "name": f"T{i}", "logo_url": "x"}
+        for i in range(5)
+    ]
+    # Pending ORM objects are flushed before the rows go in.
+    assert bulk_load(session, Team, iter(teams), batch_size=2) == 5
+
+    changed = [
+        {"league_id": 1, "provider_team_id": "0", "name": "Renamed", "logo_url": None},
+        {"league_id": 1, "provider_team_id": "9", "name": "New", "logo_url": None},
+    ]
+    assert bulk_load(session, Team, changed, constraint="uq_teams_league_provider_team_id") == 2
+    renamed = session.scalars(sa.select(Team).where(Team.provider_team_id == "0")).one()
+    assert (renamed.name, renamed.logo_url) == ("Renamed", "x")
+
+    bulk_load(
+        session,
+        Team,
+        changed[:1],
+        constraint="uq_teams_league_provider_team_id",
+        coalesce_nulls=False,
+    )
+    session.expire_all()
+    assert (
+        session.scalars(sa.select(Team.logo_url).where(Team.provider_team_id == "0")).one() is None
+    )
+
+
+def test_snapshot_bulk_load_keeps_existing_identities() -> None:
+    session = _make_session()
+    repo = OddsSnapshotRepository(session)
+    row = {
+        "game_id": 1,
+        "book_id": 1,
+        "captured_at": datetime(2025, 9, 7, 11, tzinfo=UTC),
+        "market_type": MarketTypeEnum.SPREAD,
+        "side_type": SideTypeEnum.HOME,
+        "line": -3.5,
+        "price": -110,
+    }
+
+    assert repo.bulk_load([row], constraint="uq_odds_snapshots_identity", update_cols=()) == 1
+    again = [{**row, "price": -120}, {**row, "side_type": SideTypeEnum.AWAY, "line": 3.5}]
+    assert repo.bulk_load(again, constraint="uq_odds_snapshots_identity", update_cols=()) == 1
+
+    prices = session.scalars(sa.select(OddsSnapshot.price).order_by(OddsSnapshot.id)).all()
+    assert prices == [-110, -110]
+
+
+def test_copy_converter_writes_postgres_text_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "payload_compression", "zlib")
+    dialect = PGDialect_psycopg2()
+    snapshot = OddsSnapshot.__table__.c
+    body = PayloadBody.__table__.c
+
+    assert _copy_converter(snapshot.market_type.type, dialect)(MarketTypeEnum.SPREAD) == "SPREAD"
+    assert _copy_converter(snapshot.is_closing.type, dialect)(False) == "f"
+    assert _copy_converter(snapshot.line.type, dialect)(None) == r"\N"
+    assert _copy_converter(body.payload_json.type, dialect)({"a": "x\ty"}) == r'{"a": "x\\ty"}'
+    assert _copy_converter(body.payload_compressed.type, dialect)(None) == r"\N"
+    assert _copy_converter(body.payload_compressed.type, dialect)({"a": 1}).startswith(r"\\x")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from odds_value.ingestion.providers.base.cassette import (
+    RecordingTransport,
+    ReplayTransport,
+    load_cassettes,
+)
+from odds_value.ingestion.providers.base.client import AsyncBaseHttpClient, BaseHttpClient
+from odds_value.ingestion.providers.base.errors import ProviderCassetteMiss, ProviderRateLimited
+from odds_value.ingestion.providers.base.retry import NO_RETRY, RetryPolicy
+
+
+def _record(directory: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"date": request.url.params["date"]},
+            headers={"x-requests-remaining": "99"},
+        )
+
+    transport = RecordingTransport(directory=directory, inner=httpx.MockTransport(handler))
+    with BaseHttpClient(base_url="https://odds.test/v4", transport=transport) as http:
+        http.get_json("/historical/odds", params={"apiKey": "secret", "date": "2021-09-12"})
+        http.get_json("/historical/odds", params={"apiKey": "secret", "date": "2021-09-19"})
+
+
+def test_recording_is_compressed_and_redacts_credentials(tmp_path: Path) -> None:
+    _record(tmp_path)
+
+    files = list(tmp_path.glob("odds.test/*.jsonl.gz"))
+    assert len(files) == 1
+    assert b"secret" not in files[0].read_bytes()
+
+    entries = load_cassettes(tmp_path)
+    assert len(entries) == 2
+    urls = sorted(e.url for recorded in entries.values() for e in recorded)
+    assert all("apiKey" not in u for u in urls)
+
+
+def test_replay_serves_recordings_offline(tmp_path: Path) -> None:
+    _record(tmp_path)
+    sleeps: list[float] = []
+    replay = ReplayTransport(directory=tmp_path, latency_s=0.25, _sleep=sleeps.append)
+
+    # A different API key still matches: credentials are not part of the key.
+    with BaseHttpClient(base_url="https://odds.test/v4", transport=replay) as http:
+        data, headers = http.get_json_with_headers(
+            "/historical/odds", params={"apiKey": "other", "date": "2021-09-19"}
+        )
+        assert data == {"date": "2021-09-19"}
+        assert headers["x-requests-remaining"] == "99"
+        assert sleeps == [0.25]
+
+        with pytest.raises(ProviderCassetteMiss):
+            http.get_json("/historical/odds", params={"date": "2021-09-26"})
+
+
+def test_replay_injects_rate_limits(tmp_path: Path) -> None:
+    _record(tmp_path)
+    sleeps: list[float] = []
+    replay = ReplayTransport(directory=tmp_path, rate_limit_probability=1.0, retry_after_s=2.0)
+
+    with (
+        BaseHttpClient(
+            base_url="https://odds.test/v4",
+            transport=replay,
+            retry_policy=RetryPolicy(max_attempts=3),
+            _sleep=sleeps.append,
+        ) as http,
+        pytest.raises(ProviderRateLimited),
+    ):
+        http.get_json("/historical/odds", params={"date": "2021-09-12"})
+
+    assert replay.rate_limited == 3
+    assert sleeps == [2.0, 2.0]
+
+
+async def test_async_replay(tmp_path: Path) -> None:
+    _record(tmp_path)
+    replay = ReplayTransport(directory=tmp_path)
+
+    async with AsyncBaseHttpClient(
+        base_url="https://odds.test/v4", transport=replay, retry_policy=NO_RETRY
+    ) as http:
+        assert await http.get_json("/historical/odds", params={"date": "2021-09-12"}) == {
+            "date": "2021-09-12"
+        }
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import httpx
+
+from odds_value.ingestion.providers.base.client import PoolConfig
+from odds_value.ingestion.providers.base.client_registry import HttpClientRegistry
+
+
+def _registry(
+    seen: list[httpx.Request], transports: list[httpx.MockTransport]
+) -> HttpClientRegistry:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    def make_transport() -> httpx.MockTransport:
+        transport = httpx.MockTransport(handler)
+        transports.append(transport)
+        return transport
+
+    return HttpClientRegistry(
+        pool=PoolConfig(max_connections=4, compression=False), _transport_factory=make_transport
+    )
+
+
+def test_clients_for_one_base_url_share_a_pool() -> None:
+    seen: list[httpx.Request] = []
+    transports: list[httpx.MockTransport] = []
+    registry = _registry(seen, transports)
+
+    a = registry.http_client("https://pool.test/v1/")
+    b = registry.http_client("https://pool.test/v1", circuit_breaker=None)
+    other = registry.http_client("https://other.test")
+
+    assert a._client is b._client
+    assert a.single_flight is b.single_flight
+    assert other._client is not a._client
+    assert len(transports) == 2
+
+    # Closing a borrowing client leaves the shared pool usable.
+    a.close()
+    assert b.get_json("/games") == {"ok": True}
+    assert seen[-1].url == "https://pool.test/v1/games"
+    assert seen[-1].headers["Accept-Encoding"] == "identity"
+
+    registry.close()
+    c = registry.http_client("https://pool.test/v1")
+    assert c._client is not b._client
+    assert len(transports) == 3
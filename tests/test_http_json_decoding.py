@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from odds_value.core.json_codec import (
+    default_json_decoder,
+    default_json_encoder,
+    iter_json_array,
+    json_backend,
+    stdlib_json_decoder,
+)
+from odds_value.ingestion.providers.base.client import AsyncBaseHttpClient, BaseHttpClient
+from odds_value.ingestion.providers.base.errors import ProviderRequestError
+
+BODY = b'{"response": [{"id": 1, "name": "Caf\\u00e9"}]}'
+
+
+def _transport(body: bytes, status: int = 200) -> httpx.MockTransport:
+    return httpx.MockTransport(lambda request: httpx.Response(status, content=body))
+
+
+def test_default_codec_round_trips() -> None:
+    assert json_backend() in {"orjson", "msgspec", "json"}
+    value = default_json_decoder()(BODY)
+    assert value == json.loads(BODY)
+    assert json.loads(default_json_encoder()(value)) == value
+
+
+def test_client_uses_pluggable_decoder() -> None:
+    calls: list[bytes] = []
+
+    def decoder(content: bytes) -> object:
+        calls.append(content)
+        return stdlib_json_decoder(content)
+
+    http = BaseHttpClient(
+        base_url="https://x.test", transport=_transport(BODY), json_decoder=decoder
+    )
+    assert http.get_json("/games") == {"response": [{"id": 1, "name": "Café"}]}
+    assert calls == [BODY]
+
+
+def test_get_bytes_returns_raw_body_and_checks_status() -> None:
+    http = BaseHttpClient(base_url="https://x.test", transport=_transport(BODY))
+    raw = http.get_bytes("/games")
+    assert raw == BODY
+    assert http.decode_json(raw) == json.loads(BODY)
+
+    failing = BaseHttpClient(
+        base_url="https://x.test", transport=_transport(b"nope", status=404), circuit_breaker=None
+    )
+    with pytest.raises(ProviderRequestError):
+        failing.get_bytes("/games")
+
+
+def test_invalid_json_maps_to_provider_error() -> None:
+    http = BaseHttpClient(base_url="https://x.test", transport=_transport(b"{not json"))
+    with pytest.raises(ProviderRequestError, match="not valid JSON"):
+        http.get_json("/games")
+
+
+async def test_async_get_bytes() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=BODY)
+
+    async with AsyncBaseHttpClient(
+        base_url="https://x.test", transport=httpx.MockTransport(handler)
+    ) as http:
+        raw = await http.get_bytes("/games")
+        assert raw == BODY
+        assert await http.get_json("/games") == json.loads(BODY)
+
+
+def test_iter_json_array_yields_elements_and_rejects_missing_key() -> None:
+    assert list(iter_json_array(BODY, "response")) == [{"id": 1, "name": "Café"}]
+    assert list(iter_json_array(b'{"response": []}', "response")) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array(b'{"errors": {"token": "bad"}}', "response"))
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+
+from odds_value.ingestion.providers.base.cache import CacheRule, ResponseCache
+from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.providers.base.metrics import (
+    HttpEvent,
+    MetricsRegistry,
+    endpoint_template,
+)
+
+
+def test_endpoint_template_collapses_ids() -> None:
+    assert endpoint_template("/games/123/statistics") == "/games/{id}/statistics"
+    assert endpoint_template("historical/sports/americanfootball_nfl/odds") == (
+        "/historical/sports/americanfootball_nfl/odds"
+    )
+    assert endpoint_template("/events/e912304de2b2ce35b473ce2ecd3d1502/odds") == (
+        "/events/{id}/odds"
+    )
+
+
+def test_client_reports_attempts_retries_sleeps_and_cache_hits(tmp_path: Path) -> None:
+    statuses = iter([503, 200])
+    events: list[HttpEvent] = []
+    registry = MetricsRegistry()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    http = BaseHttpClient(
+        base_url="https://metrics.test",
+        transport=httpx.MockTransport(handler),
+        cache=ResponseCache(directory=tmp_path, rules=(CacheRule("/games", ttl_s=None),)),
+        circuit_breaker=None,
+        hooks=[registry, events.append],
+        _sleep=lambda s: None,
+        _random=lambda: 0.5,
+    )
+
+    http.get_json("/games/1")
+    http.get_json("/games/1")
+    http.record_sleep("/games/1", 2.0, reason="rate_limit")
+
+    assert [e.kind for e in events] == ["response", "sleep", "response", "cache_hit", "sleep"]
+
+    stats = registry.snapshot()[("metrics.test", "GET", "/games/{id}")]
+    assert stats.requests == 2
+    assert stats.retries == 1
+    assert stats.cache_hits == 1
+    assert dict(stats.status_codes) == {503: 1, 200: 1}
+    assert stats.bytes_received == 2 * len(b'{"ok":true}')
+    assert stats.sleep_s == {"retry": 0.5, "rate_limit": 2.0}
+    assert sum(stats.latency_buckets) == 2
+
+    (line,) = registry.format_lines()
+    assert line.startswith("http metrics.test GET /games/{id}: requests=2 retries=1")
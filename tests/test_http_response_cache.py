@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from odds_value.ingestion.providers.api_sports.client import (
+    API_SPORTS_CACHE_RULES,
+    ApiSportsClient,
+)
+from odds_value.ingestion.providers.base.cache import CacheRule, ResponseCache, cache_key
+from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.providers.base.errors import ProviderResponseError
+
+
+def test_cache_key_ignores_api_key_and_param_order() -> None:
+    a = cache_key("GET", "https://x.test/v4", "/historical/odds", {"apiKey": "a", "b": 1, "c": 2})
+    b = cache_key("GET", "https://x.test/v4", "historical/odds/", {"c": 2, "b": 1, "apiKey": "z"})
+    assert a == b
+    assert a != cache_key("GET", "https://x.test/v4", "/historical/odds", {"b": 1})
+
+
+def test_base_http_client_serves_cached_gets(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    cache = ResponseCache(
+        directory=tmp_path,
+        rules=[CacheRule("/historical", ttl_s=None)],
+    )
+    http = BaseHttpClient(
+        base_url="https://x.test/v4", transport=httpx.MockTransport(handler), cache=cache
+    )
+
+    for api_key in ("k1", "k2"):
+        assert http.get_json("/historical/odds", params={"apiKey": api_key}) == {
+            "path": "/v4/historical/odds"
+        }
+    http.get_json("/sports/odds")
+    http.get_json("/sports/odds")
+
+    assert calls == ["/v4/historical/odds", "/v4/sports/odds", "/v4/sports/odds"]
+    assert http.is_cached("/historical/odds")
+    assert not http.is_cached("/sports/odds")
+
+
+def test_response_cache_expires_and_evicts(tmp_path: Path) -> None:
+    now = 1000.0
+    cache = ResponseCache(directory=tmp_path, max_bytes=600, _time=lambda: now)
+    request = httpx.Request("GET", "https://x.test/a")
+
+    def resp(size: int) -> httpx.Response:
+        return httpx.Response(200, content=b"x" * size, request=request)
+
+    cache.put("aa01", resp(10), ttl_s=5.0)
+    assert cache.get("aa01") is not None
+    now += 10.0
+    assert cache.get("aa01") is None
+
+    for key in ("bb01", "bb02", "bb03", "bb04"):
+        cache.put(key, resp(200), ttl_s=None)
+
+    remaining = [k for k in ("bb01", "bb02", "bb03", "bb04") if cache.get(k) is not None]
+    assert "bb04" in remaining
+    assert "bb01" not in remaining
+
+
+def test_api_sports_cache_skips_error_and_empty_bodies(tmp_path: Path) -> None:
+    bodies = [
+        {"errors": {"requests": "You have reached the request limit for the day"}, "response": []},
+        {"errors": [], "response": []},
+        {"errors": [], "response": [{"team": {"id": 12}}]},
+    ]
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json=bodies[len(calls) - 1])
+
+    http = BaseHttpClient(
+        base_url="https://x.test",
+        transport=httpx.MockTransport(handler),
+        cache=ResponseCache(directory=tmp_path, rules=API_SPORTS_CACHE_RULES),
+        circuit_breaker=None,
+    )
+    client = ApiSportsClient(http=http, api_key="k")
+    params = {"id": 17281}
+
+    with pytest.raises(ProviderResponseError):
+        client.get("/games/statistics/teams", params=params)
+    assert not http.is_cached("/games/statistics/teams", params)
+
+    # Stats not published yet: returned, but asked again next time.
+    assert client.get_response_items("/games/statistics/teams", params=params) == []
+    assert not http.is_cached("/games/statistics/teams", params)
+
+    assert client.get_response_items("/games/statistics/teams", params=params) == [
+        {"team": {"id": 12}}
+    ]
+    assert client.get_response_items("/games/statistics/teams", params=params) == [
+        {"team": {"id": 12}}
+    ]
+    assert len(calls) == 3
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.providers.base.errors import (
+    ProviderCircuitOpen,
+    ProviderRateLimited,
+    ProviderRequestError,
+)
+from odds_value.ingestion.providers.base.retry import (
+    CircuitBreaker,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+def _client(handler: httpx.MockTransport, sleeps: list[float], **kwargs: object) -> BaseHttpClient:
+    return BaseHttpClient(
+        base_url="https://retry.test",
+        transport=handler,
+        _sleep=sleeps.append,
+        _random=lambda: 0.5,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_parse_retry_after_seconds_and_http_date() -> None:
+    assert parse_retry_after("7") == 7.0
+    now = datetime(2025, 1, 1, 0, 0, 0, tzinfo=UTC)
+    assert parse_retry_after("Wed, 01 Jan 2025 00:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("garbage") is None
+
+
+def test_retries_429_honoring_retry_after_then_succeeds() -> None:
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(503),
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+    sleeps: list[float] = []
+    http = _client(
+        httpx.MockTransport(lambda r: next(responses)), sleeps, circuit_breaker=CircuitBreaker()
+    )
+
+    assert http.get_json("/x") == {"ok": True}
+    # 429 -> Retry-After; 503 on attempt 2 -> jittered 0.5 * min(30, 1 * 2**1).
+    assert sleeps == [3.0, 1.0]
+
+
+def test_gives_up_after_max_attempts() -> None:
+    sleeps: list[float] = []
+    http = _client(
+        httpx.MockTransport(lambda r: httpx.Response(429)),
+        sleeps,
+        retry_policy=RetryPolicy(max_attempts=3, rate_limited_wait_s=60.0),
+        circuit_breaker=None,
+    )
+    with pytest.raises(ProviderRateLimited):
+        http.get_json("/x")
+    assert sleeps == [60.0, 60.0]
+
+
+def test_network_errors_are_retried_and_open_the_circuit() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ConnectError("boom", request=request)
+
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout_s=30.0, _monotonic=lambda: now[0])
+    sleeps: list[float] = []
+    http = _client(
+        httpx.MockTransport(handler),
+        sleeps,
+        retry_policy=RetryPolicy(max_attempts=3),
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(ProviderRequestError):
+        http.get_json("/x")
+    assert len(sleeps) == 2
+    assert calls == 3
+
+    # Circuit is open now: fail fast without touching the transport.
+    with pytest.raises(ProviderCircuitOpen):
+        http.get_json("/x")
+    assert calls == 3
+
+    # After the reset timeout one trial request goes out; its failure re-opens the circuit.
+    now[0] += 31.0
+    with pytest.raises(ProviderCircuitOpen):
+        http.get_json("/x")
+    assert calls == 4
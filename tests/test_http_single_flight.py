@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from odds_value.ingestion.providers.base.client import AsyncBaseHttpClient, BaseHttpClient
+from odds_value.ingestion.providers.base.errors import ProviderRequestError
+from odds_value.ingestion.providers.base.retry import NO_RETRY
+from odds_value.ingestion.providers.base.single_flight import SingleFlight, flight_key
+
+
+def test_flight_key_ignores_redacted_params_but_not_headers() -> None:
+    a = flight_key("GET", "https://x.test", "/odds", {"apiKey": "a", "date": "d"})
+    b = flight_key("GET", "https://x.test", "odds", {"date": "d", "apiKey": "b"})
+    assert a == b
+    assert flight_key("GET", "https://x.test", "/odds", None, {"x-key": "1"}) != flight_key(
+        "GET", "https://x.test", "/odds", None, {"x-key": "2"}
+    )
+
+
+def test_sync_client_coalesces_concurrent_identical_gets() -> None:
+    calls = 0
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        release.wait(timeout=5)
+        return httpx.Response(200, json={"ok": True})
+
+    http = BaseHttpClient(base_url="https://x.test", transport=httpx.MockTransport(handler))
+    assert http.single_flight is not None
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(http.get_json, "/games", params={"id": 1}) for _ in range(4)]
+        while http.single_flight.coalesced < 3:
+            threading.Event().wait(0.01)
+        assert http.is_in_flight("/games", {"id": 1})
+        release.set()
+        results = [f.result(timeout=5) for f in futures]
+
+    assert results == [{"ok": True}] * 4
+    assert calls == 1
+    assert not http.is_in_flight("/games", {"id": 1})
+
+
+def test_single_flight_shares_errors_and_forgets_completed_calls() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+
+    def boom() -> int:
+        raise ProviderRequestError("nope")
+
+    with pytest.raises(ProviderRequestError):
+        flight.do("k", boom)
+    assert flight.do("k", lambda: 7) == 7
+    assert not flight.in_flight("k")
+
+
+async def test_async_client_coalesces_concurrent_identical_gets() -> None:
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["id"])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": request.url.params["id"]})
+
+    async with AsyncBaseHttpClient(
+        base_url="https://x.test",
+        transport=httpx.MockTransport(handler),
+        retry_policy=NO_RETRY,
+    ) as http:
+        results = await asyncio.gather(
+            http.get_json("/games", params={"id": 1}),
+            http.get_json("/games", params={"id": 1}),
+            http.get_json("/games", params={"id": 2}),
+        )
+
+    assert results == [{"id": "1"}, {"id": "1"}, {"id": "2"}]
+    assert sorted(calls) == ["1", "2"]
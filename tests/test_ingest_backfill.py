@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.db.base import Base
+from odds_value.db.enums import ProviderEnum, SportEnum
+from odds_value.db.models.core.game import Game
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.provider_league import ProviderLeague
+from odds_value.db.models.core.provider_sport import ProviderSport
+from odds_value.db.models.core.provider_team import ProviderTeam
+from odds_value.db.models.core.season import Season
+from odds_value.db.models.core.team import Team
+from odds_value.db.models.core.team_alias import TeamAlias
+from odds_value.db.models.core.venue import Venue
+from odds_value.ingestion import backfill
+from odds_value.ingestion.backfill import backfill_seasons, season_backfill_tasks
+from odds_value.ingestion.providers.base.cassette import RecordingTransport
+from odds_value.ingestion.providers.base.client import BaseHttpClient
+
+
+def test_backfill_runs_stages_in_order_and_isolates_failures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'backfill.db'}"
+    Base.metadata.create_all(sa.create_engine(database_url))
+
+    calls: list[tuple[str, int]] = []
+
+    def stage(name: str) -> Any:
+        def run(session: Any, *, league_key: str, season_year: int, **_: Any) -> None:
+            calls.append((name, season_year))
+            if name == "team-stats" and season_year == 2017:
+                raise RuntimeError("provider down")
+
+        return run
+
+    monkeypatch.setattr(
+        backfill, "ingest_api_sports_american_football_season_streaming", stage("games")
+    )
+    monkeypatch.setattr(
+        backfill,
+        "ingest_api_sports_american_football_team_game_stats_for_season",
+        stage("team-stats"),
+    )
+    monkeypatch.setattr(backfill, "build_football_team_game_state_for_season", stage("features"))
+
+    tasks = season_backfill_tasks(["NFL"], 2016, 2018, stages=["features", "games", "team-stats"])
+    result = backfill_seasons(tasks, workers=1, database_url=database_url)
+
+    assert [s.season_year for s in result.seasons] == [2016, 2017, 2018]
+    assert calls[:3] == [("games", 2016), ("team-stats", 2016), ("features", 2016)]
+    # The failed season never builds features, but later seasons still run.
+    assert ("features", 2017) not in calls
+    assert ("features", 2018) in calls
+
+    (failed,) = result.failed
+    assert failed.season_year == 2017
+    assert failed.failed_stage == "team-stats"
+    assert failed.error == "RuntimeError: provider down"
+
+
+def test_backfill_rejects_unknown_stage() -> None:
+    with pytest.raises(ValueError):
+        season_backfill_tasks(["NFL"], 2016, 2016, stages=["odds"])
+
+
+def _record_season_games(directory: Path, seasons: range) -> None:
+    """Record a `/games` response per season; every season shares the same teams."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        season = int(request.url.params["season"])
+        kickoff = int(datetime(season, 10, 1, 17, 0, tzinfo=UTC).timestamp())
+        return httpx.Response(
+            200,
+            json={
+                "errors": [],
+                "response": [
+                    {
+                        "game": {
+                            "id": season * 100 + i,
+                            "date": {"timestamp": kickoff + i * 3600},
+                            "venue": {"name": f"Stadium {i % 4}", "city": "City"},
+                            "status": {"short": "FT"},
+                        },
+                        "league": {"id": 1, "name": "NFL", "season": str(season)},
+                        "teams": {
+                            "home": {"id": i % 8, "name": f"Team {i % 8}"},
+                            "away": {"id": 8 + i % 8, "name": f"Team {8 + i % 8}"},
+                        },
+                        "scores": {"home": {"total": 21}, "away": {"total": 17}},
+                    }
+                    for i in range(32)
+                ],
+            },
+        )
+
+    transport = RecordingTransport(directory=directory, inner=httpx.MockTransport(handler))
+    with BaseHttpClient(base_url="https://api-sports.test", transport=transport) as http:
+        for season in seasons:
+            http.get_json("/games", params={"league": "1", "season": str(season)})
+
+
+def test_parallel_backfill_of_one_league_on_empty_database(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'backfill.db'}"
+    engine = sa.create_engine(database_url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+        session.add(nfl)
+        session.flush()
+        session.add(
+            ProviderSport(
+                provider=ProviderEnum.API_SPORTS,
+                sport=SportEnum.FOOTBALL,
+                base_url="https://api-sports.test",
+            )
+        )
+        session.add(
+            ProviderLeague(
+                provider=ProviderEnum.API_SPORTS,
+                league_id=nfl.id,
+                provider_league_id="1",
+                provider_league_name="NFL",
+            )
+        )
+        # Existing seasons: no worker writes before loading its (empty) team dimensions.
+        session.add_all(Season(league_id=nfl.id, year=y, name=str(y)) for y in range(2016, 2020))
+        session.commit()
+
+    cassettes = tmp_path / "cassettes"
+    _record_season_games(cassettes, range(2016, 2020))
+
+    # Workers are spawned, so they only see configuration through the environment.
+    monkeypatch.setenv("API_SPORTS_KEY", "k")
+    monkeypatch.setenv("HTTP_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("HTTP_CASSETTE_DIR", str(cassettes))
+    monkeypatch.setenv("RATE_LIMIT_SQLITE_PATH", str(tmp_path / "rate_limits.sqlite"))
+    monkeypatch.setenv("STORE_INGESTED_PAYLOADS", "false")
+
+    tasks = season_backfill_tasks(["NFL"], 2016, 2019, stages=["games"])
+    result = backfill_seasons(tasks, workers=2, database_url=database_url)
+
+    assert [s.error for s in result.seasons] == [None] * 4
+    assert result.games_created == 4 * 32
+    with Session(engine) as session:
+        assert session.query(Game).count() == 4 * 32
+        # Every season races to create the same teams, venues, mappings and aliases.
+        assert session.query(Team).count() == 16
+        assert session.query(ProviderTeam).count() == 16
+        assert session.query(TeamAlias).count() == 16
+        assert session.query(Venue).count() == 4
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.core.config import settings
+from odds_value.db.base import Base
+from odds_value.db.enums import GameStatusEnum, ProviderEnum, SportEnum
+from odds_value.db.models.core.game import Game
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.provider_league import ProviderLeague
+from odds_value.db.models.core.provider_sport import ProviderSport
+from odds_value.db.models.core.provider_team import ProviderTeam
+from odds_value.db.models.core.team import Team
+from odds_value.db.models.features.team_game_stats import TeamGameStats
+from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
+from odds_value.db.models.odds.odds_snapshot import OddsSnapshot
+from odds_value.db.repos.ingestion.ingested_payload_repo import IngestedPayloadRepository
+from odds_value.ingestion.payload_archive import export_ingested_payloads
+from odds_value.ingestion.providers.api_sports.ingest import american_football_season
+from odds_value.ingestion.providers.api_sports.ingest import (
+    american_football_team_game_stats as stats_ingest,
+)
+from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.replay import replay_ingested_payloads
+
+
+def _seed() -> Session:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+    session.add(nfl)
+    session.flush()
+    session.add_all(
+        [
+            ProviderSport(
+                provider=ProviderEnum.API_SPORTS,
+                sport=SportEnum.FOOTBALL,
+                base_url="https://replay.test",
+            ),
+            ProviderLeague(
+                provider=ProviderEnum.API_SPORTS,
+                league_id=nfl.id,
+                provider_league_id="1",
+                provider_league_name="NFL",
+            ),
+        ]
+    )
+    home = Team(league_id=nfl.id, provider_team_id="12", name="Philadelphia Eagles")
+    away = Team(league_id=nfl.id, provider_team_id="10", name="Cincinnati Bengals")
+    session.add_all([home, away])
+    session.flush()
+    session.add_all(
+        [
+            ProviderTeam(provider=ProviderEnum.API_SPORTS, team_id=home.id, provider_team_id="12"),
+            ProviderTeam(provider=ProviderEnum.API_SPORTS, team_id=away.id, provider_team_id="10"),
+        ]
+    )
+    session.commit()
+    return session
+
+
+def _game_item(status: str, home_total: int | None) -> dict[str, Any]:
+    return {
+        "game": {
+            "id": 50001,
+            "date": {"timestamp": int(datetime(2025, 10, 12, 17, tzinfo=UTC).timestamp())},
+            "venue": {"name": "Lincoln Financial Field", "city": "Philadelphia"},
+            "status": {"short": status},
+        },
+        "league": {"id": 1, "name": "NFL", "season": "2025"},
+        "teams": {
+            "home": {"id": 12, "name": "Philadelphia Eagles"},
+            "away": {"id": 10, "name": "Cincinnati Bengals"},
+        },
+        "scores": {"home": {"total": home_total}, "away": {"total": 17 if home_total else None}},
+    }
+
+
+def _stats_item(team_id: int, yards: int) -> dict[str, Any]:
+    return {"team": {"id": team_id}, "statistics": {"yards": {"total": yards}}}
+
+
+def test_replay_rebuilds_games_and_stats_without_provider_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _seed()
+    repo = IngestedPayloadRepository(session)
+    archive = [
+        ("game", {"50001": _game_item("NS", None)}, datetime(2025, 10, 11, tzinfo=UTC)),
+        ("game", {"50001": _game_item("FT", 24)}, datetime(2025, 10, 13, tzinfo=UTC)),
+        (
+            "team_game_statistics",
+            {
+                "50001:12": _stats_item(12, 402),
+                "50001:10": _stats_item(10, 311),
+                "59999:12": _stats_item(12, 1),  # game never archived
+            },
+            datetime(2025, 10, 13, 1, tzinfo=UTC),
+        ),
+    ]
+    for entity_type, payloads, fetched_at in archive:
+        repo.record_many(
+            payloads, provider="api_sports", entity_type=entity_type, fetched_at=fetched_at
+        )
+    session.commit()
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(500)
+
+    def client(base_url: str, **_: object) -> BaseHttpClient:
+        return BaseHttpClient(
+            base_url=base_url, transport=httpx.MockTransport(handler), circuit_breaker=None
+        )
+
+    monkeypatch.setattr(settings, "api_sports_key", "k")
+    monkeypatch.setattr(settings, "store_ingested_payloads", True)
+    monkeypatch.setattr(american_football_season, "shared_http_client", client)
+    monkeypatch.setattr(stats_ingest, "shared_http_client", client)
+
+    result = replay_ingested_payloads(session, entity_types=["game", "team_game_statistics"])
+
+    assert requests == []
+    # Only the latest version of the game is read.
+    assert result.payloads_read == 4
+    assert result.games_created == 1
+    assert result.team_stats_games == 1
+    assert result.team_game_stats_written == 2
+    assert result.failures == {"team_game_statistics: NoResultFound": 1}
+
+    # The latest archived version of the game wins.
+    game = session.execute(sa.select(Game)).scalar_one()
+    assert (game.status, game.home_score) == (GameStatusEnum.FINAL, 24)
+    assert session.scalar(sa.select(sa.func.count()).select_from(TeamGameStats)) == 2
+
+    # Nothing replayed was written back to the archive.
+    assert session.scalar(sa.select(sa.func.count()).select_from(IngestedPayload)) == 5
+    assert settings.store_ingested_payloads is True
+
+
+def _odds_batch(price: int) -> dict[str, Any]:
+    return {
+        "requested_date": "2025-10-12T11:00:00+00:00",
+        "snapshot_timestamp": "2025-10-12T10:55:00+00:00",
+        "items": [
+            {
+                "commence_time": "2025-10-12T17:00:00Z",
+                "home_team": "Philadelphia Eagles",
+                "away_team": "Cincinnati Bengals",
+                "bookmakers": [
+                    {
+                        "key": "draftkings",
+                        "title": "DraftKings",
+                        "markets": [
+                            {
+                                "key": "spreads",
+                                "outcomes": [
+                                    {"name": "Philadelphia Eagles", "price": price, "point": -3.5},
+                                    {"name": "Cincinnati Bengals", "price": -110, "point": 3.5},
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_replay_odds_keeps_snapshot_time_and_applies_corrections() -> None:
+    session = _seed()
+    repo = IngestedPayloadRepository(session)
+    repo.record_many(
+        {"50001": _game_item("NS", None)},
+        provider="api_sports",
+        entity_type="game",
+        fetched_at=datetime(2025, 10, 11, tzinfo=UTC),
+    )
+    batch_key = "americanfootball_nfl:2025-10-12T11:00:00+00:00"
+    for price, fetched_at in [(-105, datetime(2025, 10, 12, 11)), (-115, datetime(2025, 10, 13))]:
+        repo.record_many(
+            {batch_key: _odds_batch(price)},
+            provider="odds_api",
+            entity_type="odds_api_batch",
+            fetched_at=fetched_at,
+        )
+        session.commit()
+        replay_ingested_payloads(session)
+
+    snapshots = session.execute(
+        sa.select(OddsSnapshot.captured_at, OddsSnapshot.line, OddsSnapshot.price).order_by(
+            OddsSnapshot.line
+        )
+    ).all()
+    # One row per side at the provider's snapshot time, carrying the corrected price.
+    assert [(_as_utc(at), line, price) for at, line, price in snapshots] == [
+        (datetime(2025, 10, 12, 10, 55, tzinfo=UTC), -3.5, -115),
+        (datetime(2025, 10, 12, 10, 55, tzinfo=UTC), 3.5, -110),
+    ]
+
+
+def _as_utc(dt: datetime) -> datetime:
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)
+
+
+def test_replay_reads_the_latest_exported_version_from_the_archive(tmp_path: Path) -> None:
+    session = _seed()
+    repo = IngestedPayloadRepository(session)
+    for item, fetched_at in [
+        (_game_item("NS", None), datetime(2025, 10, 11)),
+        (_game_item("FT", 24), datetime(2025, 10, 13)),
+    ]:
+        repo.record_many(
+            {"50001": item}, provider="api_sports", entity_type="game", fetched_at=fetched_at
+        )
+    session.commit()
+    export_ingested_payloads(session, root=tmp_path, older_than=datetime(2026, 1, 1))
+    # A rerun export can leave the same rows in a second part file.
+    (part,) = (tmp_path / "provider=api_sports/entity_type=game/date=2025-10-13").iterdir()
+    shutil.copy(part, part.with_name("part-rerun.jsonl.gz"))
+
+    result = replay_ingested_payloads(session, entity_types=["game"], archive_root=tmp_path)
+
+    assert (result.payloads_read, result.games_created) == (1, 1)
+    game = session.execute(sa.select(Game)).scalar_one()
+    assert (game.status, game.home_score) == (GameStatusEnum.FINAL, 24)
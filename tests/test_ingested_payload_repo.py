@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.db.base import Base
+from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
+from odds_value.db.models.ingestion.payload_body import PayloadBody
+from odds_value.db.repos.ingestion.ingested_payload_repo import IngestedPayloadRepository
+
+
+def test_identical_payloads_share_one_body() -> None:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    repo = IngestedPayloadRepository(session)
+
+    first = {"1": {"game": {"id": 1}}, "2": {"game": {"id": 2}}}
+    assert (
+        repo.record_many(
+            first,
+            provider="api_sports",
+            entity_type="game",
+            fetched_at=datetime(2025, 9, 7, tzinfo=UTC),
+        )
+        == 2
+    )
+    session.commit()
+
+    # Rerun: game 1 unchanged (keys in another order), game 2 changed.
+    rerun = {"1": {"game": {"id": 1}}, "2": {"game": {"id": 2, "status": "FT"}}}
+    assert (
+        repo.record_many(
+            rerun,
+            provider="api_sports",
+            entity_type="game",
+            fetched_at=datetime(2025, 9, 8, tzinfo=UTC),
+        )
+        == 1
+    )
+    session.commit()
+
+    assert session.scalar(sa.select(sa.func.count()).select_from(PayloadBody)) == 3
+    rows = session.scalars(
+        sa.select(IngestedPayload).order_by(IngestedPayload.entity_key, IngestedPayload.fetched_at)
+    ).all()
+    assert len(rows) == 4
+    assert rows[0].content_hash == rows[1].content_hash
+    assert rows[3].payload_json == {"game": {"id": 2, "status": "FT"}}
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.core.config import settings
+from odds_value.db.base import Base
+from odds_value.db.enums import SportEnum
+from odds_value.db.models.core.game import Game
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.season import Season
+from odds_value.db.models.core.team import Team
+from odds_value.db.models.odds.odds_api_quota import OddsApiQuotaLedger
+from odds_value.db.repos.odds.odds_api_quota_repo import OddsApiQuotaLedgerRepository
+from odds_value.ingestion.providers.base.client import BaseHttpClient
+from odds_value.ingestion.providers.odds_api.client import (
+    OddsApiClient,
+    api_key_fingerprint,
+    estimate_request_cost,
+)
+from odds_value.ingestion.providers.odds_api.ingest import nfl_odds
+
+
+def _make_session() -> Session:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return Session(engine)
+
+
+def _seed_season(session: Session, *, kickoffs: list[datetime]) -> None:
+    nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+    session.add(nfl)
+    session.flush()
+    season = Season(league_id=nfl.id, year=2021, name="2021")
+    home = Team(league_id=nfl.id, provider_team_id="TB", name="Tampa Bay Buccaneers")
+    away = Team(league_id=nfl.id, provider_team_id="DAL", name="Dallas Cowboys")
+    session.add_all([season, home, away])
+    session.flush()
+    for i, kickoff in enumerate(kickoffs):
+        session.add(
+            Game(
+                league_id=nfl.id,
+                season_id=season.id,
+                provider_game_id=f"g{i}",
+                start_time=kickoff,
+                home_team_id=home.id,
+                away_team_id=away.id,
+            )
+        )
+    session.commit()
+
+
+def _quota_handler(remaining: list[int]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        left = remaining[0] - 30
+        remaining[0] = left
+        return httpx.Response(
+            200,
+            json={
+                "timestamp": request.url.params["date"],
+                "previous_timestamp": None,
+                "next_timestamp": None,
+                "data": [],
+            },
+            headers={
+                "x-requests-remaining": str(left),
+                "x-requests-used": str(1000 - left),
+                "x-requests-last": "30",
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_estimate_request_cost_historical_multiplier() -> None:
+    assert estimate_request_cost(markets=["h2h"], regions="us") == 1
+    assert estimate_request_cost(markets=["spreads", "totals", "h2h"], regions="us,uk") == 6
+    assert (
+        estimate_request_cost(markets=["spreads", "totals", "h2h"], regions="us", historical=True)
+        == 30
+    )
+
+
+def test_client_captures_quota_headers() -> None:
+    http = BaseHttpClient(base_url="https://odds.test/v4", transport=_quota_handler([1000]))
+    client = OddsApiClient(http=http, api_key="secret")
+
+    client.get_historical_odds(
+        sport_key="americanfootball_nfl",
+        regions="us",
+        markets=["spreads", "totals", "h2h"],
+        date=datetime(2021, 10, 18, 12, 0, tzinfo=UTC),
+    )
+
+    assert client.last_quota is not None
+    assert client.last_quota.remaining == 970
+    assert client.last_quota.used == 30
+    assert client.last_quota.last == 30
+    assert client.api_key_hash == api_key_fingerprint("secret")
+    assert "secret" not in client.api_key_hash
+
+
+def test_quota_ledger_accumulates_per_day() -> None:
+    session = _make_session()
+    repo = OddsApiQuotaLedgerRepository(session)
+
+    seen = datetime(2021, 10, 18, 12, 0, tzinfo=UTC)
+    repo.record(api_key_hash="k", seen_at=seen, cost=30, requests_used=30, requests_remaining=970)
+    repo.record(api_key_hash="k", seen_at=seen, cost=30, requests_used=60, requests_remaining=940)
+
+    rows = session.execute(sa.select(OddsApiQuotaLedger)).scalars().all()
+    assert len(rows) == 1
+    assert rows[0].request_count == 2
+    assert rows[0].credits_spent == 60
+
+    latest = repo.latest("k")
+    assert latest is not None
+    assert latest.requests_remaining == 940
+
+
+@pytest.fixture
+def odds_api_transport(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    remaining = [1000]
+    monkeypatch.setattr(settings, "odds_api_key", "secret")
+    monkeypatch.setattr(settings, "store_ingested_payloads", False)
+    transport = _quota_handler(remaining)
+    monkeypatch.setattr(
+        nfl_odds,
+        "shared_http_client",
+        lambda base_url, **kwargs: BaseHttpClient(base_url=base_url, transport=transport, **kwargs),
+    )
+    return remaining
+
+
+def test_ingest_stops_cleanly_at_credit_budget(odds_api_transport: list[int]) -> None:
+    session = _make_session()
+    _seed_season(
+        session,
+        kickoffs=[
+            datetime(2021, 9, 12, 17, 0, tzinfo=UTC),
+            datetime(2021, 9, 19, 17, 0, tzinfo=UTC),
+            datetime(2021, 9, 26, 17, 0, tzinfo=UTC),
+        ],
+    )
+
+    result = nfl_odds.ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
+        session, league_key="NFL", season_year=2021, max_credits=60
+    )
+
+    assert result.stopped_on_budget
+    assert result.batches_fetched == 2
+    assert result.credits_spent == 60
+    assert result.requests_remaining == 940
+
+    latest = OddsApiQuotaLedgerRepository(session).latest(api_key_fingerprint("secret"))
+    assert latest is not None
+    assert latest.request_count == 2
+    assert latest.requests_remaining == 940
+
+
+def test_ingest_dry_run_makes_no_requests(odds_api_transport: list[int]) -> None:
+    session = _make_session()
+    _seed_season(
+        session,
+        kickoffs=[
+            datetime(2021, 9, 12, 17, 0, tzinfo=UTC),
+            datetime(2021, 9, 19, 17, 0, tzinfo=UTC),
+        ],
+    )
+
+    result = nfl_odds.ingest_odds_api_nfl_odds_as_of_kickoff_minus_hours_for_season(
+        session, league_key="NFL", season_year=2021, dry_run=True
+    )
+
+    assert result.dry_run
+    assert result.batches_planned == 2
+    assert result.batches_fetched == 0
+    assert result.credits_estimated == 60
+    assert odds_api_transport == [1000]
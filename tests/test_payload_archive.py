@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.db.base import Base
+from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
+from odds_value.db.models.ingestion.payload_body import PayloadBody
+from odds_value.db.repos.ingestion.ingested_payload_repo import IngestedPayloadRepository
+from odds_value.ingestion.payload_archive import export_ingested_payloads, iter_archived_payloads
+
+
+def test_export_moves_old_payloads_to_partition_files(tmp_path: Path) -> None:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    repo = IngestedPayloadRepository(session)
+
+    shared = {"game": {"id": 1}}
+    for provider, entity_type, payloads, fetched_at in [
+        ("api_sports", "game", {"1": shared, "2": {"game": {"id": 2}}}, datetime(2024, 9, 8, 3)),
+        ("api_sports", "game", {"2": {"game": {"id": 2, "x": 1}}}, datetime(2024, 9, 9, 12)),
+        ("odds_api", "odds_api_batch", {"nfl:1": {"items": []}}, datetime(2024, 9, 8, 20)),
+        # Inside the retention window; its body is shared with an archived row.
+        ("api_sports", "game", {"1": shared}, datetime(2025, 9, 1)),
+    ]:
+        repo.record_many(
+            payloads, provider=provider, entity_type=entity_type, fetched_at=fetched_at
+        )
+    session.commit()
+
+    result = export_ingested_payloads(
+        session,
+        root=tmp_path,
+        older_than=datetime(2025, 1, 1, tzinfo=UTC),
+        now=datetime(2025, 1, 1, 4),
+    )
+
+    assert result.partitions == 3
+    assert result.payloads_archived == 4
+    assert [p.relative_to(tmp_path).as_posix() for p in result.files] == [
+        "provider=api_sports/entity_type=game/date=2024-09-08/part-20250101T040000.jsonl.gz",
+        "provider=api_sports/entity_type=game/date=2024-09-09/part-20250101T040000.jsonl.gz",
+        "provider=odds_api/entity_type=odds_api_batch/date=2024-09-08/part-20250101T040000.jsonl.gz",
+    ]
+
+    # Only the recent row stays; its body survives, the other three bodies are gone.
+    remaining = session.scalars(sa.select(IngestedPayload)).all()
+    assert [(r.entity_key, r.payload_json) for r in remaining] == [("1", shared)]
+    assert result.bodies_deleted == 3
+    assert session.scalar(sa.select(sa.func.count()).select_from(PayloadBody)) == 1
+
+    games = list(iter_archived_payloads(tmp_path, provider="api_sports", entity_type="game"))
+    assert [(g.entity_key, g.fetched_at, g.payload) for g in games] == [
+        ("1", datetime(2024, 9, 8, 3), shared),
+        ("2", datetime(2024, 9, 8, 3), {"game": {"id": 2}}),
+        ("2", datetime(2024, 9, 9, 12), {"game": {"id": 2, "x": 1}}),
+    ]
+    assert [a.entity_type for a in iter_archived_payloads(tmp_path, since=date(2024, 9, 9))] == [
+        "game"
+    ]
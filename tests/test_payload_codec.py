@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.core.config import settings
+from odds_value.core.payload_codec import decode_payload, encode_payload, train_zstd_dictionary
+from odds_value.db.base import Base
+from odds_value.db.models.ingestion.ingested_payload import IngestedPayload
+from odds_value.db.models.ingestion.payload_body import PayloadBody
+from odds_value.db.repos.ingestion.ingested_payload_repo import IngestedPayloadRepository
+
+PAYLOAD = {
+    "items": [
+        {"bookmaker": f"book{i}", "markets": [{"key": "h2h", "outcomes": [-110, -110]}]}
+        for i in range(50)
+    ]
+}
+
+
+def test_zlib_round_trip_and_unknown_tag() -> None:
+    blob = encode_payload(PAYLOAD, codec="zlib")
+    assert blob[:1] == b"\x01"
+    assert decode_payload(blob) == PAYLOAD
+    with pytest.raises(ValueError):
+        decode_payload(b"\x7f" + blob[1:])
+
+
+def test_zstd_round_trip_with_trained_dictionary(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("zstandard")
+
+    samples = [{"game": {"id": i, "status": {"short": "FT"}}} for i in range(500)]
+    dict_path = tmp_path / "payloads.zdict"
+    dict_path.write_bytes(train_zstd_dictionary(samples, size=4096))
+    monkeypatch.setattr(settings, "payload_zstd_dict_path", str(dict_path))
+    monkeypatch.setattr(settings, "payload_zstd_dict_dir", str(tmp_path / "dicts"))
+
+    blob = encode_payload(samples[7], codec="zstd")
+    assert decode_payload(blob) == samples[7]
+
+
+def test_zstd_rows_stay_decodable_after_retraining(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    zstd = pytest.importorskip("zstandard")
+    monkeypatch.setattr(settings, "payload_zstd_dict_dir", str(tmp_path / "dicts"))
+
+    old_samples = [{"game": {"id": i, "status": {"short": "FT"}}} for i in range(500)]
+    old_path = tmp_path / "old.zdict"
+    old_path.write_bytes(train_zstd_dictionary(old_samples, size=4096))
+    monkeypatch.setattr(settings, "payload_zstd_dict_path", str(old_path))
+    old_blob = encode_payload(old_samples[3], codec="zstd")
+    assert old_blob[:1] == b"\x03"
+    # Pre-header format: tag + frame compressed with the (unnamed) dictionary.
+    legacy_blob = b"\x02" + zstd.ZstdCompressor(
+        dict_data=zstd.ZstdCompressionDict(old_path.read_bytes())
+    ).compress(b'{"legacy": true}')
+
+    new_samples = [{"team": {"id": i}, "statistics": {"yards": {"total": i}}} for i in range(500)]
+    new_path = tmp_path / "new.zdict"
+    new_path.write_bytes(train_zstd_dictionary(new_samples, size=4096))
+    monkeypatch.setattr(settings, "payload_zstd_dict_path", str(new_path))
+    new_blob = encode_payload(new_samples[5], codec="zstd")
+
+    assert old_blob[1:5] != new_blob[1:5]
+    assert decode_payload(old_blob) == old_samples[3]
+    assert decode_payload(legacy_blob) == {"legacy": True}
+    assert decode_payload(new_blob) == new_samples[5]
+
+    monkeypatch.setattr(settings, "payload_zstd_dict_dir", str(tmp_path / "empty"))
+    with pytest.raises(ValueError, match="not registered"):
+        decode_payload(old_blob)
+
+
+def test_compressed_bodies_are_transparent(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "payload_compression", "zlib")
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    IngestedPayloadRepository(session).record_many(
+        {"nfl:2025-09-07": PAYLOAD},
+        provider="odds_api",
+        entity_type="odds_api_batch",
+        fetched_at=datetime(2025, 9, 7, tzinfo=UTC),
+    )
+    session.commit()
+    session.expunge_all()
+
+    plain, packed = session.execute(
+        sa.select(PayloadBody.payload_json, sa.cast(PayloadBody.payload_compressed, sa.LargeBinary))
+    ).one()
+    assert plain is None
+    assert isinstance(packed, bytes) and packed[:1] == b"\x01"
+    assert len(packed) < len(str(PAYLOAD)) / 5
+    assert session.scalars(sa.select(IngestedPayload)).one().payload_json == PAYLOAD
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import odds_value.db.models  # noqa: F401
+from odds_value.db.base import Base
+from odds_value.db.enums import SportEnum
+from odds_value.db.models.core.league import League
+from odds_value.db.models.core.team import Team
+from odds_value.db.repos.core.team_repo import TeamRepository
+
+
+def _make_session() -> Session:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return Session(engine)
+
+
+def test_upsert_many_inserts_updates_and_keeps_stored_values_on_null() -> None:
+    session = _make_session()
+    nfl = League(league_key="NFL", name="National Football League", sport=SportEnum.FOOTBALL)
+    session.add(nfl)
+    session.flush()
+    repo = TeamRepository(session)
+
+    first = repo.upsert_many(
+        [
+            {"league_id": nfl.id, "provider_team_id": "1", "name": "Colts", "logo_url": "a"},
+            {"league_id": nfl.id, "provider_team_id": "2", "name": "Cards", "logo_url": "b"},
+        ],
+        constraint="uq_teams_league_provider_team_id",
+        returning=("id", "provider_team_id"),
+    )
+    ids = {r["provider_team_id"]: r["id"] for r in first}
+
+    second = repo.upsert_many(
+        [
+            {"league_id": nfl.id, "provider_team_id": "1", "name": "Old", "logo_url": None},
+            # Repeated key within one call: last row wins.
+            {"league_id": nfl.id, "provider_team_id": "1", "name": "Colts II", "logo_url": None},
+            {"league_id": nfl.id, "provider_team_id": "3", "name": "Bills", "logo_url": None},
+        ],
+        constraint="uq_teams_league_provider_team_id",
+        returning=("id", "provider_team_id"),
+    )
+    session.commit()
+
+    assert {r["provider_team_id"]: r["id"] for r in second}["1"] == ids["1"]
+    rows = {t.provider_team_id: t for t in session.query(Team).all()}
+    assert len(rows) == 3
+    assert rows["1"].name == "Colts II"
+    assert rows["1"].logo_url == "a"
+
+
+def test_upsert_many_rejects_unknown_constraint() -> None:
+    repo = TeamRepository(_make_session())
+    with pytest.raises(ValueError):
+        repo.upsert_many([{"league_id": 1}], constraint="uq_missing")
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+
+import odds_value.db.models  # noqa: F401
+from odds_value.db.base import Base
+from odds_value.ingestion.providers.api_sports.client import SharedApiSportsRateLimiter
+from odds_value.ingestion.providers.base.rate_limit import (
+    DatabaseRateLimitBackend,
+    RateLimitBackend,
+    SqliteRateLimitBackend,
+)
+
+HEADERS = {"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "50"}
+
+
+def _sqlite_backend(tmp_path: Path, clock: list[float]) -> RateLimitBackend:
+    return SqliteRateLimitBackend(path=tmp_path / "limits.sqlite", _time=lambda: clock[0])
+
+
+def _database_backend(tmp_path: Path, clock: list[float]) -> RateLimitBackend:
+    engine = sa.create_engine(f"sqlite+pysqlite:///{tmp_path / 'db.sqlite'}")
+    Base.metadata.create_all(engine)
+    return DatabaseRateLimitBackend(engine=engine, _time=lambda: clock[0])
+
+
+@pytest.mark.parametrize("make_backend", [_sqlite_backend, _database_backend])
+def test_shared_limiter_splits_one_budget_between_processes(
+    tmp_path: Path, make_backend: object
+) -> None:
+    clock = [1000.0]
+    backend = make_backend(tmp_path, clock)  # type: ignore[operator]
+
+    # Two limiters stand in for two processes sharing one API key.
+    a = SharedApiSportsRateLimiter(backend=backend, bucket_key="k", burst=2.0)
+    b = SharedApiSportsRateLimiter(backend=backend, bucket_key="k", burst=2.0)
+    for limiter in (a, b):
+        assert limiter.observe_headers(HEADERS) == 0.0
+
+    waits = [a.pacing_delay_s(), b.pacing_delay_s(), a.pacing_delay_s(), b.pacing_delay_s()]
+    assert waits == pytest.approx([0.0, 0.0, 1.0, 2.0])
+
+    # A low remaining count seen by one process blocks the other one too.
+    clock[0] += 10.0
+    a.observe_headers({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "1"})
+    assert b.pacing_delay_s() == pytest.approx(60.0)